@@ -9,9 +9,12 @@ class ManufacturerAdmin(admin.ModelAdmin):
     search_fields = ['name']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_aircraft_count()
+
+    @admin.display(description='Aircraft Count', ordering='aircraft_count')
     def aircraft_count(self, obj):
-        return obj.aircraft.count()
-    aircraft_count.short_description = 'Aircraft Count'
+        return obj.aircraft_count
 
 
 @admin.register(Aircraft)
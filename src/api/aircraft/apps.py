@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AircraftConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'aircraft'
+
+    def ready(self):
+        """Import signals when Django starts"""
+        import aircraft.signals
@@ -0,0 +1,142 @@
+"""
+Async versions of the hot aircraft read endpoints (API_ASYNC_VIEWS).
+
+Under ASGI a worker's event loop keeps serving other requests while one
+waits on a slow client or on the database, instead of tying up a whole
+sync worker. AircraftViewSet remains the reference implementation:
+
+- rendered responses are cached per data version together with their
+  ETag and Last-Modified, so a hit costs two cache reads, no catalogue
+  query and no rendering (the sync views cache response.data and render
+  it per request)
+- detail and compare misses are built with the async ORM, using the
+  viewset's own querysets, serializers and validators
+- everything else (list misses with their filtering and pagination,
+  malformed parameters, 404s, non-JSON negotiation) runs the sync viewset
+  in the request's worker thread; its successful responses are cached as
+  above
+
+Responses match the sync views byte for byte (aircraft.test_async_views).
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from mosaicplane.async_views import bind, fallback, json_media_type, render, render_exception
+from .cache import aget_data_version, aqueryset_validators, request_digest
+from .models import Aircraft
+from .serializers import AircraftDetailSerializer
+from .views import AircraftViewSet
+
+# The router's views for the same URLs, which also take the writes
+aircraft_list_view = AircraftViewSet.as_view(
+    {'get': 'list', 'post': 'create'}, basename='aircraft', detail=False
+)
+aircraft_detail_view = AircraftViewSet.as_view(
+    {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'},
+    basename='aircraft', detail=True
+)
+aircraft_compare_view = AircraftViewSet.as_view({'get': 'compare'}, basename='aircraft', detail=False)
+
+# Query parameters that don't change which aircraft a detail request returns
+DETAIL_PARAMETERS = {'fields', 'omit', 'format'}
+
+
+async def build_detail(view):
+    if set(view.request.query_params) - DETAIL_PARAMETERS:
+        # Filter parameters can turn a detail request into a 404
+        return None
+    try:
+        aircraft = await view.get_queryset().aget(pk=view.kwargs['pk'])
+    except Aircraft.DoesNotExist:
+        return None
+    return view.get_serializer(aircraft).data
+
+
+async def build_compare(view):
+    ids = [int(id.strip()) for id in view.request.query_params['ids'].split(',')]
+    aircraft = [plane async for plane in Aircraft.objects.for_detail_api().filter(id__in=ids)]
+    return AircraftDetailSerializer(aircraft, many=True).data
+
+
+def rendered_cache_key(request, media_type, version):
+    # HEAD ignores ?fields= / ?omit=, so it can't share GET's entry
+    digest = hashlib.sha256(f'{request.method}:{request_digest(request)}:{media_type}'.encode()).hexdigest()
+    return f'api-rendered:{version}:{digest}'
+
+
+async def serve(view_func, request, build=None, **kwargs):
+    """
+    Answer `request` for `view_func`: from the rendered-response cache,
+    else from `build(view)`, else from the sync view itself.
+    """
+    view = bind(view_func, request, **kwargs)
+    media_type = json_media_type(view)
+    if request.method not in ('GET', 'HEAD') or media_type is None:
+        return await fallback(view_func)(request, **kwargs)
+
+    key = rendered_cache_key(request, media_type, await aget_data_version())
+    entry = await cache.aget(key)
+    if entry is None:
+        response = await build_response(view_func, view, build)
+        if response.status_code != status.HTTP_200_OK or not response.has_header('ETag'):
+            return response
+        entry = response.content, dict(response.items())
+        await cache.aset(key, entry, settings.API_RESPONSE_CACHE_TIMEOUT)
+
+    content, headers = entry
+    last_modified = parse_http_date_safe(headers.get('Last-Modified', ''))
+    not_modified = get_conditional_response(request, etag=headers['ETag'], last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+    response = HttpResponse(content, headers=headers)
+    response.precompress = True
+    return response
+
+
+async def build_response(view_func, view, build):
+    """A rendered 200 with validators, a 304, or whatever the sync view returns"""
+    if build is not None:
+        try:
+            queryset, fields = view.get_validator_queryset(view.request)
+        except (TypeError, ValueError):
+            build = None
+    if build is not None:
+        etag, last_modified = await aqueryset_validators(view.request, queryset, fields)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(view.request._request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+        try:
+            data = await build(view)
+        except APIException as exc:
+            # e.g. unknown ?fields= names, which the sync view answers with a 400
+            return render_exception(view, exc)
+        if data is not None:
+            headers = {'ETag': etag}
+            if timestamp is not None:
+                headers['Last-Modified'] = http_date(timestamp)
+            return render(view, data, headers)
+
+    response = await fallback(view_func)(view.request._request, **view.kwargs)
+    if response.status_code == status.HTTP_200_OK and response.has_header('ETag'):
+        await fallback(response.render)()
+    return response
+
+
+async def aircraft_list(request):
+    return await serve(aircraft_list_view, request)
+
+
+async def aircraft_detail(request, pk):
+    return await serve(aircraft_detail_view, request, build_detail, pk=pk)
+
+
+async def aircraft_compare(request):
+    return await serve(aircraft_compare_view, request, build_compare)
@@ -0,0 +1,183 @@
+import functools
+import hashlib
+import uuid
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from . import replica
+
+# Global version identifying the current state of the aircraft catalogue.
+# Every response cache key embeds it, so replacing it invalidates all cached
+# responses at once without having to enumerate them.
+DATA_VERSION_KEY = 'aircraft:data-version'
+# When catalogue rows were last deleted. Deletions leave no updated_at behind,
+# so Last-Modified has to take them into account separately.
+DATA_DELETED_AT_KEY = 'aircraft:deleted-at'
+
+# Both live in the small, never culled 'versions' cache, not with the responses
+versions = caches['versions']
+
+
+def get_data_version():
+    """Return the current catalogue data version"""
+    version = versions.get(DATA_VERSION_KEY)
+    if version is None:
+        versions.add(DATA_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = versions.get(DATA_VERSION_KEY)
+    return version
+
+
+async def aget_data_version():
+    """get_data_version() for async views"""
+    version = await versions.aget(DATA_VERSION_KEY)
+    if version is None:
+        await versions.aadd(DATA_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = await versions.aget(DATA_VERSION_KEY)
+    return version
+
+
+def _replace_data_version():
+    # A single write of a value never used before, rather than a read-modify-write
+    # increment: concurrent bumps from several workers can't cancel each other out
+    versions.set(DATA_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def bump_data_version():
+    """
+    Invalidate every cached response.
+
+    The version is bumped immediately and again once the surrounding
+    transaction commits, so responses built from pre-commit data by other
+    connections in between are not reused either. A read replica snapshot,
+    if enabled, is rebuilt in the background after the commit and the
+    version bumped once more when it is swapped in.
+    """
+    _replace_data_version()
+    replica.refresh_on_commit(_replace_data_version)
+    transaction.on_commit(_replace_data_version)
+
+
+def record_deletion():
+    versions.set(DATA_DELETED_AT_KEY, timezone.now(), timeout=None)
+
+
+def request_digest(request):
+    """Digest of host + path + normalized query string (a Django or DRF request)"""
+    query = urlencode(sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+    ))
+    raw = f'{request.get_host()}{request.path}?{query}'
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def response_cache_key(request, version=None):
+    """Cache key for a GET request: data version + request digest"""
+    if version is None:
+        version = get_data_version()
+    return f'api-response:{version}:{request_digest(request)}'
+
+
+def cached_response(view_method):
+    """
+    Serve a read-only viewset action from the response cache, answering
+    If-None-Match / If-Modified-Since.
+
+    Successful responses are stored together with their validators, from
+    the viewset's `get_validators(request)`: (etag, last_modified), or None
+    when the request can't be validated (e.g. malformed parameters). A hit
+    therefore costs no catalogue query. On a miss the validators are
+    computed first, so a matching request gets a 304 before any
+    serialization happens.
+
+    The cached value is the serialized `response.data`, so content
+    negotiation and rendering still happen per request. Successful responses
+    are also marked `precompress` so mosaicplane.middleware caches their
+    compressed bodies too.
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = response_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            data, validators = entry
+            not_modified = conditional_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+            response = Response(data)
+        else:
+            validators = self.get_validators(request)
+            not_modified = conditional_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(key, (response.data, validators), settings.API_RESPONSE_CACHE_TIMEOUT)
+
+        response.precompress = True
+        if validators is not None:
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(int(last_modified.timestamp()))
+        return response
+    return wrapper
+
+
+def conditional_response(request, validators):
+    """The 304 answering `request` if its conditional headers match `validators`, else None"""
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+
+
+def queryset_validators(request, queryset, timestamp_fields):
+    """
+    Return (etag, last_modified) for a response built from `queryset`.
+
+    Last-Modified is the newest of MAX(field) over `timestamp_fields` (which
+    may span relations, e.g. `engines__updated_at`) and the last deletion.
+    The strong ETag also covers the data version, the normalized request and
+    the row count, so it changes whenever the serialized payload can.
+    """
+    aggregates = queryset.order_by().aggregate(**validator_aggregates(timestamp_fields))
+    return build_validators(response_cache_key(request), aggregates, versions.get(DATA_DELETED_AT_KEY))
+
+
+async def aqueryset_validators(request, queryset, timestamp_fields):
+    """queryset_validators() for async views"""
+    aggregates = await queryset.order_by().aaggregate(**validator_aggregates(timestamp_fields))
+    key = response_cache_key(request, await aget_data_version())
+    return build_validators(key, aggregates, await versions.aget(DATA_DELETED_AT_KEY))
+
+
+def validator_aggregates(timestamp_fields):
+    return {
+        'rows': Count('pk', distinct=True),
+        **{f'max_{i}': Max(field) for i, field in enumerate(timestamp_fields)}
+    }
+
+
+def build_validators(key, aggregates, deleted_at):
+    rows = aggregates.pop('rows')
+    timestamps = [value for value in aggregates.values() if value is not None]
+    if deleted_at is not None:
+        timestamps.append(deleted_at)
+    last_modified = max(timestamps) if timestamps else None
+
+    raw = f'{key}:{rows}:{last_modified.isoformat() if last_modified else ""}'
+    etag = '"%s"' % hashlib.sha256(raw.encode()).hexdigest()[:32]
+    return etag, last_modified
@@ -0,0 +1,147 @@
+"""
+Declarative aircraft datasets.
+
+Seed and reference data lives in YAML files under aircraft/data/ rather than
+in the management commands. Each file is a mapping with a `format` version;
+aircraft files listed by a manifest hold one YAML document per aircraft so
+they can be streamed and validated record by record.
+
+An aircraft record has `manufacturer` (a name), `model`, any editable
+Aircraft column (speeds in knots, weights in pounds, dates as YYYY-MM-DD)
+and either an inline `engine` mapping (`manufacturer`, `model` and Engine
+columns) or a list of `engines` referring to engines by "Manufacturer Model".
+"""
+import itertools
+from pathlib import Path
+
+import yaml
+from django.core.exceptions import ValidationError
+
+from .models import Aircraft, Engine
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+DATASET_FORMAT = 1
+
+# libyaml's parser is much faster when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Columns a dataset may set. Derived columns are computed by Aircraft.clean().
+AIRCRAFT_FIELDS = [
+    field.name for field in Aircraft._meta.concrete_fields
+    if field.editable and field.name not in ('id', 'manufacturer', 'model', 'image', *Aircraft.DERIVED_FIELDS)
+]
+REQUIRED_AIRCRAFT_FIELDS = ['clean_stall_speed', 'top_speed', 'maneuvering_speed']
+ENGINE_FIELDS = [
+    'horsepower', 'displacement_liters', 'thrust_pounds', 'fuel_type', 'engine_type', 'is_fuel_injected'
+]
+# Engine details recorded in the data files but not stored
+ENGINE_NOTE_FIELDS = ['aspiration', 'engine_count']
+
+
+class DatasetError(Exception):
+    """A dataset file is missing, malformed or contains an invalid record"""
+
+
+class AircraftRecord:
+    """One validated aircraft entry from a dataset file"""
+
+    def __init__(self, manufacturer, model, values, engine=None, engines=(), source=''):
+        self.manufacturer = manufacturer
+        self.model = model
+        self.values = values
+        self.engine = engine
+        self.engines = list(engines)
+        self.source = source
+
+    @property
+    def engine_key(self):
+        return (self.engine['manufacturer'], self.engine['model']) if self.engine else None
+
+
+def _open(path):
+    try:
+        return open(path, encoding='utf-8')
+    except OSError as e:
+        raise DatasetError(f'Cannot read dataset {path}: {e.strerror}')
+
+
+def load_document(path):
+    """Load a small single-document dataset file (a manifest or reference list)"""
+    with _open(path) as f:
+        try:
+            document = yaml.load(f, Loader=YamlLoader)
+        except yaml.YAMLError as e:
+            raise DatasetError(f'{path}: {e}')
+    if not isinstance(document, dict) or document.get('format') != DATASET_FORMAT:
+        raise DatasetError(f'{path}: expected a mapping with format: {DATASET_FORMAT}')
+    return document
+
+
+def clean_values(model, values, source):
+    """Convert raw YAML values to the Python types of the model's fields"""
+    cleaned = {}
+    for name, value in values.items():
+        try:
+            cleaned[name] = model._meta.get_field(name).to_python(value)
+        except ValidationError as e:
+            raise DatasetError(f'{source}: {name}: {"; ".join(e.messages)}')
+    return cleaned
+
+
+def clean_engine(data, source):
+    if not isinstance(data, dict) or not data.get('manufacturer') or not data.get('model'):
+        raise DatasetError(f'{source}: engine needs a manufacturer and a model')
+    unknown = set(data) - {'manufacturer', 'model', *ENGINE_FIELDS, *ENGINE_NOTE_FIELDS}
+    if unknown:
+        raise DatasetError(f'{source}: unknown engine field(s): {", ".join(sorted(unknown))}')
+    return clean_values(Engine, {
+        name: value for name, value in data.items() if name not in ENGINE_NOTE_FIELDS
+    }, source)
+
+
+def clean_aircraft(data, source):
+    """Validate a raw aircraft mapping and return an AircraftRecord"""
+    if not isinstance(data, dict):
+        raise DatasetError(f'{source}: expected a mapping, got {type(data).__name__}')
+    missing = [name for name in ['manufacturer', 'model', *REQUIRED_AIRCRAFT_FIELDS] if data.get(name) is None]
+    if missing:
+        raise DatasetError(f'{source}: missing field(s): {", ".join(missing)}')
+    unknown = set(data) - {'manufacturer', 'model', 'engine', 'engines', *AIRCRAFT_FIELDS}
+    if unknown:
+        raise DatasetError(f'{source}: unknown field(s): {", ".join(sorted(unknown))}')
+
+    values = clean_values(Aircraft, {
+        name: value for name, value in data.items() if name in AIRCRAFT_FIELDS
+    }, source)
+    engine = clean_engine(data['engine'], source) if 'engine' in data else None
+    return AircraftRecord(
+        manufacturer=str(data['manufacturer']),
+        model=str(data['model']),
+        values=values,
+        engine=engine,
+        engines=data.get('engines') or [],
+        source=source,
+    )
+
+
+def iter_aircraft(path):
+    """Stream validated AircraftRecords from a file of one YAML document per aircraft"""
+    with _open(path) as f:
+        documents = yaml.load_all(f, Loader=YamlLoader)
+        index = 0
+        while True:
+            index += 1
+            try:
+                document = next(documents)
+            except StopIteration:
+                return
+            except yaml.YAMLError as e:
+                raise DatasetError(f'{path}: {e}')
+            yield clean_aircraft(document, f'{path.name} record {index}')
+
+
+def chunked(iterable, size):
+    """Yield lists of up to `size` items without materializing `iterable`"""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
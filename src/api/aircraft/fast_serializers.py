@@ -0,0 +1,218 @@
+"""
+Read-only fast path for the hot aircraft list endpoints.
+
+ValuesSerializer renders the same data as a DRF ModelSerializer, but from
+QuerySet.values() rows instead of model instances, with the per-field
+decisions made once instead of per row:
+
+- plain columns are copied; decimals and datetimes are formatted the way
+  DRF formats them, with DRF's own to_representation() as the fallback for
+  anything unusual (other formats, unquantized decimals, naive datetimes)
+- file fields become URLs the way DRF's FileField builds them
+- a nested many-to-many serializer (engines) is loaded with one query on
+  the link table, a nested foreign key (the detail manufacturer) with one
+  query on the related table
+- SerializerMethodFields are called with the row as an attribute namespace
+
+Only the field types the aircraft serializers use are supported; anything
+else raises ImproperlyConfigured when the fast serializer is built. Output
+is pinned to the DRF serializers by aircraft.test_fast_serializers.
+"""
+from types import SimpleNamespace
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# DRF fields whose to_representation() returns values() data unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+    serializers.ReadOnlyField,
+)
+# DRF fields rendered with their own to_representation()
+CONVERTED_FIELDS = (
+    serializers.DateField,
+)
+
+COPY, CONVERT, NESTED, METHOD = range(4)
+
+
+class ValuesSerializer:
+    """
+    Render a ModelSerializer's output from .values() rows.
+
+    `serializer` is a bound DRF serializer (its context and any sparse field
+    selection already applied). Nested foreign keys are loaded from
+    `related_querysets[field name]` when given, e.g. to annotate counts that
+    a SerializerMethodField reads.
+    """
+
+    def __init__(self, serializer, related_querysets=None, prefix=''):
+        self.model = serializer.Meta.model
+        self.context = serializer.context
+        self.related_querysets = related_querysets or {}
+        # values_list() lookups and the attribute names they stand for, in row
+        # order; prefix is set for rows read through a link table
+        self.prefix = prefix
+        self.lookups = []
+        self.names = []
+        self.pk = self.column('pk')
+        self.fields = []
+        for name, field in serializer.fields.items():
+            self.fields.append((name, *self.plan_field(name, field)))
+
+    def column(self, path, lookup=None):
+        """Position of model field `path` in the rows fetched by rows()"""
+        lookup = lookup or f'{self.prefix}{path}'
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+            self.names.append(path)
+        return self.lookups.index(lookup)
+
+    def plan_field(self, name, field):
+        """(kind, row position, helper) describing how to render one field"""
+        if isinstance(field, serializers.SerializerMethodField):
+            return METHOD, None, getattr(field.parent, field.method_name)
+        if field.source == '*':
+            raise ImproperlyConfigured(f'{name}: source="*" has no fast path')
+
+        path = '__'.join(field.source_attrs)
+        model_field = self.model._meta.get_field(field.source_attrs[0])
+        if isinstance(field, serializers.ListSerializer) and model_field.many_to_many:
+            return NESTED, self.column('pk'), ManyToManyValues(model_field, field.child)
+        if isinstance(field, serializers.BaseSerializer) and model_field.many_to_one:
+            queryset = self.related_querysets.get(name, model_field.related_model._default_manager.all())
+            return NESTED, self.column(path), ForeignKeyValues(queryset, field)
+        if isinstance(field, serializers.FileField):
+            return CONVERT, self.column(path), self.file_url(model_field)
+        if isinstance(field, serializers.DecimalField):
+            return CONVERT, self.column(path), self.decimal_string(field)
+        if isinstance(field, serializers.DateTimeField):
+            return CONVERT, self.column(path), self.datetime_string(field)
+        if isinstance(field, CONVERTED_FIELDS):
+            return CONVERT, self.column(path), field.to_representation
+        if isinstance(field, PASSTHROUGH_FIELDS):
+            return COPY, self.column(path), None
+        raise ImproperlyConfigured(f'{name}: {type(field).__name__} has no fast path')
+
+    def file_url(self, model_field):
+        """FileField.to_representation() for a stored file name"""
+        request = self.context.get('request')
+
+        def convert(name):
+            if not name:
+                return None
+            url = model_field.attr_class(None, model_field, name).url
+            return request.build_absolute_uri(url) if request is not None else url
+        return convert
+
+    def decimal_string(self, field):
+        """DecimalField.to_representation() for values already stored at the field's precision"""
+        coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+        if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+            return field.to_representation
+        exponent = -field.decimal_places
+
+        def convert(value):
+            if value.as_tuple().exponent == exponent:
+                return format(value, 'f')
+            return field.to_representation(value)
+        return convert
+
+    def datetime_string(self, field):
+        """DateTimeField.to_representation() with the time zone looked up once"""
+        if getattr(field, 'format', api_settings.DATETIME_FORMAT) != ISO_8601:
+            return field.to_representation
+        field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if not timezone.is_aware(value):
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return convert
+
+    def rows(self, queryset):
+        """values_list() rows for `queryset`: self.lookups, then any annotations"""
+        annotations = list(queryset.query.annotations)
+        self.row_names = self.names + annotations
+        return list(queryset.prefetch_related(None).values_list(*self.lookups, *annotations))
+
+    def render(self, queryset):
+        """Serialized data for every object in `queryset`, in queryset order"""
+        return self.render_rows(self.rows(queryset))
+
+    def render_rows(self, rows):
+        nested = {
+            name: helper.load(rows, position)
+            for name, kind, position, helper in self.fields if kind == NESTED
+        }
+        has_methods = any(kind == METHOD for _, kind, _, _ in self.fields)
+        data = []
+        for row in rows:
+            # What a SerializerMethodField sees as the instance
+            instance = SimpleNamespace(**dict(zip(self.row_names, row))) if has_methods else None
+            item = {}
+            for name, kind, position, helper in self.fields:
+                if kind == COPY:
+                    item[name] = row[position]
+                elif kind == CONVERT:
+                    value = row[position]
+                    item[name] = helper(value) if value is not None else None
+                elif kind == NESTED:
+                    item[name] = nested[name].get(row[position])
+                else:
+                    item[name] = helper(instance)
+            data.append(item)
+        return data
+
+
+class ManyToManyValues:
+    """Nested many=True serializer over a many-to-many field, read through the link table"""
+
+    def __init__(self, model_field, serializer):
+        self.through = model_field.remote_field.through
+        self.owner = f'{model_field.m2m_field_name()}_id'
+        target = model_field.m2m_reverse_field_name()
+        # Same order a prefetch of the related model returns
+        self.ordering = [
+            f'-{target}__{name[1:]}' if name.startswith('-') else f'{target}__{name}'
+            for name in model_field.related_model._meta.ordering
+        ]
+        self.serializer = ValuesSerializer(serializer, prefix=f'{target}__')
+        self.owner_position = self.serializer.column(self.owner, self.owner)
+
+    def load(self, rows, position):
+        """{owner pk: [serialized related objects]} for the owners in `rows`"""
+        grouped = {row[position]: [] for row in rows}
+        links = self.through.objects.filter(**{f'{self.owner}__in': list(grouped)}).order_by(*self.ordering)
+        related = self.serializer.rows(links)
+        for link, item in zip(related, self.serializer.render_rows(related)):
+            grouped[link[self.owner_position]].append(item)
+        return grouped
+
+
+class ForeignKeyValues:
+    """Nested serializer over a foreign key, loaded in one query"""
+
+    def __init__(self, queryset, serializer):
+        self.queryset = queryset
+        self.serializer = ValuesSerializer(serializer)
+
+    def load(self, rows, position):
+        """{related pk: serialized related object} for the keys in `rows`"""
+        ids = {row[position] for row in rows if row[position] is not None}
+        related = self.serializer.rows(self.queryset.filter(pk__in=ids))
+        pk = self.serializer.pk
+        return {
+            row[pk]: item
+            for row, item in zip(related, self.serializer.render_rows(related))
+        }
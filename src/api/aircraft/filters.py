@@ -0,0 +1,129 @@
+from django.db.models import Case, IntegerField, Q, Value, When
+from django_filters import rest_framework as filters
+from rest_framework.filters import OrderingFilter, SearchFilter
+from . import search
+from .models import Aircraft, Engine
+
+
+class AircraftFilter(filters.FilterSet):
+    """
+    Filters for the aircraft list endpoint.
+
+    performance_category and speed_range are stored, indexed columns; badge
+    matches the indexed flags each eligibility badge is derived from, so
+    none of them need the badges computed per row. min_/max_ filters are
+    inclusive ranges in knots, pounds or horsepower.
+    """
+    # Badge -> condition it is derived from (see Aircraft.compute_eligibility_badges)
+    BADGE_CONDITIONS = {
+        'Sport Pilot': Q(sport_pilot_eligible=True),
+        'Private Pilot': Q(sport_pilot_eligible=False, is_mosaic_compliant=True),
+        'MOSAIC Eligible': Q(is_mosaic_compliant=True),
+        'Not MOSAIC Eligible': Q(is_mosaic_compliant=False),
+        'RG': Q(retractable_gear=True),
+        'VP': Q(variable_pitch_prop=True),
+    }
+
+    badge = filters.MultipleChoiceFilter(
+        choices=[(badge, badge) for badge in BADGE_CONDITIONS],
+        method='filter_badge',
+        label='Eligibility badge (repeat to require several)'
+    )
+
+    min_clean_stall_speed = filters.NumberFilter(field_name='clean_stall_speed', lookup_expr='gte')
+    max_clean_stall_speed = filters.NumberFilter(field_name='clean_stall_speed', lookup_expr='lte')
+    min_top_speed = filters.NumberFilter(field_name='top_speed', lookup_expr='gte')
+    max_top_speed = filters.NumberFilter(field_name='top_speed', lookup_expr='lte')
+    min_maneuvering_speed = filters.NumberFilter(field_name='maneuvering_speed', lookup_expr='gte')
+    max_maneuvering_speed = filters.NumberFilter(field_name='maneuvering_speed', lookup_expr='lte')
+    min_cruise_speed = filters.NumberFilter(field_name='cruise_speed', lookup_expr='gte')
+    max_cruise_speed = filters.NumberFilter(field_name='cruise_speed', lookup_expr='lte')
+    min_vx_speed = filters.NumberFilter(field_name='vx_speed', lookup_expr='gte')
+    max_vx_speed = filters.NumberFilter(field_name='vx_speed', lookup_expr='lte')
+    min_vy_speed = filters.NumberFilter(field_name='vy_speed', lookup_expr='gte')
+    max_vy_speed = filters.NumberFilter(field_name='vy_speed', lookup_expr='lte')
+    min_vs0_speed = filters.NumberFilter(field_name='vs0_speed', lookup_expr='gte')
+    max_vs0_speed = filters.NumberFilter(field_name='vs0_speed', lookup_expr='lte')
+    min_vg_speed = filters.NumberFilter(field_name='vg_speed', lookup_expr='gte')
+    max_vg_speed = filters.NumberFilter(field_name='vg_speed', lookup_expr='lte')
+    min_vfe_speed = filters.NumberFilter(field_name='vfe_speed', lookup_expr='gte')
+    max_vfe_speed = filters.NumberFilter(field_name='vfe_speed', lookup_expr='lte')
+    min_vno_speed = filters.NumberFilter(field_name='vno_speed', lookup_expr='gte')
+    max_vno_speed = filters.NumberFilter(field_name='vno_speed', lookup_expr='lte')
+    min_vne_speed = filters.NumberFilter(field_name='vne_speed', lookup_expr='gte')
+    max_vne_speed = filters.NumberFilter(field_name='vne_speed', lookup_expr='lte')
+    min_max_takeoff_weight = filters.NumberFilter(field_name='max_takeoff_weight', lookup_expr='gte')
+    max_max_takeoff_weight = filters.NumberFilter(field_name='max_takeoff_weight', lookup_expr='lte')
+
+    # Engine filters are applied together in filter_queryset() so they match
+    # one engine option, not any mix of an aircraft's engines
+    min_horsepower = filters.NumberFilter(field_name='horsepower', lookup_expr='gte', method='filter_engines')
+    max_horsepower = filters.NumberFilter(field_name='horsepower', lookup_expr='lte', method='filter_engines')
+    fuel_type = filters.ChoiceFilter(choices=Engine.FUEL_TYPE_CHOICES, method='filter_engines')
+    ENGINE_FILTERS = ['min_horsepower', 'max_horsepower', 'fuel_type']
+
+    class Meta:
+        model = Aircraft
+        fields = [
+            'manufacturer',
+            'is_mosaic_compliant',
+            'sport_pilot_eligible',
+            'seating_capacity',
+            'retractable_gear',
+            'variable_pitch_prop',
+            'certification_date',
+            'manufacturer__is_currently_manufacturing',
+            'performance_category',
+            'speed_range',
+        ]
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        engine_conditions = {
+            f'{self.filters[name].field_name}__{self.filters[name].lookup_expr}': value
+            for name, value in self.form.cleaned_data.items()
+            if name in self.ENGINE_FILTERS and value not in (None, '')
+        }
+        if engine_conditions:
+            # A subquery on the link table keeps one row per aircraft, unlike a join
+            links = Aircraft.engines.through.objects.filter(
+                engine__in=Engine.objects.filter(**engine_conditions)
+            )
+            queryset = queryset.filter(pk__in=links.values('aircraft_id'))
+        return queryset
+
+    def filter_engines(self, queryset, name, value):
+        # Applied in filter_queryset()
+        return queryset
+
+    def filter_badge(self, queryset, name, value):
+        for badge in value:
+            queryset = queryset.filter(self.BADGE_CONDITIONS[badge])
+        return queryset
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    ?search= backed by the full-text index in aircraft.search.
+
+    Results come back most relevant first unless ?ordering= is given (so this
+    backend must run after OrderingFilter). Falls back to SearchFilter's
+    LIKE matching when there is no index or it finds nothing, e.g. for a
+    fragment from the middle of a word.
+    """
+    rank_annotation = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        ids = search.search(query) if query.strip() else None
+        if not ids:
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = queryset.filter(pk__in=ids)
+        if OrderingFilter.ordering_param not in request.query_params:
+            # A plain annotation so keyset pagination can order and page by it
+            queryset = queryset.annotate(**{self.rank_annotation: Case(
+                *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+                output_field=IntegerField()
+            )}).order_by(self.rank_annotation, 'pk')
+        return queryset
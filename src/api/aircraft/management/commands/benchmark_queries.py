@@ -0,0 +1,129 @@
+import re
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+from aircraft.models import Aircraft
+from aircraft.views import AircraftViewSet
+
+# (name, query parameters, whether a full table scan counts as a regression).
+# Keep in step with the filters and orderings the UI actually sends.
+QUERY_SHAPES = [
+    ('default list', {}, False),
+    ('sport pilot, by stall speed', {'sport_pilot_eligible': 'true', 'ordering': 'clean_stall_speed'}, True),
+    ('MOSAIC compliant, stall <= 55', {'is_mosaic_compliant': 'true', 'max_clean_stall_speed': '55'}, True),
+    ('4 seats, fastest first', {'seating_capacity': '4', 'ordering': '-top_speed'}, True),
+    ('retractable gear, fastest first', {'retractable_gear': 'true', 'ordering': '-top_speed'}, True),
+    ('certified on date', {'certification_date': '1956-01-01'}, True),
+    ('cruise 100-130 kt', {'min_cruise_speed': '100', 'max_cruise_speed': '130'}, True),
+    ('touring speed range', {'speed_range': 'Touring'}, True),
+]
+
+# SQLite: "SCAN aircraft" without an index; PostgreSQL: "Seq Scan on aircraft"
+FULL_SCAN = re.compile(r'\bSCAN aircraft\b(?! USING)|\bSeq Scan on aircraft\b')
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN and time the common aircraft list queries, optionally without the Aircraft.Meta indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timed runs per query (default: 20)'
+        )
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help='Also run every query with the Aircraft.Meta indexes dropped (rolled back afterwards)'
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if a query that should use an index scans the whole aircraft table'
+        )
+        parser.add_argument(
+            '--plans',
+            action='store_true',
+            help='Print the full query plans'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{Aircraft.objects.count()} aircraft, {connection.vendor}, '
+            f'median of {options["repeat"]} runs\n'
+        )
+        results = self.run_shapes(options['repeat'], 'with indexes')
+        if options['compare']:
+            baseline = self.run_without_indexes(options['repeat'])
+        else:
+            baseline = None
+
+        regressions = []
+        for name, params, needs_index in QUERY_SHAPES:
+            rows, elapsed, plan = results[name]
+            full_scan = bool(FULL_SCAN.search(plan))
+            line = f'{name:<34} {rows:>5} rows {elapsed:>8.2f} ms'
+            if baseline:
+                line += f'  (without indexes {baseline[name][1]:.2f} ms)'
+            line += '  FULL SCAN' if full_scan else '  index'
+            self.stdout.write(self.style.WARNING(line) if full_scan and needs_index else line)
+            if options['plans']:
+                self.stdout.write('    ' + plan.replace('\n', '\n    '))
+                if baseline:
+                    self.stdout.write('    without indexes:')
+                    self.stdout.write('    ' + baseline[name][2].replace('\n', '\n    '))
+            if full_scan and needs_index:
+                regressions.append(name)
+
+        if regressions and options['check']:
+            raise CommandError(f'Full table scan for: {", ".join(regressions)}')
+
+    def queryset_for(self, params):
+        """The queryset AircraftViewSet.list() would run for `params`"""
+        view = AircraftViewSet(action_map={'get': 'list'}, kwargs={}, format_kwarg=None)
+        view.request = view.initialize_request(RequestFactory().get('/v1/aircraft/', params))
+        return view.filter_queryset(view.get_queryset())
+
+    def explain(self, sql, params):
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # Tiny tables are cheaper to scan; ask what the planner does
+                # when it has to choose between indexes
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+            return '\n'.join(' '.join(str(column) for column in row) for row in cursor.fetchall())
+
+    def run_shapes(self, repeat, label):
+        """Return {name: (rows, median ms, plan)} for the main SELECT of every shape"""
+        results = {}
+        for name, params, _ in QUERY_SHAPES:
+            sql, sql_params = self.queryset_for(params).query.sql_with_params()
+            # The label keeps SQLite from reusing statements (and their plans)
+            # prepared before the indexes were dropped
+            sql = f'{sql} /* {label} */'
+            timings = []
+            with connection.cursor() as cursor:
+                # Untimed run so the first shape doesn't pay for a cold cache
+                cursor.execute(sql, sql_params)
+                cursor.fetchall()
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    cursor.execute(sql, sql_params)
+                    rows = len(cursor.fetchall())
+                    timings.append((time.perf_counter() - start) * 1000)
+            results[name] = (rows, statistics.median(timings), self.explain(sql, sql_params))
+        return results
+
+    def run_without_indexes(self, repeat):
+        """run_shapes() with the Meta indexes dropped inside a transaction that is rolled back"""
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for index in Aircraft._meta.indexes:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+            results = self.run_shapes(repeat, 'without indexes')
+            transaction.set_rollback(True)
+        return results
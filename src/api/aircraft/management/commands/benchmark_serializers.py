@@ -0,0 +1,61 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from aircraft.fast_serializers import ValuesSerializer
+from aircraft.models import Aircraft, Manufacturer
+from aircraft.serializers import AircraftDetailSerializer, AircraftListSerializer, AircraftSerializer
+
+
+class Command(BaseCommand):
+    help = 'Time DRF serialization against the values() fast path for the aircraft list payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timed runs per payload (default: 20)'
+        )
+
+    def payloads(self):
+        """(name, serializer class, queryset, serializer kwargs, related querysets)"""
+        request = Request(APIRequestFactory().get('/v1/aircraft/'))
+        return [
+            ('aircraft list', AircraftSerializer, Aircraft.objects.for_api(), {'context': {'request': request}}, None),
+            ('compact list', AircraftListSerializer, Aircraft.objects.for_api(), {'context': {'request': request}}, None),
+            ('compare (detail)', AircraftDetailSerializer, Aircraft.objects.for_detail_api(), {},
+             {'manufacturer': Manufacturer.objects.with_aircraft_count()}),
+        ]
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        renderer = JSONRenderer()
+        self.stdout.write(f'{Aircraft.objects.count()} aircraft, median of {repeat} runs (query + serialize + render)\n')
+
+        for name, serializer_class, queryset, kwargs, related in self.payloads():
+            def drf():
+                return renderer.render(serializer_class(queryset.all(), many=True, **kwargs).data)
+
+            def fast():
+                return renderer.render(ValuesSerializer(serializer_class(**kwargs), related).render(queryset.all()))
+
+            if drf() != fast():
+                raise CommandError(f'{name}: fast path output differs from {serializer_class.__name__}')
+            drf_ms = self.median_ms(drf, repeat)
+            fast_ms = self.median_ms(fast, repeat)
+            self.stdout.write(
+                f'{name:<18} DRF {drf_ms:>8.2f} ms   fast {fast_ms:>8.2f} ms   '
+                f'{drf_ms / fast_ms if fast_ms else 0:.1f}x faster'
+            )
+
+    def median_ms(self, function, repeat):
+        timings = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
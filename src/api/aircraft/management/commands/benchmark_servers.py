@@ -0,0 +1,233 @@
+import asyncio
+import contextlib
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from aircraft.models import Aircraft
+
+# Servers are started with the checked-in gunicorn.conf.py, one per GUNICORN_WORKER_CLASS
+GUNICORN_CONFIG = settings.BASE_DIR / 'gunicorn.conf.py'
+SERVERS = ['sync', 'gthread', 'uvicorn']
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test gunicorn.conf.py with each worker class (sync, gthread, uvicorn) on the hot read '
+        'endpoints while slow clients trickle their requests in'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--servers',
+            nargs='+',
+            choices=SERVERS,
+            default=SERVERS,
+            help='Worker classes to benchmark (default: all)'
+        )
+        parser.add_argument(
+            '--no-preload',
+            action='store_true',
+            help='Start the servers with GUNICORN_PRELOAD=False'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=2,
+            help='gunicorn worker processes (default: 2)'
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10,
+            help='Seconds of load per server (default: 10)'
+        )
+        parser.add_argument(
+            '--clients',
+            type=int,
+            default=20,
+            help='Concurrent fast clients (default: 20)'
+        )
+        parser.add_argument(
+            '--slow-clients',
+            type=int,
+            default=20,
+            help='Concurrent slow clients (default: 20; 0 for none)'
+        )
+        parser.add_argument(
+            '--trickle',
+            type=float,
+            default=2,
+            help='Seconds a slow client takes to send each request (default: 2)'
+        )
+        parser.add_argument(
+            '--host',
+            default='localhost',
+            help='Host header to send; must be in ALLOWED_HOSTS (default: localhost)'
+        )
+
+    def handle(self, *args, **options):
+        ids = list(Aircraft.objects.order_by('pk').values_list('pk', flat=True)[:20])
+        if not ids:
+            raise CommandError('No aircraft loaded; run `manage.py seed` first')
+        paths = [f'/v1/aircraft/{pk}/' for pk in ids] + [
+            f'/v1/aircraft/compare/?ids={ids[0]},{ids[-1]}',
+            '/v1/aircraft/?compact=true',
+            '/v1/feature-flags/',
+        ]
+
+        self.stdout.write(
+            f'{options["workers"]} workers, {options["clients"]} fast clients, '
+            f'{options["slow_clients"]} slow clients ({options["trickle"]:g}s per request), '
+            f'{options["duration"]:g}s per server, preload {"off" if options["no_preload"] else "on"}\n'
+        )
+        self.stdout.write(
+            f'{"server":<8} {"req/s":>8} {"p50 ms":>8} {"p99 ms":>8} {"errors":>7} {"slow req":>9} {"PSS MB":>7}'
+        )
+        for name in options['servers']:
+            with self.server(name, options['workers'], not options['no_preload']) as (process, port):
+                fast, errors, slow = asyncio.run(LoadClient(port, options['host']).run(paths, options))
+                memory = proportional_memory(process.pid)
+            latencies = sorted(fast)
+            p50 = statistics.median(latencies) if latencies else 0
+            p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0
+            self.stdout.write(
+                f'{name:<8} {len(fast) / options["duration"]:>8.1f} {p50:>8.1f} {p99:>8.1f} {errors:>7} {slow:>9} '
+                + (f'{memory / 1024:>7.1f}' if memory is not None else f'{"-":>7}')
+            )
+
+    @contextlib.contextmanager
+    def server(self, worker_class, workers, preload):
+        """Run gunicorn.conf.py with `worker_class` on a free port until the block exits"""
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            port = probe.getsockname()[1]
+        process = subprocess.Popen(
+            [
+                sys.executable, '-m', 'gunicorn', '--config', str(GUNICORN_CONFIG),
+                '--bind', f'127.0.0.1:{port}', '--workers', str(workers),
+            ],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'GUNICORN_WORKER_CLASS': worker_class, 'GUNICORN_PRELOAD': str(preload)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while asyncio.run(LoadClient(port).ready()) is False:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise CommandError(f'{worker_class} server did not start (is gunicorn installed?)')
+                time.sleep(0.2)
+            yield process, port
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def proportional_memory(pid):
+    """
+    Proportional set size (KiB) of process `pid` and its children, or None
+    where /proc doesn't report it. Pages shared copy-on-write between the
+    master and its workers are split between them rather than counted
+    once per process, so this is what preloading saves.
+    """
+    total = 0
+    pending = [pid]
+    try:
+        while pending:
+            current = pending.pop()
+            with open(f'/proc/{current}/smaps_rollup') as rollup:
+                total += next(int(line.split()[1]) for line in rollup if line.startswith('Pss:'))
+            with open(f'/proc/{current}/task/{current}/children') as children:
+                pending.extend(int(child) for child in children.read().split())
+    except (OSError, StopIteration):
+        return None
+    return total
+
+
+class LoadClient:
+    """Minimal HTTP/1.1 client: one connection per request, timings in milliseconds"""
+
+    def __init__(self, port, host='localhost'):
+        self.port = port
+        self.host = host
+
+    def request(self, path):
+        return (
+            f'GET {path} HTTP/1.1\r\n'
+            f'Host: {self.host}\r\n'
+            # Settings redirect plain-HTTP requests when DEBUG is off
+            'X-Forwarded-Proto: https\r\n'
+            'Accept-Encoding: gzip\r\n'
+            'Connection: close\r\n\r\n'
+        ).encode()
+
+    async def get(self, path, trickle=0):
+        """Return the response status, sending the request over `trickle` seconds"""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        try:
+            request = self.request(path)
+            if trickle:
+                chunks = [request[i:i + 8] for i in range(0, len(request), 8)]
+                for chunk in chunks:
+                    writer.write(chunk)
+                    await writer.drain()
+                    await asyncio.sleep(trickle / len(chunks))
+            else:
+                writer.write(request)
+                await writer.drain()
+            status_line = await reader.readline()
+            await reader.read()
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
+
+    async def ready(self):
+        try:
+            return await asyncio.wait_for(self.get('/healthz'), 5) == 200
+        except (OSError, IndexError, ValueError, asyncio.TimeoutError):
+            return False
+
+    async def run(self, paths, options):
+        """Return (fast request latencies, fast request errors, slow requests completed)"""
+        deadline = time.monotonic() + options['duration']
+        latencies = []
+        errors = 0
+        slow = 0
+
+        async def fast_client(offset):
+            nonlocal errors
+            i = offset
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    status = await asyncio.wait_for(self.get(paths[i % len(paths)]), 30)
+                except (OSError, IndexError, ValueError, asyncio.TimeoutError):
+                    status = None
+                if status == 200:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+                i += 1
+
+        async def slow_client(offset):
+            nonlocal slow
+            i = offset
+            while time.monotonic() < deadline:
+                try:
+                    await asyncio.wait_for(self.get(paths[i % len(paths)], options['trickle']), 60)
+                    slow += 1
+                except (OSError, IndexError, ValueError, asyncio.TimeoutError):
+                    pass
+                i += 1
+
+        await asyncio.gather(
+            *(slow_client(i) for i in range(options['slow_clients'])),
+            *(fast_client(i) for i in range(options['clients'])),
+        )
+        return latencies, errors, slow
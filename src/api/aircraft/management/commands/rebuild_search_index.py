@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from aircraft import search
+
+
+class Command(BaseCommand):
+    help = 'Create and refill the aircraft full-text search index'
+
+    def handle(self, *args, **options):
+        if search.get_backend() is None:
+            self.stdout.write(self.style.WARNING(
+                'This database has no full-text search support; ?search= uses substring matching'
+            ))
+            return
+        count = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt: {count} aircraft'))
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from aircraft.cache import bump_data_version
+from aircraft.models import Aircraft
+
+
+class Command(BaseCommand):
+    help = 'Recompute the derived aircraft columns (eligibility flags, badges, performance category, speed range)'
+
+    # Columns Aircraft.clean() reads
+    SOURCE_FIELDS = [
+        'clean_stall_speed',
+        'top_speed',
+        'certification_date',
+        'retractable_gear',
+        'variable_pitch_prop',
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of aircraft read and written per query (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Backfill rows written before the derived columns existed, or by raw
+        QuerySet.update() calls that bypassed Aircraft.save()
+        """
+        batch_size = options['batch_size']
+        now = timezone.now()
+        stale = []
+        aircraft_list = Aircraft.objects.only(*self.SOURCE_FIELDS, *Aircraft.DERIVED_FIELDS)
+        for aircraft in aircraft_list.iterator(chunk_size=batch_size):
+            if aircraft.derived_fields_changed():
+                aircraft.updated_at = now
+                stale.append(aircraft)
+
+        if stale:
+            with transaction.atomic():
+                Aircraft.objects.bulk_update(
+                    stale, [*Aircraft.DERIVED_FIELDS, 'updated_at'], batch_size=batch_size
+                )
+                # bulk_update() sends no signals
+                bump_data_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Derived fields refreshed: {len(stale)} aircraft updated')
+        )
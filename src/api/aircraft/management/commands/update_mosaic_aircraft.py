@@ -1,50 +1,44 @@
-from django.core.management.base import BaseCommand
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from aircraft import search
+from aircraft.cache import bump_data_version
+from aircraft.datasets import DATA_DIR, DatasetError, clean_aircraft, clean_engine, load_document
 from aircraft.models import Manufacturer, Aircraft, Engine
-from datetime import date
+from aircraft.sync import sync_aircraft_engines, sync_rows, with_derived_fields
 
 
 class Command(BaseCommand):
     help = 'Update aircraft database with accurate MOSAIC-compliant aircraft based on July 2025 final rule'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dataset',
+            type=Path,
+            default=DATA_DIR / 'mosaic_aircraft.yaml',
+            help='MOSAIC aircraft dataset (default: aircraft/data/mosaic_aircraft.yaml)'
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Updating aircraft database with accurate MOSAIC data...'))
 
-        # Clear existing aircraft and engines to start fresh with accurate data
-        Aircraft.objects.all().delete()
-        Engine.objects.all().delete()
-        self.stdout.write('  Cleared existing aircraft and engine data')
-
-        # Create/update manufacturers
-        manufacturers_data = [
-            # Major manufacturers now eligible under MOSAIC
-            {'name': 'Cessna', 'is_currently_manufacturing': True},
-            {'name': 'Piper', 'is_currently_manufacturing': True},
-            {'name': 'American Champion Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Citabria', 'is_currently_manufacturing': False},  # Legacy brand
-            {'name': 'Taylorcraft', 'is_currently_manufacturing': True},
-            {'name': 'Aeronca', 'is_currently_manufacturing': False},  # Legacy
-            
-            # Current LSA manufacturers
-            {'name': 'Tecnam', 'is_currently_manufacturing': True},
-            {'name': 'Flight Design', 'is_currently_manufacturing': True},
-            {'name': 'Czech Sport Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Icon Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Pipistrel', 'is_currently_manufacturing': True},
-            {'name': 'Progressive Aerodyne', 'is_currently_manufacturing': True},
-            {'name': 'Remos', 'is_currently_manufacturing': True},
-            {'name': 'Evektor', 'is_currently_manufacturing': True},
-            
-            # Additional manufacturers
-            {'name': 'Aviat Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Maule Air', 'is_currently_manufacturing': True},
-            {'name': 'Diamond Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Quicksilver Aircraft', 'is_currently_manufacturing': True},
-            {'name': 'Beechcraft', 'is_currently_manufacturing': True},
-            {'name': 'Cirrus', 'is_currently_manufacturing': True},
-        ]
-
+        try:
+            dataset = load_document(options['dataset'])
+            # Only the differences are written, in one transaction, so the API
+            # never sees a half-synced catalogue and unchanged rows keep their ids
+            with transaction.atomic():
+                self.sync(dataset, options['dataset'].name)
+                # Bulk writes send no signals
+                bump_data_version()
+                search.rebuild_index()
+        except DatasetError as e:
+            raise CommandError(str(e))
+
+    def sync(self, dataset, source):
+        """Bring manufacturers, engines, aircraft and engine links in line with the dataset"""
         manufacturers = {}
-        for mfg_data in manufacturers_data:
+        for mfg_data in dataset.get('manufacturers') or []:
             mfg, created = Manufacturer.objects.get_or_create(
                 name=mfg_data['name'],
                 defaults={'is_currently_manufacturing': mfg_data['is_currently_manufacturing']}
@@ -53,491 +47,51 @@ class Command(BaseCommand):
             if created:
                 self.stdout.write(f'  Created manufacturer: {mfg.name}')
 
-        # Create common engines used in GA/LSA aircraft
-        engines_data = [
-            # Continental engines
-            {'manufacturer': 'Continental', 'model': 'A-65', 'horsepower': 65, 'displacement_liters': 4.3, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': False},
-            {'manufacturer': 'Continental', 'model': 'O-200-A', 'horsepower': 100, 'displacement_liters': 3.3, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': False},
-            {'manufacturer': 'Continental', 'model': 'IO-240-B', 'horsepower': 125, 'displacement_liters': 3.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Continental', 'model': 'IO-360-ES', 'horsepower': 180, 'displacement_liters': 5.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Continental', 'model': 'IO-470-L', 'horsepower': 230, 'displacement_liters': 7.7, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Continental', 'model': 'IO-540-E4C5', 'horsepower': 300, 'displacement_liters': 8.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Continental', 'model': 'IO-550-N', 'horsepower': 310, 'displacement_liters': 9.0, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            
-            # Lycoming engines
-            {'manufacturer': 'Lycoming', 'model': 'O-235-L2C', 'horsepower': 115, 'displacement_liters': 3.8, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': False},
-            {'manufacturer': 'Lycoming', 'model': 'O-320-E2A', 'horsepower': 150, 'displacement_liters': 5.2, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': False},
-            {'manufacturer': 'Lycoming', 'model': 'O-360-A4A', 'horsepower': 180, 'displacement_liters': 5.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': False},
-            {'manufacturer': 'Lycoming', 'model': 'IO-360-B1E', 'horsepower': 180, 'displacement_liters': 5.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Lycoming', 'model': 'IO-360-L2A', 'horsepower': 180, 'displacement_liters': 5.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Lycoming', 'model': 'IO-540-AB1A5', 'horsepower': 230, 'displacement_liters': 8.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Lycoming', 'model': 'IO-540-K1G5', 'horsepower': 300, 'displacement_liters': 8.9, 'fuel_type': 'AVGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            
-            # Rotax engines (common in LSA)
-            {'manufacturer': 'Rotax', 'model': '912ULS', 'horsepower': 100, 'displacement_liters': 1.35, 'fuel_type': 'MOGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Rotax', 'model': '912iS', 'horsepower': 100, 'displacement_liters': 1.35, 'fuel_type': 'MOGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-            {'manufacturer': 'Rotax', 'model': '914UL', 'horsepower': 115, 'displacement_liters': 1.35, 'fuel_type': 'MOGAS', 'engine_type': 'PISTON', 'is_fuel_injected': True},
-        ]
-
-        engines = {}
-        for engine_data in engines_data:
-            engine, created = Engine.objects.get_or_create(
-                manufacturer=engine_data['manufacturer'],
-                model=engine_data['model'],
-                defaults={
-                    'horsepower': engine_data['horsepower'],
-                    'displacement_liters': engine_data['displacement_liters'],
-                    'fuel_type': engine_data['fuel_type'],
-                    'engine_type': engine_data['engine_type'],
-                    'is_fuel_injected': engine_data['is_fuel_injected']
-                }
-            )
-            engines[f"{engine_data['manufacturer']} {engine_data['model']}"] = engine
-            if created:
-                self.stdout.write(f'  Created engine: {engine}')
-
-        # Aircraft now eligible for sport pilots under MOSAIC (≤59 knots stall speed)
-        sport_pilot_aircraft = [
-            # Cessna 172 - The big addition under MOSAIC
-            {
-                'manufacturer': 'Cessna',
-                'model': '172 (early models)',
-                'clean_stall_speed': 47.0,  # Cessna 172A-M models
-                'top_speed': 124.0,
-                'maneuvering_speed': 99.0,
-                'max_takeoff_weight': 2300,  # Early models
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1956, 6, 12),  # C-172 TC 3A12 issued
-                'verification_source': 'Cessna 172A POH (1958), FAA Type Certificate 3A12, various early model specifications. Early 172s (A through M models) have documented Vs1 of 47 KCAS.',
-                'engines': ['Continental O-200-A']
-            },
-            
-            # Other newly eligible legacy aircraft
-            {
-                'manufacturer': 'Cessna',
-                'model': '150',
-                'clean_stall_speed': 48.0,  # Verified across multiple sources
-                'top_speed': 109.0,
-                'maneuvering_speed': 100.0,
-                'max_takeoff_weight': 1600,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1958, 9, 12),
-                'verification_source': 'Cessna 150 POH (various years), FAA Type Certificate 3A19, widely documented trainer aircraft specifications. Consistent 48 KCAS stall speed across all variants.',
-                'engines': ['Continental O-200-A']
-            },
-            {
-                'manufacturer': 'Cessna',
-                'model': '152',
-                'clean_stall_speed': 48.0,  # Same as 150, verified
-                'top_speed': 110.0,
-                'maneuvering_speed': 104.0,
-                'max_takeoff_weight': 1670,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1977, 1, 24),
-                'verification_source': 'Cessna 152 POH (1978-1985), FAA Type Certificate 3A19 (amended), flight training references. Lycoming O-235-L2C engine variant of 150.',
-                'engines': ['Lycoming O-235-L2C']
-            },
-            {
-                'manufacturer': 'Piper',
-                'model': 'J-3 Cub',
-                'clean_stall_speed': 38.0,  # Well documented classic
-                'top_speed': 87.0,
-                'maneuvering_speed': 70.0,
-                'max_takeoff_weight': 1220,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1940, 6, 17),
-                'verification_source': 'Piper J-3 Cub POH, CAA/FAA historical documents, widely documented tailwheel trainer. Continental A-65 engine, 38 KCAS stall speed standard across variants.',
-                'engines': ['Continental A-65']
-            },
-            {
-                'manufacturer': 'Piper',
-                'model': 'Cherokee 140',
-                'clean_stall_speed': 57.0,  # Corrected - Cherokee 140 is typically 57-58 KCAS
-                'top_speed': 139.0,
-                'maneuvering_speed': 113.0,
-                'max_takeoff_weight': 2150,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1961, 12, 22),
-                'verification_source': 'Piper Cherokee 140 POH (1964-1977), FAA Type Certificate 3A12. Lycoming O-320-E2A engine. Some early sources show 57 KCAS, later models 58 KCAS.',
-                'engines': ['Lycoming O-320-E2A']
-            },
-            {
-                'manufacturer': 'American Champion Aircraft',
-                'model': 'Citabria 7ECA',
-                'clean_stall_speed': 50.0,
-                'top_speed': 115.0,
-                'maneuvering_speed': 115.0,
-                'max_takeoff_weight': 1650,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1964, 8, 10),  # Citabria certified 1964
-                'verification_source': 'Citabria 7ECA POH, American Champion Aircraft specifications. Lycoming O-235-L2C engine, aerobatic-rated aircraft with 50 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Taylorcraft',
-                'model': 'BC-12D',
-                'clean_stall_speed': 38.0,
-                'top_speed': 105.0,
-                'maneuvering_speed': 87.0,
-                'max_takeoff_weight': 1200,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1946, 3, 15),  # Post-war Taylorcraft 1946
-                'verification_source': 'Taylorcraft BC-12D POH (1946), Continental A-65 engine specifications, post-war production aircraft documentation.'
-            },
-            
-            # Current LSA that remain eligible
-            {
-                'manufacturer': 'Tecnam',
-                'model': 'P2008-JC',
-                'clean_stall_speed': 35.0,
-                'top_speed': 118.0,
-                'maneuvering_speed': 97.0,
-                'max_takeoff_weight': 1320,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2007, 4, 12),  # LSA certified 2007
-                'verification_source': 'Tecnam P2008-JC POH, FAA LSA certification documents. Rotax 912ULS engine, modern LSA with 35 KCAS stall speed.',
-                'engines': ['Rotax 912ULS']
-            },
-            {
-                'manufacturer': 'Flight Design',
-                'model': 'CTLS',
-                'clean_stall_speed': 39.0,
-                'top_speed': 120.0,
-                'maneuvering_speed': 97.0,
-                'max_takeoff_weight': 1320,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2006, 11, 8),  # LSA certified 2006
-                'verification_source': 'Flight Design CTLS POH, FAA LSA certification. Rotax 912ULS engine, German-manufactured LSA with 39 KCAS stall speed.',
-                'engines': ['Rotax 912ULS']
-            },
-            {
-                'manufacturer': 'Czech Sport Aircraft',
-                'model': 'SportCruiser',
-                'clean_stall_speed': 39.0,
-                'top_speed': 120.0,
-                'maneuvering_speed': 100.0,
-                'max_takeoff_weight': 1320,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2004, 7, 29),  # Early LSA
-                'verification_source': 'SportCruiser POH, Czech Sport Aircraft specifications. Rotax 912ULS engine, early LSA certification with 39 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Icon Aircraft',
-                'model': 'A5',
-                'clean_stall_speed': 45.0,
-                'top_speed': 109.0,
-                'maneuvering_speed': 87.0,
-                'max_takeoff_weight': 1510,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2014, 7, 23),  # Special LSA certified 2014
-                'verification_source': 'Icon A5 POH, FAA Special LSA certification. Rotax 912iS engine, amphibian LSA with 45 KCAS stall speed and spin-resistant design.',
-                'engines': ['Rotax 912iS']
-            },
-            {
-                'manufacturer': 'Pipistrel',
-                'model': 'Virus SW 121',
-                'clean_stall_speed': 37.0,
-                'top_speed': 135.0,
-                'maneuvering_speed': 108.0,
-                'max_takeoff_weight': 1320,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2010, 3, 16),  # LSA certified 2010
-                'verification_source': 'Pipistrel Virus SW 121 POH, Slovenian manufacturer specifications. Rotax 912ULS engine, efficient LSA with 37 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Progressive Aerodyne',
-                'model': 'SeaRey',
-                'clean_stall_speed': 39.0,
-                'top_speed': 115.0,
-                'maneuvering_speed': 92.0,
-                'max_takeoff_weight': 1430,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(2005, 9, 14),  # LSA amphibian certified 2005
-                'verification_source': 'Progressive Aerodyne SeaRey POH, FAA LSA amphibian certification. Rotax 912ULS engine, amphibious LSA with 39 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Cessna',
-                'model': '182 Skylane (early models)',
-                'clean_stall_speed': 56.0,  # Early 182A-D models, verified
-                'top_speed': 145.0,
-                'maneuvering_speed': 140.0,
-                'max_takeoff_weight': 2800,  # Early models were lighter
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1956, 3, 4),
-                'verification_source': 'Cessna 182A POH (1958), FAA Type Certificate 3A10. Early 182A-D models with O-470-L engine had Vs1 of 56 KCAS. Later models increased to 61+ KCAS due to weight increases.'
-            },
-        ]
-
-        # Aircraft eligible for MOSAIC LSA certification but requiring private pilot (59-61 knots)
-        mosaic_lsa_only = [
-            {
-                'manufacturer': 'Diamond Aircraft',
-                'model': 'DA20-C1',
-                'clean_stall_speed': 61.0,  # Right at MOSAIC LSA limit
-                'top_speed': 147.0,
-                'maneuvering_speed': 111.0,
-                'max_takeoff_weight': 1764,
-                'seating_capacity': 2,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1994, 8, 5),  # DA20 certified 1994
-                'verification_source': 'Diamond DA20-C1 POH, FAA Type Certificate A00001AT. Continental IO-240-B engine, 61 KCAS stall speed at MOSAIC LSA limit.'
-            },
-        ]
-
-        # Popular GA aircraft that are NOT sport pilot eligible (>61 knots stall speed)
-        non_eligible_aircraft = [
-            # Cessna singles
-            {
-                'manufacturer': 'Cessna',
-                'model': '172S (newer models)',
-                'clean_stall_speed': 63.0,  # Higher than MOSAIC limit
-                'top_speed': 126.0,
-                'maneuvering_speed': 99.0,
-                'max_takeoff_weight': 2550,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1996, 7, 15),  # 172S variant
-                'verification_source': 'Cessna 172S POH, FAA Type Certificate 3A12 (amended). Lycoming IO-360-L2A engine, newer 172 variant with 63 KCAS stall speed exceeding MOSAIC limits.'
-            },
-            {
-                'manufacturer': 'Cessna',
-                'model': '182T Skylane (newer models)',
-                'clean_stall_speed': 65.0,  # Newer 182s with higher stall speeds
-                'top_speed': 145.0,
-                'maneuvering_speed': 140.0,
-                'max_takeoff_weight': 3110,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1996, 8, 15),  # 182T variant
-                'verification_source': 'Cessna 182T POH, FAA Type Certificate 3A10 (amended). Lycoming IO-540-AB1A5 engine, newer 182T with 65 KCAS stall speed exceeding MOSAIC limits.'
-            },
-            {
-                'manufacturer': 'Cessna',
-                'model': '206 Stationair',
-                'clean_stall_speed': 71.0,
-                'top_speed': 151.0,
-                'maneuvering_speed': 140.0,
-                'max_takeoff_weight': 3600,
-                'seating_capacity': 6,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1964, 1, 31),  # 206 certified
-                'verification_source': 'Cessna 206 Stationair POH, FAA Type Certificate 3A13. Continental IO-540-E4C5 engine, utility aircraft with 71 KCAS stall speed.'
-            },
-            # Piper singles
-            {
-                'manufacturer': 'Piper',
-                'model': 'Cherokee 180',
-                'clean_stall_speed': 63.0,
-                'top_speed': 139.0,
-                'maneuvering_speed': 113.0,
-                'max_takeoff_weight': 2400,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1963, 5, 14),  # Cherokee 180
-                'verification_source': 'Piper Cherokee 180 POH, FAA Type Certificate 3A12 (amended). Lycoming O-360-A4A engine, 180hp Cherokee with 63 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Piper',
-                'model': 'Archer III',
-                'clean_stall_speed': 64.0,
-                'top_speed': 126.0,
-                'maneuvering_speed': 113.0,
-                'max_takeoff_weight': 2550,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1995, 8, 22),  # Archer III
-                'verification_source': 'Piper Archer III POH, FAA Type Certificate 3A12 (amended). Lycoming IO-360-B1E engine, modern Archer with 64 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Piper',
-                'model': 'Saratoga',
-                'clean_stall_speed': 68.0,
-                'top_speed': 167.0,
-                'maneuvering_speed': 140.0,
-                'max_takeoff_weight': 3600,
-                'seating_capacity': 6,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1980, 4, 9),  # PA-32R Saratoga
-                'verification_source': 'Piper Saratoga POH, FAA Type Certificate A24SO. Lycoming IO-540-K1G5 engine, 6-seat single with 68 KCAS stall speed.'
-            },
-            # Beechcraft
-            {
-                'manufacturer': 'Beechcraft',
-                'model': 'Bonanza A36',
-                'clean_stall_speed': 70.0,
-                'top_speed': 176.0,
-                'maneuvering_speed': 152.0,
-                'max_takeoff_weight': 3650,
-                'seating_capacity': 6,
-                'retractable_gear': True,
-                'variable_pitch_prop': True,
-                'certification_date': date(1970, 3, 17),  # A36 Bonanza
-                'verification_source': 'Beechcraft Bonanza A36 POH, FAA Type Certificate A-777. Continental IO-550-N engine, retractable gear single with 70 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Beechcraft',
-                'model': 'Musketeer',
-                'clean_stall_speed': 62.0,
-                'top_speed': 131.0,
-                'maneuvering_speed': 113.0,
-                'max_takeoff_weight': 2350,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': False,
-                'certification_date': date(1963, 10, 18),  # Musketeer
-                'verification_source': 'Beechcraft Musketeer POH, FAA Type Certificate 3A16. Continental IO-360-A1B engine, entry-level Beechcraft with 62 KCAS stall speed.'
-            },
-            # Cirrus
-            {
-                'manufacturer': 'Cirrus',
-                'model': 'SR20',
-                'clean_stall_speed': 67.0,
-                'top_speed': 155.0,
-                'maneuvering_speed': 133.0,
-                'max_takeoff_weight': 3050,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(1998, 10, 23),  # SR20 certified
-                'verification_source': 'Cirrus SR20 POH, FAA Type Certificate A00001SE. Continental IO-360-ES engine, composite aircraft with CAPS parachute system, 67 KCAS stall speed.'
-            },
-            {
-                'manufacturer': 'Cirrus',
-                'model': 'SR22',
-                'clean_stall_speed': 70.0,
-                'top_speed': 183.0,
-                'maneuvering_speed': 133.0,
-                'max_takeoff_weight': 3600,
-                'seating_capacity': 4,
-                'retractable_gear': False,
-                'variable_pitch_prop': True,
-                'certification_date': date(2000, 4, 4),  # SR22 certified
-                'verification_source': 'Cirrus SR22 POH, FAA Type Certificate A00001SE (amended). Continental IO-550-N engine, high-performance composite aircraft with CAPS, 70 KCAS stall speed.'
-            }
-        ]
-
-        aircraft_count = 0
-        
-        # Add sport pilot eligible aircraft
-        for aircraft_info in sport_pilot_aircraft:
-            manufacturer = manufacturers[aircraft_info['manufacturer']]
-            aircraft = Aircraft.objects.create(
-                manufacturer=manufacturer,
-                model=aircraft_info['model'],
-                clean_stall_speed=aircraft_info['clean_stall_speed'],
-                top_speed=aircraft_info['top_speed'],
-                maneuvering_speed=aircraft_info['maneuvering_speed'],
-                max_takeoff_weight=aircraft_info['max_takeoff_weight'],
-                seating_capacity=aircraft_info['seating_capacity'],
-                retractable_gear=aircraft_info['retractable_gear'],
-                variable_pitch_prop=aircraft_info['variable_pitch_prop'],
-                certification_date=aircraft_info['certification_date'],
-                verification_source=aircraft_info['verification_source'],
-                is_mosaic_compliant=True,
-                sport_pilot_eligible=True
-            )
-            
-            # Add engine associations if specified
-            if 'engines' in aircraft_info:
-                for engine_name in aircraft_info['engines']:
-                    if engine_name in engines:
-                        aircraft.engines.add(engines[engine_name])
-            
-            aircraft_count += 1
-            cert_year = aircraft_info['certification_date'].year
-            self.stdout.write(f'  ✈️  Added sport pilot eligible ({cert_year}): {aircraft}')
-
-        # Add MOSAIC LSA only aircraft (private pilot required)
-        for aircraft_info in mosaic_lsa_only:
-            manufacturer = manufacturers[aircraft_info['manufacturer']]
-            aircraft = Aircraft.objects.create(
-                manufacturer=manufacturer,
-                model=aircraft_info['model'],
-                clean_stall_speed=aircraft_info['clean_stall_speed'],
-                top_speed=aircraft_info['top_speed'],
-                maneuvering_speed=aircraft_info['maneuvering_speed'],
-                max_takeoff_weight=aircraft_info['max_takeoff_weight'],
-                seating_capacity=aircraft_info['seating_capacity'],
-                retractable_gear=aircraft_info['retractable_gear'],
-                variable_pitch_prop=aircraft_info['variable_pitch_prop'],
-                certification_date=aircraft_info['certification_date'],
-                verification_source=aircraft_info['verification_source'],
-                is_mosaic_compliant=True,
-                sport_pilot_eligible=False  # Requires private pilot due to >59kt stall
-            )
-            
-            # Add engine associations if specified
-            if 'engines' in aircraft_info:
-                for engine_name in aircraft_info['engines']:
-                    if engine_name in engines:
-                        aircraft.engines.add(engines[engine_name])
-            
-            aircraft_count += 1
-            cert_year = aircraft_info['certification_date'].year
-            self.stdout.write(f'  🛩️  Added MOSAIC LSA ({cert_year}) - private pilot: {aircraft}')
-
-        # Add non-eligible GA aircraft (>61 knots stall speed)
-        for aircraft_info in non_eligible_aircraft:
-            manufacturer = manufacturers[aircraft_info['manufacturer']]
-            aircraft = Aircraft.objects.create(
-                manufacturer=manufacturer,
-                model=aircraft_info['model'],
-                clean_stall_speed=aircraft_info['clean_stall_speed'],
-                top_speed=aircraft_info['top_speed'],
-                maneuvering_speed=aircraft_info['maneuvering_speed'],
-                max_takeoff_weight=aircraft_info['max_takeoff_weight'],
-                seating_capacity=aircraft_info['seating_capacity'],
-                retractable_gear=aircraft_info['retractable_gear'],
-                variable_pitch_prop=aircraft_info['variable_pitch_prop'],
-                certification_date=aircraft_info['certification_date'],
-                verification_source=aircraft_info['verification_source'],
-                is_mosaic_compliant=False,  # Not MOSAIC compliant due to >61kt stall
-                sport_pilot_eligible=False  # Not sport pilot eligible
-            )
-            
-            # Add engine associations if specified
-            if 'engines' in aircraft_info:
-                for engine_name in aircraft_info['engines']:
-                    if engine_name in engines:
-                        aircraft.engines.add(engines[engine_name])
-            
-            aircraft_count += 1
-            cert_year = aircraft_info['certification_date'].year
-            self.stdout.write(f'  ❌ Added non-eligible GA ({cert_year}): {aircraft}')
+        desired_engines = {}
+        for index, engine_data in enumerate(dataset.get('engines') or [], 1):
+            values = clean_engine(engine_data, f'{source} engine {index}')
+            desired_engines[(values.pop('manufacturer'), values.pop('model'))] = values
+        engine_plan, engine_ids = sync_rows(Engine, desired_engines, ['manufacturer', 'model'])
+        engines = {
+            f'{manufacturer} {model}': engine_id
+            for (manufacturer, model), engine_id in engine_ids.items()
+        }
+        self.stdout.write(f'  Engines: {engine_plan.summary()}')
+
+        desired, desired_links, labels = {}, {}, {}
+        for index, aircraft_data in enumerate(dataset.get('aircraft') or [], 1):
+            record = clean_aircraft(aircraft_data, f'{source} aircraft {index}')
+            if record.manufacturer not in manufacturers:
+                raise DatasetError(f'{record.source}: manufacturer "{record.manufacturer}" is not listed')
+            key = (manufacturers[record.manufacturer].pk, record.model)
+            desired[key] = with_derived_fields(record.values)
+            # Engines missing from the engines list are skipped
+            desired_links[key] = {engines[name] for name in record.engines if name in engines}
+
+            if desired[key]['sport_pilot_eligible']:
+                label = '✈️  sport pilot eligible'
+            elif desired[key]['is_mosaic_compliant']:
+                label = '🛩️  MOSAIC LSA - private pilot'
+            else:
+                label = '❌ non-eligible GA'
+            cert_date = record.values.get('certification_date')
+            labels[key] = f"{label} ({cert_date.year if cert_date else 'n/a'}): {record.manufacturer} {record.model}"
+
+        manufacturer_names = dict(Manufacturer.objects.values_list('pk', 'name'))
+        aircraft_plan, aircraft_ids = sync_rows(Aircraft, desired, ['manufacturer_id', 'model'])
+        for key in aircraft_plan.insert:
+            self.stdout.write(f'  Added {labels[key]}')
+        for key in aircraft_plan.update:
+            self.stdout.write(f'  Updated {labels[key]}')
+        for manufacturer_id, model in aircraft_plan.delete:
+            self.stdout.write(f'  Removed {manufacturer_names[manufacturer_id]} {model}')
+
+        added, removed = sync_aircraft_engines({
+            aircraft_ids[key]: engine_set for key, engine_set in desired_links.items()
+        })
+        self.stdout.write(f'  Aircraft: {aircraft_plan.summary()}')
+        self.stdout.write(f'  Engine links: {added} added, {removed} removed')
+        aircraft_count = len(desired)
 
         sport_pilot_count = Aircraft.objects.filter(sport_pilot_eligible=True).count()
         mosaic_only_count = Aircraft.objects.filter(is_mosaic_compliant=True, sport_pilot_eligible=False).count()
@@ -553,4 +107,4 @@ class Command(BaseCommand):
                 f'  • Total: {aircraft_count} aircraft\\n\\n'
                 f'ℹ️  Database now includes non-eligible aircraft for comparison purposes.'
             )
-        )
\ No newline at end of file
+        )
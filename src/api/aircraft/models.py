@@ -1,9 +1,24 @@
 from django.db import models
+from django.db.models import Count, Prefetch
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.core.exceptions import ValidationError
 from datetime import date
 
 
+class ManufacturerQuerySet(models.QuerySet):
+    def with_aircraft_count(self):
+        """Annotate aircraft_count in SQL instead of issuing one COUNT per manufacturer"""
+        return self.annotate(aircraft_count=Count('aircraft'))
+
+
+class ManufacturerManager(models.Manager['Manufacturer']):
+    def get_queryset(self) -> ManufacturerQuerySet:
+        return ManufacturerQuerySet(self.model, using=self._db)
+
+    def with_aircraft_count(self):
+        return self.get_queryset().with_aircraft_count()
+
+
 class Manufacturer(models.Model):
     name = models.CharField(max_length=100, unique=True)
     logo = models.URLField(
@@ -15,6 +30,8 @@ class Manufacturer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ManufacturerManager()
+
     class Meta:
         db_table = 'manufacturers'
         ordering = ['name']
@@ -48,6 +65,7 @@ class Engine(models.Model):
             MinValueValidator(50),
             MaxValueValidator(400)  # Reasonable range for LSA/GA engines
         ],
+        db_index=True,
         help_text="Rated horsepower (for piston and electric engines)"
     )
     displacement_liters = models.DecimalField(
@@ -70,6 +88,7 @@ class Engine(models.Model):
         max_length=10,
         choices=FUEL_TYPE_CHOICES,
         default='AVGAS',
+        db_index=True,
         help_text="Primary fuel type"
     )
     engine_type = models.CharField(
@@ -94,7 +113,71 @@ class Engine(models.Model):
         return f"{self.manufacturer} {self.model} ({self.horsepower}hp)"
 
 
+class AircraftQuerySet(models.QuerySet):
+    # Aircraft columns that no API serializer exposes
+    API_DEFERRED_FIELDS = ['vle_speed', 'vlo_speed']
+
+    def with_engines(self):
+        """Load every aircraft's engines in one extra query instead of one per row"""
+        return self.prefetch_related('engines')
+
+    def for_api(self):
+        """Queryset shared by all aircraft endpoints: constant query count regardless of size"""
+        return (
+            self.select_related('manufacturer')
+            .with_engines()
+            .defer(*self.API_DEFERRED_FIELDS)
+        )
+
+    def for_detail_api(self):
+        """for_api() variant for serializers that nest the full manufacturer"""
+        return (
+            self.prefetch_related(
+                Prefetch('manufacturer', queryset=Manufacturer.objects.with_aircraft_count())
+            )
+            .with_engines()
+            .defer(*self.API_DEFERRED_FIELDS)
+        )
+
+
+class AircraftManager(models.Manager['Aircraft']):
+    def get_queryset(self) -> AircraftQuerySet:
+        return AircraftQuerySet(self.model, using=self._db)
+
+    def with_engines(self):
+        return self.get_queryset().with_engines()
+
+    def for_api(self):
+        return self.get_queryset().for_api()
+
+    def for_detail_api(self):
+        return self.get_queryset().for_detail_api()
+
+
 class Aircraft(models.Model):
+    PERFORMANCE_CATEGORY_CHOICES = [
+        ('High Performance', 'High Performance (200+ knots top speed)'),
+        ('Cross Country', 'Cross Country (140-199 knots top speed)'),
+        ('Standard Performance', 'Standard Performance (under 140 knots top speed)'),
+    ]
+
+    SPEED_RANGE_CHOICES = [
+        ('Trainer', 'Trainer (≤45 knots stall, ≤120 knots top speed)'),
+        ('Sport', 'Sport (≤55 knots stall, ≤150 knots top speed)'),
+        ('Touring', 'Touring (≤65 knots stall, ≤180 knots top speed)'),
+        ('High Performance', 'High Performance'),
+    ]
+
+    # Columns clean() computes from the others; data loaders and bulk writes
+    # must write these alongside the fields they set
+    DERIVED_FIELDS = [
+        'sport_pilot_eligible',
+        'is_mosaic_compliant',
+        'eligibility_badges',
+        'performance_category',
+        'speed_range',
+    ]
+
     manufacturer = models.ForeignKey(
         Manufacturer, 
         on_delete=models.CASCADE,
@@ -108,6 +191,7 @@ class Aircraft(models.Model):
             MinValueValidator(0.0),
             MaxValueValidator(61.0)  # MOSAIC LSA certification limit
         ],
+        db_index=True,
         help_text="Clean stall speed (Vs1) in knots CAS (max 61 for MOSAIC LSA, max 59 for sport pilot)"
     )
     top_speed = models.DecimalField(
@@ -117,6 +201,7 @@ class Aircraft(models.Model):
             MinValueValidator(0.0),
             MaxValueValidator(999.0)  # Reasonable maximum
         ],
+        db_index=True,
         help_text="Maximum speed in knots"
     )
     maneuvering_speed = models.DecimalField(
@@ -137,6 +222,7 @@ class Aircraft(models.Model):
             MinValueValidator(0.0),
             MaxValueValidator(999.0)  # Reasonable maximum
         ],
+        db_index=True,
         help_text="Cruise speed in knots (typically 75% power at optimal altitude)"
     )
     vx_speed = models.DecimalField(
@@ -245,6 +331,7 @@ class Aircraft(models.Model):
             MinValueValidator(0),
             MaxValueValidator(99999)  # No weight limit under MOSAIC for LSA
         ],
+        db_index=True,
         help_text="Maximum takeoff weight in pounds (no limit under MOSAIC)"
     )
     seating_capacity = models.IntegerField(
@@ -268,6 +355,28 @@ class Aircraft(models.Model):
         default=True,
         help_text="Eligible for sport pilot operation under MOSAIC (≤59 knots stall speed)"
     )
+    eligibility_badges = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="Badges shown in aircraft listings (derived by clean())"
+    )
+    performance_category: models.CharField = models.CharField(
+        max_length=25,
+        choices=PERFORMANCE_CATEGORY_CHOICES,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Category by top speed (derived by clean())"
+    )
+    speed_range: models.CharField = models.CharField(
+        max_length=20,
+        choices=SPEED_RANGE_CHOICES,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Category by stall and top speed (derived by clean())"
+    )
     certification_date = models.DateField(
         null=True,
         blank=True,
@@ -292,10 +401,27 @@ class Aircraft(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AircraftManager()
+
     class Meta:
         db_table = 'aircraft'
         ordering = ['manufacturer__name', 'model']
         unique_together = ['manufacturer', 'model']
+        # Matched to AircraftViewSet's common filter + ordering combinations;
+        # `manage.py benchmark_queries` EXPLAINs them. unique_together already
+        # covers manufacturer + model.
+        indexes = [
+            models.Index(fields=['is_mosaic_compliant', 'clean_stall_speed'], name='aircraft_mosaic_stall_idx'),
+            models.Index(fields=['sport_pilot_eligible', 'clean_stall_speed'], name='aircraft_sport_stall_idx'),
+            models.Index(fields=['seating_capacity', 'top_speed'], name='aircraft_seats_speed_idx'),
+            models.Index(fields=['certification_date'], name='aircraft_cert_date_idx'),
+            # Retractable gear aircraft are a small slice of the catalogue
+            models.Index(
+                fields=['top_speed'],
+                condition=models.Q(retractable_gear=True),
+                name='aircraft_rg_speed_idx'
+            ),
+        ]
 
     def clean(self):
         super().clean()
@@ -320,6 +446,64 @@ class Aircraft(models.Model):
                 # No certification date provided - assume meets requirements if stall speed OK
                 self.is_mosaic_compliant = meets_stall_speed
 
+        # Listing badges and categories are stored so the API neither
+        # recomputes them per request nor has to filter them in Python
+        self.eligibility_badges = self.compute_eligibility_badges()
+        self.performance_category = self.compute_performance_category()
+        self.speed_range = self.compute_speed_range()
+
+    def compute_eligibility_badges(self):
+        badges = []
+
+        if self.sport_pilot_eligible:
+            badges.append('Sport Pilot')
+        elif self.is_mosaic_compliant:
+            badges.append('Private Pilot')
+
+        if not self.is_mosaic_compliant:
+            badges.append('Not MOSAIC Eligible')
+        elif self.is_mosaic_compliant:
+            badges.append('MOSAIC Eligible')
+
+        if self.retractable_gear:
+            badges.append('RG')
+
+        if self.variable_pitch_prop:
+            badges.append('VP')
+
+        return badges
+
+    def compute_performance_category(self):
+        if self.top_speed is None:
+            return ''
+        if self.top_speed >= 200:
+            return 'High Performance'
+        elif self.top_speed >= 140:
+            return 'Cross Country'
+        else:
+            return 'Standard Performance'
+
+    def compute_speed_range(self):
+        if self.clean_stall_speed is None or self.top_speed is None:
+            return ''
+        stall = self.clean_stall_speed
+        top = self.top_speed
+
+        if stall <= 45 and top <= 120:
+            return 'Trainer'
+        elif stall <= 55 and top <= 150:
+            return 'Sport'
+        elif stall <= 65 and top <= 180:
+            return 'Touring'
+        else:
+            return 'High Performance'
+
+    def derived_fields_changed(self):
+        """Recompute the derived columns; return True if any stored value was stale"""
+        before = [getattr(self, name) for name in self.DERIVED_FIELDS]
+        self.clean()
+        return before != [getattr(self, name) for name in self.DERIVED_FIELDS]
+
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
@@ -0,0 +1,185 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in keyset (cursor) pagination.
+
+    Pages are only produced when the client sends `page_size` or `cursor`,
+    so existing clients keep receiving the full list. The page boundary is
+    encoded as the ordering values of the last row returned, and the next
+    page is fetched with a `WHERE (a, b, pk) > (...)` style filter instead of
+    OFFSET, so every page costs the same regardless of how deep it is.
+
+    Any ordering produced by OrderingFilter (or the model's default ordering)
+    is supported; the primary key is appended as a tie-breaker so the order
+    is total, and NULLs always sort last.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*[
+            F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_last=True)
+            for name, descending in self.ordering
+        ])
+
+        position = self.decode_cursor(request, queryset)
+        if position is not None:
+            queryset = queryset.filter(self.build_after_filter(position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        results = results[:self.page_size]
+        self.next_position = self.get_position(results[-1]) if self.has_next else None
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """Return the queryset ordering as (field, descending) pairs ending with the pk"""
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        pairs = []
+        for field in ordering:
+            if not isinstance(field, str):
+                continue
+            name = field.lstrip('-')
+            pairs.append(('pk' if name == queryset.model._meta.pk.name else name, field.startswith('-')))
+        if not any(name == 'pk' for name, _ in pairs):
+            pairs.append(('pk', False))
+        return pairs
+
+    def resolve_field(self, model, name):
+        """Follow `a__b` lookups to the model field that stores the value"""
+        if name == 'pk':
+            return model._meta.pk
+        parts = name.split(LOOKUP_SEP)
+        for part in parts[:-1]:
+            model = model._meta.get_field(part).related_model
+        return model._meta.get_field(parts[-1])
+
+    def get_position(self, instance):
+        position = []
+        for name, _ in self.ordering:
+            value = instance
+            for part in name.split(LOOKUP_SEP):
+                value = getattr(value, part) if value is not None else None
+            position.append(value)
+        return position
+
+    def build_after_filter(self, position):
+        """Rows that sort strictly after `position` (NULLs last in both directions)"""
+        condition = Q(pk__in=[])
+        equal_so_far = Q()
+        for (name, descending), value in zip(self.ordering, position):
+            if value is not None:
+                after = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+                after |= Q(**{f'{name}__isnull': True})
+                condition |= equal_so_far & after
+                equal_so_far &= Q(**{name: value})
+            else:
+                equal_so_far &= Q(**{f'{name}__isnull': True})
+        return condition
+
+    def encode_cursor(self, position):
+        payload = json.dumps(position, cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError(encoded)
+            return [
+                # Annotations (e.g. the search rank) are plain JSON values
+                value if value is None or name in queryset.query.annotations
+                else self.resolve_field(queryset.model, name).to_python(value)
+                for (name, _), value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, UnicodeDecodeError, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                    'example': 'http://api.example.org/v1/aircraft/?cursor=WyJDZXNzbmEiLDEyXQ%3D%3D&page_size=50',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned as `next` by the previous page',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    f'Number of results per page (max {self.max_page_size}). '
+                    'Responses are only paginated when this or `cursor` is given.'
+                ),
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+
+class AircraftPagination(KeysetPagination):
+    page_size = settings.API_PAGE_SIZE
+    max_page_size = settings.API_MAX_PAGE_SIZE
@@ -0,0 +1,241 @@
+"""
+Read-only SQLite snapshot of the aircraft catalogue (SQLITE_READ_REPLICA).
+
+GET requests read the catalogue models from an immutable copy of the
+database opened with `?immutable=1`. SQLite then skips file locking and
+change detection on every query, so reads in one worker never contend
+with reads or writes in another. Everything else (writes, feature flags,
+corrections, sessions, the cache table) stays on the primary database.
+
+Catalogue writes (aircraft.cache.bump_data_version) schedule a rebuild
+once their transaction commits. It runs in a background thread of the
+writing process, so the write doesn't wait for the copy, and writes that
+commit while a rebuild is running are coalesced into a single follow-up
+rebuild instead of one copy each. After every rebuild the data version is
+bumped again, so responses cached while the snapshot lagged the primary
+are dropped. Rebuilds are serialized across processes with a lock file,
+and the copy is swapped in atomically; each worker notices the new file
+on its next GET and reopens its connection.
+"""
+import contextvars
+import functools
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+REPLICA_ALIAS = 'replica'
+
+# Models whose writes bump the catalogue data version, and so refresh the snapshot
+CATALOGUE_MODELS = {'aircraft.manufacturer', 'aircraft.engine', 'aircraft.aircraft', 'aircraft.aircraft_engines'}
+
+_reading = contextvars.ContextVar('replica_reading', default=False)
+_create_lock = threading.Lock()
+
+# The background rebuild, and the callback of a rebuild requested since it started
+_refresh_lock = threading.Lock()
+_refresh_thread = None
+_pending = None
+
+logger = logging.getLogger(__name__)
+
+
+def is_catalogue_model(model):
+    # DatabaseCache routes a stand-in model whose _meta has no label_lower
+    return f'{model._meta.app_label}.{model._meta.model_name}' in CATALOGUE_MODELS
+
+
+def is_enabled():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def snapshot_id():
+    """Identity of the current snapshot file, or None if it hasn't been written"""
+    try:
+        stat = os.stat(settings.SQLITE_REPLICA_PATH)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def cache_tables():
+    return [
+        config['LOCATION'] for config in settings.CACHES.values()
+        if config['BACKEND'] == 'django.core.cache.backends.db.DatabaseCache'
+    ]
+
+
+def refresh():
+    """Copy the primary database to a new snapshot and swap it in"""
+    # Unix only, like the deployments that enable the replica
+    import fcntl
+
+    target = Path(settings.SQLITE_REPLICA_PATH)
+    # One rebuild at a time across processes, so an older copy that
+    # finishes late can never replace a newer one
+    with open(f'{target}.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        copy_primary(target)
+
+
+def copy_primary(target):
+    primary = connections[DEFAULT_DB_ALIAS]
+    primary.ensure_connection()
+
+    fd, temporary = tempfile.mkstemp(dir=target.parent, prefix=f'{target.name}.', suffix='.tmp')
+    os.close(fd)
+    try:
+        snapshot = sqlite3.connect(temporary)
+        try:
+            primary.connection.backup(snapshot)
+            # Cached responses are never read from the snapshot; drop them to keep it small
+            for table in cache_tables():
+                snapshot.execute(f'DROP TABLE IF EXISTS "{table}"')
+            snapshot.execute('VACUUM')
+            # Immutable readers never look for a -wal file, so the copy must not need one
+            snapshot.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            snapshot.close()
+        os.replace(temporary, target)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def refresh_on_commit(callback):
+    """
+    Schedule a background refresh once the current transaction commits (at
+    most once per transaction); `callback` runs after the new snapshot is
+    swapped in.
+    """
+    if not is_enabled():
+        return
+    pending = connections[DEFAULT_DB_ALIAS].run_on_commit
+    if not any(getattr(hook, 'func', None) is schedule_refresh for _, hook, *_ in pending):
+        transaction.on_commit(functools.partial(schedule_refresh, callback))
+
+
+def schedule_refresh(callback):
+    """Refresh in the background; requests made while a refresh runs share one follow-up refresh"""
+    global _refresh_thread, _pending
+    with _refresh_lock:
+        _pending = callback
+        if _refresh_thread is None:
+            # Not a daemon: a management command's process waits for its rebuild before exiting
+            _refresh_thread = threading.Thread(target=_refresh_until_current, name='replica-refresh')
+            _refresh_thread.start()
+
+
+def _refresh_until_current():
+    global _refresh_thread, _pending
+    try:
+        while True:
+            with _refresh_lock:
+                callback, _pending = _pending, None
+                if callback is None:
+                    _refresh_thread = None
+                    return
+            try:
+                refresh()
+                callback()
+            except Exception:
+                # GETs keep reading the previous snapshot until the next write retries
+                logger.exception('Could not refresh the read replica snapshot')
+    finally:
+        connections[DEFAULT_DB_ALIAS].close()
+
+
+def wait_for_refresh():
+    """Block until no background refresh is running"""
+    thread = _refresh_thread
+    if thread is not None:
+        thread.join()
+
+
+class ReplicaRouter:
+    """Route catalogue reads made while serving a GET request to the snapshot"""
+
+    def db_for_read(self, model, **hints):
+        if _reading.get() and is_catalogue_model(model):
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Objects read from the snapshot must still be saved to the primary
+        if is_catalogue_model(model):
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA_ALIAS}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_ALIAS:
+            return False
+        return None
+
+
+def ensure_snapshot():
+    """Write the first snapshot if there is none; False if that has to wait for a commit"""
+    if snapshot_id() is not None:
+        return True
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        # Can't copy the database mid-transaction; read the primary until it commits
+        return False
+    with _create_lock:
+        if snapshot_id() is None:
+            refresh()
+    return True
+
+
+class ReplicaMiddleware:
+    """Serve GET and HEAD requests from the snapshot, reopening it when it has been replaced"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if request.method not in ('GET', 'HEAD') or not ensure_snapshot():
+            return self.get_response(request)
+
+        current = snapshot_id()
+        connection = connections[REPLICA_ALIAS]
+        if getattr(connection, 'snapshot_id', None) != current:
+            connection.close()
+            connection.snapshot_id = current
+
+        token = _reading.set(True)
+        try:
+            return self.get_response(request)
+        finally:
+            _reading.reset(token)
+
+    async def __acall__(self, request):
+        if request.method not in ('GET', 'HEAD'):
+            return await self.get_response(request)
+        if snapshot_id() is None and not await sync_to_async(ensure_snapshot)():
+            return await self.get_response(request)
+
+        # Under ASGI each request's queries run in a thread (and connection) of
+        # their own, so there is no connection to an older snapshot to close
+        token = _reading.set(True)
+        try:
+            return await self.get_response(request)
+        finally:
+            _reading.reset(token)
@@ -0,0 +1,252 @@
+"""
+Full-text search over the aircraft catalogue.
+
+Every aircraft has a row in the `aircraft_search` side table holding its
+model, manufacturer, engine designations and verification source:
+
+- SQLite: an FTS5 virtual table, ranked with bm25()
+- PostgreSQL: a weighted tsvector with a GIN index, ranked with
+  ts_rank_cd() plus pg_trgm similarity when the extension is available
+
+The table is created after `migrate`, kept current by the signal handlers
+in aircraft.signals and rebuilt by commands that write in bulk (or by hand
+with `manage.py rebuild_search_index`). On other databases search() returns
+None and callers fall back to LIKE matching.
+"""
+import contextlib
+import re
+
+from django.db import DatabaseError, connection, transaction
+
+from .models import Aircraft
+
+TABLE = 'aircraft_search'
+# Most relevant first: model, manufacturer, engines, verification source
+COLUMNS = ['model', 'manufacturer', 'engines', 'verification_source']
+COLUMN_WEIGHTS = [10.0, 5.0, 2.0, 1.0]
+# Matches are ranked in the database; anything past this is dropped
+MAX_RESULTS = 1000
+
+_TERM_SPLIT = re.compile(r'[\s,]+')
+_TOKEN = re.compile(r'\w+')
+
+
+def parse_terms(query):
+    """
+    Split a search string into terms, each a list of lowercase word tokens.
+
+    Terms are separated by whitespace or commas like DRF's SearchFilter;
+    punctuation inside a term ("O-320", "Manufacturer-2") splits tokens the
+    same way the index does.
+    """
+    terms = []
+    for term in _TERM_SPLIT.split(query):
+        tokens = _TOKEN.findall(term.lower())
+        if tokens:
+            terms.append(tokens)
+    return terms
+
+
+def documents(aircraft_ids=None):
+    """Yield (pk, model, manufacturer, engines, verification source) for indexing"""
+    queryset = Aircraft.objects.select_related('manufacturer').prefetch_related('engines').only(
+        'model', 'verification_source', 'manufacturer__name'
+    ).order_by('pk')
+    if aircraft_ids is not None:
+        queryset = queryset.filter(pk__in=aircraft_ids)
+    for aircraft in queryset.iterator(chunk_size=500):
+        engines = ' '.join(f'{engine.manufacturer} {engine.model}' for engine in aircraft.engines.all())
+        yield aircraft.pk, aircraft.model, aircraft.manufacturer.name, engines, aircraft.verification_source
+
+
+class SQLiteBackend:
+    def is_available(self, cursor):
+        cursor.execute('PRAGMA compile_options')
+        return any(option == 'ENABLE_FTS5' for option, in cursor.fetchall())
+
+    def create(self, cursor):
+        # Prefix indexes make short type-ahead prefixes cheap
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5('
+            f'{", ".join(COLUMNS)}, tokenize="unicode61", prefix="1 2 3")'
+        )
+
+    def delete(self, cursor, aircraft_ids=None):
+        if aircraft_ids is None:
+            cursor.execute(f'DELETE FROM {TABLE}')
+        else:
+            cursor.execute(
+                f'DELETE FROM {TABLE} WHERE rowid IN ({", ".join(["%s"] * len(aircraft_ids))})',
+                list(aircraft_ids)
+            )
+
+    def insert(self, cursor, rows):
+        cursor.executemany(
+            f'INSERT INTO {TABLE} (rowid, {", ".join(COLUMNS)}) VALUES (%s, %s, %s, %s, %s)',
+            rows
+        )
+
+    def match_expression(self, terms):
+        # Each term is a phrase whose last token is a prefix: "manufacturer 2"*
+        return ' AND '.join(f'"{" ".join(tokens)}"*' for tokens in terms)
+
+    def search(self, cursor, terms, limit):
+        weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS)
+        cursor.execute(
+            f'SELECT rowid FROM {TABLE} WHERE {TABLE} MATCH %s '
+            f'ORDER BY bm25({TABLE}, {weights}), rowid LIMIT %s',
+            [self.match_expression(terms), limit]
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+class PostgreSQLBackend:
+    # tsvector weights A-D, in COLUMNS order
+    LABELS = ['A', 'B', 'C', 'D']
+
+    def __init__(self):
+        self.trigram = False
+
+    def is_available(self, cursor):
+        self.trigram = self.has_trigram(cursor)
+        return True
+
+    def has_trigram(self, cursor):
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+    def create(self, cursor):
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+            'aircraft_id bigint PRIMARY KEY, document tsvector NOT NULL, content text NOT NULL)'
+        )
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {TABLE}_document_idx ON {TABLE} USING gin (document)')
+        try:
+            with transaction.atomic():
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {TABLE}_content_trgm_idx ON {TABLE} USING gin (content gin_trgm_ops)'
+                )
+        except DatabaseError:
+            # Managed databases may not allow extensions; ranking then uses the tsvector alone
+            pass
+        self.trigram = self.has_trigram(cursor)
+
+    def delete(self, cursor, aircraft_ids=None):
+        if aircraft_ids is None:
+            cursor.execute(f'DELETE FROM {TABLE}')
+        else:
+            cursor.execute(f'DELETE FROM {TABLE} WHERE aircraft_id = ANY(%s)', [list(aircraft_ids)])
+
+    def insert(self, cursor, rows):
+        # Punctuation is replaced first so "O-320" indexes as the tokens parse_terms() produces
+        vector = ' || '.join(
+            f"setweight(to_tsvector('simple', regexp_replace(%s, '\\W+', ' ', 'g')), '{label}')"
+            for label in self.LABELS
+        )
+        cursor.executemany(
+            f'INSERT INTO {TABLE} (aircraft_id, document, content) VALUES (%s, {vector}, %s) '
+            'ON CONFLICT (aircraft_id) DO UPDATE SET document = EXCLUDED.document, content = EXCLUDED.content',
+            [(pk, *columns, ' '.join(columns).lower()) for pk, *columns in rows]
+        )
+
+    def tsquery(self, terms):
+        # Phrase per term with a prefix on its last token: manufacturer <-> 2:*
+        return ' & '.join(
+            ' <-> '.join(tokens[:-1] + [f'{tokens[-1]}:*']) for tokens in terms
+        )
+
+    def search(self, cursor, terms, limit):
+        if self.trigram:
+            text = ' '.join(' '.join(tokens) for tokens in terms)
+            cursor.execute(
+                f'SELECT aircraft_id FROM {TABLE}, to_tsquery(\'simple\', %s) query '
+                'WHERE document @@ query '
+                'ORDER BY ts_rank_cd(document, query) + similarity(content, %s) DESC, aircraft_id LIMIT %s',
+                [self.tsquery(terms), text, limit]
+            )
+        else:
+            cursor.execute(
+                f'SELECT aircraft_id FROM {TABLE}, to_tsquery(\'simple\', %s) query '
+                'WHERE document @@ query ORDER BY ts_rank_cd(document, query) DESC, aircraft_id LIMIT %s',
+                [self.tsquery(terms), limit]
+            )
+        return [row[0] for row in cursor.fetchall()]
+
+
+BACKENDS = {
+    'sqlite': SQLiteBackend,
+    'postgresql': PostgreSQLBackend,
+}
+_backend = None
+
+
+def get_backend():
+    """The search backend for the default database, or None if it has none"""
+    global _backend
+    if _backend is None:
+        backend_class = BACKENDS.get(connection.vendor)
+        backend = backend_class() if backend_class else False
+        if backend:
+            with connection.cursor() as cursor:
+                if not backend.is_available(cursor):
+                    backend = False
+        _backend = backend
+    return _backend or None
+
+
+def create_index():
+    """Create the search table if it doesn't exist yet; returns the backend"""
+    backend = get_backend()
+    if backend is not None:
+        with connection.cursor() as cursor:
+            backend.create(cursor)
+    return backend
+
+
+def rebuild_index():
+    """Recreate every row of the search table; returns the number of aircraft indexed"""
+    backend = create_index()
+    if backend is None:
+        return 0
+    rows = list(documents())
+    with transaction.atomic(), connection.cursor() as cursor:
+        backend.delete(cursor)
+        backend.insert(cursor, rows)
+    return len(rows)
+
+
+def update_index(aircraft_ids):
+    """Reindex the given aircraft; ids that no longer exist are removed"""
+    backend = get_backend()
+    aircraft_ids = list(aircraft_ids)
+    if backend is None or not aircraft_ids:
+        return
+    rows = list(documents(aircraft_ids))
+    with transaction.atomic(), connection.cursor() as cursor:
+        backend.delete(cursor, aircraft_ids)
+        backend.insert(cursor, rows)
+
+
+def search(query, limit=MAX_RESULTS):
+    """
+    Return aircraft ids matching `query`, most relevant first.
+
+    Every term must match as a word prefix ("cess 17" finds the Cessna
+    172). Returns None when full-text search is unavailable, so callers can
+    fall back to substring matching.
+    """
+    backend = get_backend()
+    terms = parse_terms(query)
+    if backend is None or not terms:
+        return None
+    # A read needs no transaction of its own (on SQLite, which starts them
+    # IMMEDIATE, it would take the write lock); inside one, a savepoint keeps
+    # a failed query from aborting the enclosing transaction
+    savepoint = transaction.atomic() if connection.in_atomic_block else contextlib.nullcontext()
+    try:
+        with savepoint, connection.cursor() as cursor:
+            return backend.search(cursor, terms, limit)
+    except DatabaseError:
+        # Table not created yet (e.g. migrate hasn't run since upgrading)
+        return None
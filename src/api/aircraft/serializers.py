@@ -19,7 +19,11 @@ class ManufacturerSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
     def get_aircraft_count(self, obj):
-        return obj.aircraft.count()
+        # Querysets from Manufacturer.objects.with_aircraft_count() carry the count already
+        count = getattr(obj, 'aircraft_count', None)
+        if count is None:
+            count = obj.aircraft.count()
+        return count
 
 
 class EngineSerializer(serializers.ModelSerializer):
@@ -41,12 +45,33 @@ class EngineSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class AircraftSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Render a subset of a serializer's fields.
+
+    `fields` keeps only the named fields and `omit` drops the named ones (the
+    aircraft views take both from ?fields= / ?omit=). Unknown names are a
+    validation error so a typo doesn't silently return everything.
+    """
+
+    def __init__(self, *args, fields=None, omit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None and omit is None:
+            return
+        available = set(self.fields)
+        unknown = (set(fields or []) | set(omit or [])) - available
+        if unknown:
+            raise serializers.ValidationError({
+                'fields': f'Unknown field(s): {", ".join(sorted(unknown))}'
+            })
+        keep = set(fields) if fields is not None else available
+        for name in available - keep | set(omit or []):
+            self.fields.pop(name, None)
+
+
+class AircraftSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     manufacturer_name = serializers.CharField(source='manufacturer.name', read_only=True)
     engines = EngineSerializer(many=True, read_only=True)
-    eligibility_badges = serializers.SerializerMethodField()
-    performance_category = serializers.SerializerMethodField()
-    speed_range = serializers.SerializerMethodField()
 
     class Meta:
         model = Aircraft
@@ -82,52 +107,42 @@ class AircraftSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at', 'is_mosaic_compliant', 'sport_pilot_eligible']
-    
-    def get_eligibility_badges(self, obj):
-        """Return list of eligibility badges for the aircraft"""
-        badges = []
-        
-        if obj.sport_pilot_eligible:
-            badges.append('Sport Pilot')
-        elif obj.is_mosaic_compliant:
-            badges.append('Private Pilot')
-        
-        if not obj.is_mosaic_compliant:
-            badges.append('Not MOSAIC Eligible')
-        elif obj.is_mosaic_compliant:
-            badges.append('MOSAIC Eligible')
-            
-        if obj.retractable_gear:
-            badges.append('RG')
-            
-        if obj.variable_pitch_prop:
-            badges.append('VP')
-            
-        return badges
-    
-    def get_performance_category(self, obj):
-        """Categorize aircraft by performance"""
-        if obj.top_speed >= 200:
-            return 'High Performance'
-        elif obj.top_speed >= 140:
-            return 'Cross Country'
-        else:
-            return 'Standard Performance'
-    
-    def get_speed_range(self, obj):
-        """Return speed range category"""
-        stall = float(obj.clean_stall_speed)
-        top = float(obj.top_speed)
-        
-        if stall <= 45 and top <= 120:
-            return 'Trainer'
-        elif stall <= 55 and top <= 150:
-            return 'Sport'
-        elif stall <= 65 and top <= 180:
-            return 'Touring'
-        else:
-            return 'High Performance'
+        # Derived by Aircraft.clean() on save
+        read_only_fields = ['created_at', 'updated_at', *Aircraft.DERIVED_FIELDS]
+
+
+class AircraftListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact aircraft representation for grids and lists (?compact=true).
+
+    Just the columns the home table shows and filters on: no engines,
+    verification source or timestamps.
+    """
+    manufacturer_name = serializers.CharField(source='manufacturer.name', read_only=True)
+
+    class Meta:
+        model = Aircraft
+        fields = [
+            'id',
+            'manufacturer',
+            'manufacturer_name',
+            'model',
+            'clean_stall_speed',
+            'top_speed',
+            'cruise_speed',
+            'max_takeoff_weight',
+            'seating_capacity',
+            'retractable_gear',
+            'variable_pitch_prop',
+            'certification_date',
+            'image',
+            'is_mosaic_compliant',
+            'sport_pilot_eligible',
+            'eligibility_badges',
+            'performance_category',
+            'speed_range',
+        ]
+        read_only_fields = fields
 
 
 class AircraftDetailSerializer(AircraftSerializer):
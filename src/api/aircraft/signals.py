@@ -0,0 +1,88 @@
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import search, suggest
+from .cache import bump_data_version, record_deletion
+from .models import Aircraft, Engine, Manufacturer
+
+
+@receiver(post_save, sender=Aircraft)
+@receiver(post_save, sender=Manufacturer)
+@receiver(post_save, sender=Engine)
+def invalidate_on_write(sender, **kwargs):
+    """Any change to catalogue data invalidates cached API responses"""
+    bump_data_version()
+    # Other workers notice the new data version within SUGGEST_INDEX_TTL
+    suggest.clear()
+
+
+@receiver(post_delete, sender=Aircraft)
+@receiver(post_delete, sender=Manufacturer)
+@receiver(post_delete, sender=Engine)
+def invalidate_on_delete(sender, **kwargs):
+    record_deletion()
+    bump_data_version()
+    suggest.clear()
+
+
+@receiver(m2m_changed, sender=Aircraft.engines.through)
+def invalidate_on_engine_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # Linking engines touches no aircraft column, so bump updated_at by hand to
+    # keep Last-Modified honest for the aircraft whose engine list changed
+    if reverse:
+        changed = Aircraft.objects.filter(pk__in=pk_set or [])
+        if action == 'post_clear':
+            record_deletion()
+    else:
+        changed = Aircraft.objects.filter(pk=instance.pk)
+    changed.update(updated_at=timezone.now())
+    bump_data_version()
+
+
+@receiver(post_save, sender=Aircraft)
+@receiver(post_delete, sender=Aircraft)
+def reindex_aircraft(sender, instance, **kwargs):
+    search.update_index([instance.pk])
+
+
+@receiver(post_save, sender=Manufacturer)
+def reindex_manufacturer_aircraft(sender, instance, created, **kwargs):
+    if not created:
+        search.update_index(instance.aircraft.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Engine)
+def reindex_engine_aircraft(sender, instance, created, **kwargs):
+    if not created:
+        search.update_index(instance.aircraft.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Engine)
+def remember_engine_aircraft(sender, instance, **kwargs):
+    # The links are gone by post_delete
+    instance._search_aircraft_ids = list(instance.aircraft.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Engine)
+def reindex_deleted_engine_aircraft(sender, instance, **kwargs):
+    search.update_index(getattr(instance, '_search_aircraft_ids', []))
+
+
+@receiver(m2m_changed, sender=Aircraft.engines.through)
+def reindex_on_engine_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        instance._search_aircraft_ids = list(instance.aircraft.values_list('pk', flat=True))
+    elif reverse and action == 'post_clear':
+        search.update_index(getattr(instance, '_search_aircraft_ids', []))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        search.update_index((pk_set or []) if reverse else [instance.pk])
+
+
+@receiver(post_migrate)
+def create_search_index(sender, using, **kwargs):
+    """Create and fill the search table once the aircraft tables exist"""
+    if sender.name == 'aircraft' and using == 'default':
+        search.rebuild_index()
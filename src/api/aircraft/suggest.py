@@ -0,0 +1,119 @@
+"""
+In-process prefix index behind /v1/aircraft/suggest/.
+
+Each worker keeps sorted arrays of normalized "manufacturer model" labels
+and answers type-ahead queries with bisect, without touching the database.
+The index remembers the catalogue data version it was built from and
+compares it (one cache read) once it is older than SUGGEST_INDEX_TTL.
+"""
+import bisect
+import threading
+import time
+
+from django.conf import settings
+
+from .cache import get_data_version
+from .models import Aircraft
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+_lock = threading.Lock()
+_index = None
+
+
+def normalize(text):
+    """Lowercase and collapse whitespace so keys and queries compare equal"""
+    return ' '.join(text.casefold().split())
+
+
+class PrefixArray:
+    """Sorted (key, entry) pairs searchable by key prefix"""
+
+    def __init__(self, pairs):
+        pairs = sorted(pairs, key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.entries = [entry for _, entry in pairs]
+
+    def matches(self, prefix):
+        """Yield the entries whose key starts with `prefix`, in key order"""
+        start = bisect.bisect_left(self.keys, prefix)
+        for position in range(start, len(self.keys)):
+            if not self.keys[position].startswith(prefix):
+                break
+            yield self.entries[position]
+
+
+class SuggestIndex:
+    """Immutable prefix index over every aircraft label"""
+
+    def __init__(self, version, rows):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        labels = []
+        words = []
+        for pk, manufacturer, model in rows:
+            label = f'{manufacturer} {model}'
+            entry = {'id': pk, 'label': label}
+            key = normalize(label)
+            labels.append((key, entry))
+            # Later words too, so "172" or "skyhawk" find "Cessna 172 Skyhawk"
+            parts = key.split(' ')
+            for start in range(1, len(parts)):
+                words.append((' '.join(parts[start:]), entry))
+        self.labels = PrefixArray(labels)
+        self.words = PrefixArray(words)
+
+    def is_fresh(self):
+        return time.monotonic() - self.loaded_at < settings.SUGGEST_INDEX_TTL
+
+    def suggest(self, query, limit=DEFAULT_LIMIT):
+        """
+        Return up to `limit` {'id', 'label'} entries matching `query`.
+
+        Labels that start with the query come first, then labels with a later
+        word starting with it; each group is alphabetical.
+        """
+        prefix = normalize(query)
+        if not prefix or limit <= 0:
+            return []
+        results = []
+        seen = set()
+        for matches in (self.labels.matches(prefix), self.words.matches(prefix)):
+            for entry in matches:
+                if entry['id'] not in seen:
+                    seen.add(entry['id'])
+                    results.append(entry)
+                    if len(results) == limit:
+                        return results
+        return results
+
+
+def build_index(version):
+    rows = Aircraft.objects.values_list('pk', 'manufacturer__name', 'model').iterator(chunk_size=2000)
+    return SuggestIndex(version, rows)
+
+
+def get_index():
+    """Return this process's suggest index, rebuilding it if the catalogue changed"""
+    global _index
+    index = _index
+    if index is not None and index.is_fresh():
+        return index
+
+    with _lock:
+        index = _index
+        if index is not None and index.is_fresh():
+            return index
+        version = get_data_version()
+        if index is not None and index.version == version:
+            index.loaded_at = time.monotonic()
+            return index
+        _index = build_index(version)
+        return _index
+
+
+def clear():
+    """Drop this process's index so the next query rebuilds it"""
+    global _index
+    _index = None
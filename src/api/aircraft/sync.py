@@ -0,0 +1,119 @@
+from collections import defaultdict
+
+from django.utils import timezone
+
+from .models import Aircraft
+
+
+class SyncPlan:
+    """
+    Keys of a dataset split by what bringing the table in line with it takes.
+
+    `desired` and `current` map a natural key (e.g. manufacturer + model) to
+    a dict of field values. Rows missing from `current` are inserted, rows
+    whose values differ are updated, and rows missing from `desired` are
+    deleted; everything else is left alone so primary keys stay stable.
+    """
+
+    def __init__(self, desired, current):
+        self.insert = [key for key in desired if key not in current]
+        self.update, self.unchanged = [], []
+        for key in desired:
+            if key in current:
+                changed = any(current[key][name] != value for name, value in desired[key].items())
+                (self.update if changed else self.unchanged).append(key)
+        self.delete = [key for key in current if key not in desired]
+
+    def summary(self):
+        return (
+            f'{len(self.insert)} inserted, {len(self.update)} updated, '
+            f'{len(self.unchanged)} unchanged, {len(self.delete)} deleted'
+        )
+
+
+def with_derived_fields(values):
+    """Add the columns Aircraft.clean() derives from the other fields"""
+    aircraft = Aircraft(**values)
+    aircraft.clean()
+    return {
+        **values,
+        **{name: getattr(aircraft, name) for name in Aircraft.DERIVED_FIELDS},
+    }
+
+
+def sync_rows(model, desired, key_fields, delete_missing=True):
+    """
+    Apply the difference between `desired` and the rows of `model`.
+
+    `desired` maps tuples of `key_fields` values to normalized field dicts;
+    only the fields each row defines are compared and written.
+    Returns the SyncPlan that was applied and a {key: pk} map of every
+    desired row.
+    """
+    fields = sorted({name for values in desired.values() for name in values})
+    current, pks = {}, {}
+    for row in model.objects.values('pk', *key_fields, *fields):
+        key = tuple(row[name] for name in key_fields)
+        pks[key] = row['pk']
+        current[key] = {name: row[name] for name in fields}
+
+    plan = SyncPlan(desired, current)
+    now = timezone.now()
+
+    if plan.insert:
+        model.objects.bulk_create([
+            model(**dict(zip(key_fields, key)), **desired[key])
+            for key in plan.insert
+        ])
+        # bulk_create() doesn't return primary keys on every backend
+        for pk, *key in model.objects.values_list('pk', *key_fields):
+            pks[tuple(key)] = pk
+
+    # Rows are updated in groups sharing the same defined fields, so a field
+    # a row leaves out is never overwritten with the model default
+    groups = defaultdict(list)
+    for key in plan.update:
+        groups[tuple(sorted(desired[key]))].append(key)
+    for group_fields, keys in groups.items():
+        model.objects.bulk_update(
+            [model(pk=pks[key], updated_at=now, **desired[key]) for key in keys],
+            [*group_fields, 'updated_at']
+        )
+
+    if plan.delete and delete_missing:
+        model.objects.filter(pk__in=[pks.pop(key) for key in plan.delete]).delete()
+    elif not delete_missing:
+        plan.delete = []
+
+    return plan, pks
+
+
+def sync_aircraft_engines(desired):
+    """
+    Make each aircraft's engine links match `desired` ({aircraft pk: set of engine pks}).
+
+    Returns (added, removed) link counts. Aircraft whose links change get
+    their updated_at touched, as the m2m_changed signal handler would.
+    """
+    Link = Aircraft.engines.through
+    current = {}
+    for link_id, aircraft_id, engine_id in Link.objects.filter(
+        aircraft_id__in=list(desired)
+    ).values_list('pk', 'aircraft_id', 'engine_id'):
+        current[(aircraft_id, engine_id)] = link_id
+
+    wanted = {
+        (aircraft_id, engine_id)
+        for aircraft_id, engine_ids in desired.items()
+        for engine_id in engine_ids
+    }
+    added = wanted - current.keys()
+    removed = current.keys() - wanted
+
+    Link.objects.bulk_create([Link(aircraft_id=a, engine_id=e) for a, e in added])
+    Link.objects.filter(pk__in=[current[link] for link in removed]).delete()
+
+    changed = {aircraft_id for aircraft_id, _ in added | removed}
+    if changed:
+        Aircraft.objects.filter(pk__in=changed).update(updated_at=timezone.now())
+    return len(added), len(removed)
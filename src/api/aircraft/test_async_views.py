@@ -0,0 +1,111 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path
+from rest_framework import status
+
+from . import async_views
+from .models import Manufacturer, Engine, Aircraft
+
+# The project's URLs with the async views in front, as under ASGI (API_ASYNC_VIEWS)
+urlpatterns = [
+    path('v1/aircraft/', async_views.aircraft_list),
+    path('v1/aircraft/compare/', async_views.aircraft_compare),
+    path('v1/aircraft/<int:pk>/', async_views.aircraft_detail),
+    path('', include('mosaicplane.urls')),
+]
+
+HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Allow']
+
+
+class AsyncAircraftViewsTest(TestCase):
+    """The async aircraft views must answer exactly like AircraftViewSet"""
+
+    def setUp(self):
+        cache.clear()
+        self.manufacturer = Manufacturer.objects.create(name='Cessna')
+        engine = Engine.objects.create(manufacturer='Lycoming', model='O-320-E2A', horsepower=150)
+        self.aircraft = []
+        for model, stall in (('172', '47.0'), ('150', '42.0')):
+            aircraft = Aircraft.objects.create(
+                manufacturer=self.manufacturer,
+                model=model,
+                clean_stall_speed=Decimal(stall),
+                top_speed=Decimal('126.0'),
+                maneuvering_speed=Decimal('99.0')
+            )
+            aircraft.engines.add(engine)
+            self.aircraft.append(aircraft)
+
+    async def assertSameResponse(self, url, **headers):
+        expected = await self.async_client.get(url, headers=headers)
+        with override_settings(ROOT_URLCONF=__name__):
+            # A miss, then a hit on the rendered-response cache
+            for _ in range(2):
+                response = await self.async_client.get(url, headers=headers)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+                for header in HEADERS:
+                    self.assertEqual(response.get(header), expected.get(header), header)
+        return expected
+
+    async def test_detail_and_compare(self):
+        """Test detail and compare responses, including sparse fields and errors"""
+        pk = self.aircraft[0].pk
+        response = await self.assertSameResponse(f'/v1/aircraft/{pk}/')
+        self.assertEqual(response.json()['manufacturer']['aircraft_count'], 2)
+        await self.assertSameResponse(f'/v1/aircraft/{pk}/?fields=id,model')
+        await self.assertSameResponse(f'/v1/aircraft/{pk}/?manufacturer=999')
+        await self.assertSameResponse('/v1/aircraft/0/')
+
+        ids = ','.join(str(aircraft.pk) for aircraft in self.aircraft)
+        response = await self.assertSameResponse(f'/v1/aircraft/compare/?ids={ids}')
+        self.assertEqual(len(response.json()), 2)
+        await self.assertSameResponse('/v1/aircraft/compare/')
+        await self.assertSameResponse('/v1/aircraft/compare/?ids=1,x')
+
+    async def test_invalid_sparse_fields(self):
+        """Test unknown ?fields= / ?omit= names are the same 400 on the list and detail views"""
+        pk = self.aircraft[0].pk
+        for url in ['/v1/aircraft/', f'/v1/aircraft/{pk}/']:
+            for query in ['fields=bogus', 'omit=bogus', 'fields=id,bogus&omit=model']:
+                response = await self.assertSameResponse(f'{url}?{query}')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_list(self):
+        """Test list responses, filtered, paginated and with an indented Accept header"""
+        await self.assertSameResponse('/v1/aircraft/')
+        await self.assertSameResponse('/v1/aircraft/?compact=true&ordering=clean_stall_speed')
+        await self.assertSameResponse('/v1/aircraft/?page_size=1')
+        await self.assertSameResponse('/v1/aircraft/', accept='application/json; indent=4')
+
+    async def test_conditional_get(self):
+        """Test a cached response still answers If-None-Match with a 304"""
+        pk = self.aircraft[0].pk
+        expected = await self.assertSameResponse(f'/v1/aircraft/{pk}/')
+        with override_settings(ROOT_URLCONF=__name__):
+            response = await self.async_client.get(f'/v1/aircraft/{pk}/', headers={'if-none-match': expected['ETag']})
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_detail_uses_async_orm_then_cache(self):
+        """Test a detail miss is built without the sync view and a hit without any catalogue query"""
+        pk = self.aircraft[0].pk
+        with override_settings(ROOT_URLCONF=__name__), \
+                mock.patch.object(async_views, 'fallback', wraps=async_views.fallback) as fallback, \
+                mock.patch.object(async_views, 'aqueryset_validators', wraps=async_views.aqueryset_validators) as validators:
+            for _ in range(3):
+                response = await self.async_client.get(f'/v1/aircraft/{pk}/')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+        fallback.assert_not_called()
+        self.assertEqual(validators.call_count, 1)
+
+    async def test_writes_invalidate(self):
+        """Test a catalogue write replaces the cached rendered response"""
+        pk = self.aircraft[0].pk
+        await self.assertSameResponse(f'/v1/aircraft/{pk}/')
+        self.aircraft[0].model = '172N'
+        await self.aircraft[0].asave()
+        response = await self.assertSameResponse(f'/v1/aircraft/{pk}/')
+        self.assertEqual(response.json()['model'], '172N')
@@ -0,0 +1,220 @@
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+from rest_framework import status
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+from django.core.cache import cache
+from .cache import get_data_version
+from .models import Manufacturer, Engine, Aircraft
+from .serializers import AircraftSerializer
+from .views import AircraftViewSet
+
+
+class ResponseCacheTest(APITestCase):
+    """Test cases for the versioned API response cache"""
+
+    def setUp(self):
+        self.manufacturer = Manufacturer.objects.create(name="Cessna")
+        self.aircraft = Aircraft.objects.create(
+            manufacturer=self.manufacturer,
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0')
+        )
+        self.engine = Engine.objects.create(manufacturer='Lycoming', model='O-320-E2A', horsepower=150)
+
+    def get(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_repeat_requests_are_served_from_cache(self):
+        """Test a write that bypasses signals is not visible until the version changes"""
+        url = reverse('aircraft-list')
+        self.assertEqual(self.get(url)[0]['model'], '172')
+
+        # QuerySet.update() sends no signals, so the cached response is reused
+        Aircraft.objects.filter(pk=self.aircraft.pk).update(model='172N')
+        self.assertEqual(self.get(url)[0]['model'], '172')
+
+        self.aircraft.refresh_from_db()
+        self.aircraft.save()
+        self.assertEqual(self.get(url)[0]['model'], '172N')
+
+    def test_query_string_is_normalized(self):
+        """Test parameter order does not produce separate cache entries"""
+        url = reverse('aircraft-list')
+        self.get(url, {'seating_capacity': 2, 'ordering': 'model'})
+        Aircraft.objects.filter(pk=self.aircraft.pk).update(model='172N')
+        data = self.get(url + '?ordering=model&seating_capacity=2')
+        self.assertEqual(data[0]['model'], '172')
+
+    def test_distinct_queries_are_cached_separately(self):
+        """Test filters, search and ordering are part of the cache key"""
+        url = reverse('aircraft-list')
+        self.assertEqual(len(self.get(url, {'search': '172'})), 1)
+        self.assertEqual(len(self.get(url, {'search': 'Piper'})), 0)
+
+    def test_save_and_delete_invalidate(self):
+        """Test post_save and post_delete on catalogue models bump the data version"""
+        for write in (
+            lambda: self.manufacturer.save(),
+            lambda: self.aircraft.save(),
+            lambda: self.engine.save(),
+            lambda: Engine.objects.create(manufacturer='Rotax', model='912ULS').delete(),
+        ):
+            version = get_data_version()
+            write()
+            self.assertNotEqual(get_data_version(), version)
+
+    def test_culling_keeps_data_version(self):
+        """Test culling the full response cache never evicts the data version"""
+        version = get_data_version()
+        with mock.patch.object(cache, '_max_entries', 2), mock.patch.object(cache, '_cull_frequency', 1):
+            for i in range(5):
+                cache.set(f'api-response:{i}', i)
+        self.assertEqual(get_data_version(), version)
+
+    def test_engine_changes_invalidate(self):
+        """Test m2m_changed on aircraft engines invalidates cached aircraft"""
+        url = reverse('aircraft-detail', kwargs={'pk': self.aircraft.pk})
+        self.assertEqual(self.get(url)['engines'], [])
+
+        self.aircraft.engines.add(self.engine)
+        self.assertEqual(len(self.get(url)['engines']), 1)
+
+        self.aircraft.engines.clear()
+        self.assertEqual(self.get(url)['engines'], [])
+
+    def test_manufacturer_endpoints_invalidate_on_aircraft_write(self):
+        """Test manufacturer aircraft_count is refreshed when aircraft are added"""
+        url = reverse('manufacturer-list')
+        self.assertEqual(self.get(url)[0]['aircraft_count'], 1)
+        Aircraft.objects.create(
+            manufacturer=self.manufacturer,
+            model='182',
+            clean_stall_speed=Decimal('56.0'),
+            top_speed=Decimal('145.0'),
+            maneuvering_speed=Decimal('119.0')
+        )
+        self.assertEqual(self.get(url)[0]['aircraft_count'], 2)
+
+    def test_errors_are_not_cached(self):
+        """Test only successful responses are stored"""
+        url = reverse('aircraft-compare')
+        response = self.client.get(url, {'ids': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(url, {'ids': self.aircraft.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ConditionalGetTest(APITestCase):
+    """Test cases for ETag / Last-Modified support on read-only endpoints"""
+
+    def setUp(self):
+        self.manufacturer = Manufacturer.objects.create(name="Cessna")
+        self.aircraft = Aircraft.objects.create(
+            manufacturer=self.manufacturer,
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0')
+        )
+        self.engine = Engine.objects.create(manufacturer='Lycoming', model='O-320-E2A', horsepower=150)
+
+    def assertRevalidates(self, url, params=None):
+        """Fetch `url`, then check a conditional request for it returns 304; return the ETag"""
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+
+        response = self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        return etag
+
+    def test_endpoints_emit_validators(self):
+        """Test list, detail, compare and manufacturer endpoints answer If-None-Match"""
+        self.assertRevalidates(reverse('aircraft-list'))
+        self.assertRevalidates(reverse('aircraft-list'), {'search': '172', 'page_size': 10})
+        self.assertRevalidates(reverse('aircraft-detail', kwargs={'pk': self.aircraft.pk}))
+        self.assertRevalidates(reverse('aircraft-compare'), {'ids': str(self.aircraft.pk)})
+        self.assertRevalidates(reverse('manufacturer-list'))
+        self.assertRevalidates(reverse('manufacturer-detail', kwargs={'pk': self.manufacturer.pk}))
+        self.assertRevalidates(reverse('manufacturer-aircraft', kwargs={'pk': self.manufacturer.pk}))
+
+    def test_etag_depends_on_query(self):
+        """Test different queries over the same data get different ETags"""
+        url = reverse('aircraft-list')
+        self.assertNotEqual(
+            self.client.get(url)['ETag'],
+            self.client.get(url, {'ordering': '-top_speed'})['ETag']
+        )
+
+    def test_not_modified_skips_serialization(self):
+        """Test a 304 is answered without serializing aircraft"""
+        url = reverse('aircraft-list')
+        etag = self.client.get(url)['ETag']
+        with mock.patch.object(AircraftSerializer, 'to_representation') as to_representation:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        to_representation.assert_not_called()
+
+    def test_cache_hit_skips_validator_query(self):
+        """Test a cached response is revalidated without querying the catalogue"""
+        url = reverse('aircraft-list')
+        etag = self.client.get(url)['ETag']
+        with mock.patch.object(AircraftViewSet, 'get_validators') as get_validators:
+            response = self.client.get(url)
+            self.assertEqual(response['ETag'], etag)
+            self.assertIn('Last-Modified', response)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        get_validators.assert_not_called()
+
+    def test_writes_change_etag(self):
+        """Test saves, engine changes and deletions all produce a fresh 200"""
+        url = reverse('aircraft-list')
+        writes = [
+            lambda: self.aircraft.save(),
+            lambda: self.aircraft.engines.add(self.engine),
+            lambda: self.manufacturer.save(),
+            lambda: Aircraft.objects.create(
+                manufacturer=self.manufacturer,
+                model='182',
+                clean_stall_speed=Decimal('56.0'),
+                top_speed=Decimal('145.0'),
+                maneuvering_speed=Decimal('119.0')
+            ).delete(),
+        ]
+        for write in writes:
+            etag = self.client.get(url)['ETag']
+            write()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since is honoured and advanced by engine changes"""
+        url = reverse('aircraft-detail', kwargs={'pk': self.aircraft.pk})
+        last_modified = self.client.get(url)['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Linking an engine bumps the aircraft's updated_at
+        Aircraft.objects.filter(pk=self.aircraft.pk).update(updated_at=timezone.now() - timedelta(days=1))
+        stale = http_date((timezone.now() - timedelta(hours=1)).timestamp())
+        self.aircraft.engines.add(self.engine)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=stale)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_compare_ids_are_not_validated(self):
+        """Test malformed compare requests still return their 400"""
+        response = self.client.get(reverse('aircraft-compare'), {'ids': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn('ETag', response)
@@ -0,0 +1,235 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase
+from decimal import Decimal
+from .cache import get_data_version
+from .models import Manufacturer, Engine, Aircraft, AircraftCorrection
+
+
+def catalogue_state():
+    """Everything the seed command writes, minus ids and timestamps"""
+    return {
+        'manufacturers': list(Manufacturer.objects.order_by('name').values_list('name', 'is_currently_manufacturing')),
+        'engines': list(Engine.objects.order_by('manufacturer', 'model').values(
+            'manufacturer', 'model', 'horsepower', 'fuel_type', 'engine_type', 'thrust_pounds', 'displacement_liters'
+        )),
+        'aircraft': list(Aircraft.objects.order_by('manufacturer__name', 'model').values(
+            'manufacturer__name', 'model', 'clean_stall_speed', 'top_speed', 'cruise_speed', 'vne_speed',
+            'max_takeoff_weight', 'certification_date', 'sport_pilot_eligible', 'is_mosaic_compliant'
+        )),
+        'links': sorted(Aircraft.engines.through.objects.values_list(
+            'aircraft__manufacturer__name', 'aircraft__model', 'engine__manufacturer', 'engine__model'
+        )),
+    }
+
+
+class SeedCommandTest(TestCase):
+    """Test cases for the seed management command"""
+
+    def seed(self, *args):
+        output = StringIO()
+        call_command('seed', *args, stdout=output)
+        return output.getvalue()
+
+    def test_bulk_mode_matches_default_mode(self):
+        """Test --bulk writes exactly what the row-by-row path writes"""
+        self.seed()
+        expected = catalogue_state()
+        Aircraft.objects.all().delete()
+        Engine.objects.all().delete()
+        Manufacturer.objects.all().delete()
+
+        output = self.seed('--bulk')
+        self.assertEqual(catalogue_state(), expected)
+        self.assertIn(f"with {len(expected['aircraft'])} aircraft entries", output)
+        self.assertIn('Upserted', output)
+
+    def test_bulk_mode_is_idempotent(self):
+        """Test re-running --bulk creates nothing new and keeps values it doesn't define"""
+        self.seed('--bulk')
+        state = catalogue_state()
+
+        # cruise_speed is maintained by update_cruise_speeds for aircraft the
+        # seed data has no value for
+        aircraft = Aircraft.objects.filter(cruise_speed__isnull=True).first()
+        Aircraft.objects.filter(pk=aircraft.pk).update(cruise_speed=Decimal('101.0'))
+
+        version = get_data_version()
+        output = self.seed('--bulk')
+        self.assertIn('with 0 aircraft entries', output)
+        self.assertEqual(Aircraft.objects.get(pk=aircraft.pk).cruise_speed, Decimal('101.0'))
+        self.assertEqual(Aircraft.objects.count(), len(state['aircraft']))
+        self.assertEqual(Aircraft.engines.through.objects.count(), len(state['links']))
+        self.assertNotEqual(get_data_version(), version)
+
+    def test_bulk_mode_uses_few_queries(self):
+        """Test --bulk does not issue per-aircraft queries"""
+        with CaptureQueriesContext(connection) as context:
+            self.seed('--bulk')
+        self.assertLess(len(context.captured_queries), 100)
+        self.assertGreater(Aircraft.objects.count(), 100)
+
+
+class UpdateMosaicAircraftCommandTest(TestCase):
+    """Test cases for the diff-based update_mosaic_aircraft sync"""
+
+    def sync(self):
+        output = StringIO()
+        call_command('update_mosaic_aircraft', stdout=output)
+        return output.getvalue()
+
+    def test_rerun_changes_nothing(self):
+        """Test a second run finds every row unchanged and keeps primary keys"""
+        self.sync()
+        ids = dict(Aircraft.objects.values_list('model', 'pk'))
+        output = self.sync()
+        self.assertIn('Aircraft: 0 inserted, 0 updated, 25 unchanged, 0 deleted', output)
+        self.assertIn('Engine links: 0 added, 0 removed', output)
+        self.assertEqual(dict(Aircraft.objects.values_list('model', 'pk')), ids)
+
+    def test_only_differences_are_applied(self):
+        """Test changed rows are updated in place and rows outside the dataset are removed"""
+        self.sync()
+        cessna = Manufacturer.objects.get(name='Cessna')
+        aircraft = Aircraft.objects.get(manufacturer=cessna, model='150')
+        correction = AircraftCorrection.objects.create(
+            aircraft=aircraft, field_name='top_speed', suggested_value='110', reason='POH'
+        )
+        Aircraft.objects.filter(pk=aircraft.pk).update(top_speed=Decimal('1.0'), vne_speed=Decimal('138.0'))
+        aircraft.engines.clear()
+        stray = Aircraft.objects.create(
+            manufacturer=cessna,
+            model='Not In Dataset',
+            clean_stall_speed=Decimal('50.0'),
+            top_speed=Decimal('100.0'),
+            maneuvering_speed=Decimal('90.0')
+        )
+
+        version = get_data_version()
+        output = self.sync()
+        self.assertIn('Aircraft: 0 inserted, 1 updated, 24 unchanged, 1 deleted', output)
+        self.assertIn('Engine links: 1 added, 0 removed', output)
+        self.assertNotEqual(get_data_version(), version)
+
+        aircraft.refresh_from_db()
+        self.assertEqual(aircraft.top_speed, Decimal('109.0'))
+        # Columns the dataset doesn't define are left alone
+        self.assertEqual(aircraft.vne_speed, Decimal('138.0'))
+        self.assertEqual(aircraft.engines.count(), 1)
+        self.assertTrue(AircraftCorrection.objects.filter(pk=correction.pk).exists())
+        self.assertFalse(Aircraft.objects.filter(pk=stray.pk).exists())
+
+
+class UpdateCruiseSpeedsCommandTest(TestCase):
+    """Test cases for the batched update_cruise_speeds command"""
+
+    def setUp(self):
+        self.cessna = Manufacturer.objects.create(name='Cessna')
+        for model in ['150', '152', '170', 'Unknown Model']:
+            Aircraft.objects.create(
+                manufacturer=self.cessna,
+                model=model,
+                clean_stall_speed=Decimal('48.0'),
+                top_speed=Decimal('109.0'),
+                maneuvering_speed=Decimal('97.0'),
+                cruise_speed=Decimal('99.0') if model == '152' else None
+            )
+
+    def test_updates_are_batched(self):
+        """Test aircraft are read once and written with one UPDATE per batch"""
+        output = StringIO()
+        version = get_data_version()
+        with CaptureQueriesContext(connection) as context:
+            call_command('update_cruise_speeds', '--batch-size', '1', stdout=output)
+        aircraft_queries = [q['sql'] for q in context.captured_queries if '"aircraft"' in q['sql']]
+        # One SELECT, then one UPDATE for each of the two batches
+        self.assertEqual(len(aircraft_queries), 3)
+        self.assertNotEqual(get_data_version(), version)
+
+        speeds = dict(Aircraft.objects.values_list('model', 'cruise_speed'))
+        self.assertEqual(speeds['150'], Decimal('96.0'))
+        self.assertEqual(speeds['152'], Decimal('99.0'))
+        self.assertEqual(speeds['170'], Decimal('100.0'))
+        self.assertIsNone(speeds['Unknown Model'])
+
+        output = output.getvalue()
+        self.assertIn('Aircraft updated: 2', output)
+        self.assertIn('Aircraft without data: 1', output)
+        self.assertIn('No aircraft found for cruise speed data: Cessna 172N', output)
+
+
+class RefreshDerivedFieldsCommandTest(TestCase):
+    """Test cases for the refresh_derived_fields backfill command"""
+
+    def setUp(self):
+        self.aircraft = Aircraft.objects.create(
+            manufacturer=Manufacturer.objects.create(name='Cessna'),
+            model='150',
+            clean_stall_speed=Decimal('48.0'),
+            top_speed=Decimal('109.0'),
+            maneuvering_speed=Decimal('97.0')
+        )
+
+    def refresh(self):
+        output = StringIO()
+        call_command('refresh_derived_fields', stdout=output)
+        return output.getvalue()
+
+    def test_stale_rows_are_recomputed(self):
+        """Test rows written without save() get their derived columns fixed"""
+        Aircraft.objects.filter(pk=self.aircraft.pk).update(
+            clean_stall_speed=Decimal('60.0'), top_speed=Decimal('210.0'), eligibility_badges=[], speed_range=''
+        )
+        version = get_data_version()
+        self.assertIn('1 aircraft updated', self.refresh())
+        self.assertNotEqual(get_data_version(), version)
+
+        self.aircraft.refresh_from_db()
+        self.assertFalse(self.aircraft.sport_pilot_eligible)
+        self.assertEqual(self.aircraft.eligibility_badges, ['Private Pilot', 'MOSAIC Eligible'])
+        self.assertEqual(self.aircraft.performance_category, 'High Performance')
+        self.assertEqual(self.aircraft.speed_range, 'High Performance')
+
+        self.assertIn('0 aircraft updated', self.refresh())
+
+
+class BenchmarkQueriesCommandTest(TestCase):
+    """Test cases for the benchmark_queries EXPLAIN command"""
+
+    def setUp(self):
+        cessna = Manufacturer.objects.create(name='Cessna')
+        for model, stall, top, seats in [('150', '48.0', '109.0', 2), ('182', '60.0', '145.0', 4)]:
+            Aircraft.objects.create(
+                manufacturer=cessna,
+                model=model,
+                clean_stall_speed=Decimal(stall),
+                top_speed=Decimal(top),
+                maneuvering_speed=Decimal('97.0'),
+                seating_capacity=seats
+            )
+
+    def test_common_queries_use_indexes(self):
+        """Test every query shape is served by an index, with and without the Meta indexes"""
+        output = StringIO()
+        call_command('benchmark_queries', '--check', '--compare', '--repeat', '1', stdout=output)
+        output = output.getvalue()
+        self.assertIn('4 seats, fastest first', output)
+        self.assertIn('without indexes', output)
+        self.assertNotIn('FULL SCAN', output)
+
+        # --compare drops the indexes in a transaction that is rolled back
+        with connection.cursor() as cursor:
+            names = connection.introspection.get_constraints(cursor, 'aircraft').keys()
+        self.assertTrue({index.name for index in Aircraft._meta.indexes} <= names)
+
+    def test_full_scans_fail_check(self):
+        """Test --check reports a query that has to scan the whole table"""
+        shapes = [('unindexed v-speed', {'min_vx_speed': '60', 'ordering': 'model'}, True)]
+        with mock.patch('aircraft.management.commands.benchmark_queries.QUERY_SHAPES', shapes):
+            with self.assertRaisesMessage(CommandError, 'unindexed v-speed'):
+                call_command('benchmark_queries', '--check', '--repeat', '1', stdout=StringIO())
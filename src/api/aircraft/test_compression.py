@@ -0,0 +1,103 @@
+import gzip
+import json
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from decimal import Decimal
+from mosaicplane import middleware
+from mosaicplane.middleware import negotiate_encoding
+from .models import Manufacturer, Aircraft
+
+
+class CompressionMiddlewareTest(APITestCase):
+    """JSON responses are compressed according to Accept-Encoding"""
+
+    def setUp(self):
+        cache.clear()
+        manufacturer = Manufacturer.objects.create(name='Cessna')
+        for number in range(20):
+            Aircraft.objects.create(
+                manufacturer=manufacturer,
+                model=f'1{number:02d}',
+                clean_stall_speed=Decimal('47.0'),
+                top_speed=Decimal('126.0'),
+                maneuvering_speed=Decimal('99.0')
+            )
+
+    def get_list(self, accept_encoding='gzip, deflate', **params):
+        return self.client.get(reverse('aircraft-list'), params, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    def test_gzip_response(self):
+        """Test gzip bodies decode to the uncompressed JSON"""
+        plain = self.get_list(accept_encoding='')
+        response = self.get_list()
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))), 20)
+
+    def test_uncompressed_responses(self):
+        """Test clients without gzip, small bodies and non-JSON responses are left alone"""
+        for accept_encoding in ['', 'identity', 'gzip;q=0', 'br;q=1, *;q=0']:
+            response = self.get_list(accept_encoding=accept_encoding)
+            self.assertFalse(response.has_header('Content-Encoding'), accept_encoding)
+            self.assertIn('Accept-Encoding', response['Vary'])
+            self.assertEqual(len(json.loads(response.content)), 20)
+
+        small = self.client.get(reverse('manufacturer-list'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(small.has_header('Content-Encoding'))
+        with override_settings(API_COMPRESSION_MIN_SIZE=1):
+            small = self.client.get(reverse('manufacturer-list'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(small['Content-Encoding'], 'gzip')
+
+        html = self.client.get('/admin/login/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(html.has_header('Content-Encoding'))
+
+    def test_weak_etag_revalidates(self):
+        """Test compressed responses carry a weak ETag that still answers If-None-Match"""
+        response = self.get_list()
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        not_modified = self.client.get(
+            reverse('aircraft-list'), HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_precompressed_variants_are_cached(self):
+        """Test cached responses are compressed once per data version"""
+        with mock.patch.object(middleware, 'compress', wraps=middleware.compress) as compress:
+            first = self.get_list()
+            second = self.get_list(omit='engines')
+            third = self.get_list()
+            self.assertEqual(compress.call_count, 2)
+            self.assertEqual(third.content, first.content)
+            self.assertNotEqual(second.content, first.content)
+
+            aircraft = Aircraft.objects.get(model='100')
+            aircraft.top_speed = Decimal('130.0')
+            aircraft.save()
+            fourth = self.get_list()
+            self.assertEqual(compress.call_count, 3)
+            self.assertNotEqual(gzip.decompress(fourth.content), gzip.decompress(first.content))
+
+    def test_negotiation(self):
+        """Test q-values and wildcards pick the encoding"""
+        self.assertEqual(negotiate_encoding('gzip, deflate, br'), 'br' if middleware.brotli else 'gzip')
+        self.assertEqual(negotiate_encoding('GZIP;Q=0.5'), 'gzip')
+        self.assertEqual(negotiate_encoding('*'), 'br' if middleware.brotli else 'gzip')
+        self.assertEqual(negotiate_encoding('br;q=0.4, gzip;q=0.8'), 'gzip')
+        self.assertIsNone(negotiate_encoding('gzip;q=0'))
+        self.assertIsNone(negotiate_encoding('deflate, identity'))
+        self.assertIsNone(negotiate_encoding(''))
+
+    @skipUnless(middleware.brotli, 'brotli is not installed')
+    def test_brotli_response(self):
+        """Test brotli is preferred when the client accepts it"""
+        plain = self.get_list(accept_encoding='')
+        response = self.get_list(accept_encoding='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(middleware.brotli.decompress(response.content), plain.content)
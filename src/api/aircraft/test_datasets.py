@@ -0,0 +1,120 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from decimal import Decimal
+from datetime import date
+from .datasets import DATA_DIR, DatasetError, chunked, clean_aircraft, iter_aircraft, load_document
+from .models import Aircraft, Engine
+
+
+MANIFEST = """
+format: 1
+manufacturers:
+  - {name: Cessna, is_currently_manufacturing: true}
+aircraft_files:
+  - aircraft.yaml
+"""
+
+AIRCRAFT = """
+manufacturer: Cessna
+model: '150'
+clean_stall_speed: 48
+top_speed: 109
+maneuvering_speed: 95
+certification_date: 1958-09-01
+engine: {manufacturer: Continental, model: O-200-A, horsepower: 100, aspiration: normal}
+---
+manufacturer: Cessna
+model: '152'
+clean_stall_speed: 48
+top_speed: 110
+maneuvering_speed: 104
+"""
+
+
+class DatasetTest(TestCase):
+    """Test cases for loading and validating YAML datasets"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = Path(directory.name)
+
+    def write(self, name, content):
+        path = self.dir / name
+        path.write_text(content, encoding='utf-8')
+        return path
+
+    def test_bundled_datasets_are_valid(self):
+        """Test every shipped aircraft record passes validation"""
+        manifest = load_document(DATA_DIR / 'seed.yaml')
+        count = sum(
+            1 for filename in manifest['aircraft_files']
+            for _ in iter_aircraft(DATA_DIR / filename)
+        )
+        self.assertGreater(count, 100)
+        mosaic = load_document(DATA_DIR / 'mosaic_aircraft.yaml')
+        for index, data in enumerate(mosaic['aircraft'], 1):
+            clean_aircraft(data, f'aircraft {index}')
+
+    def test_records_are_converted_to_field_types(self):
+        """Test YAML scalars become the model's Python types"""
+        record = next(iter_aircraft(self.write('aircraft.yaml', AIRCRAFT)))
+        self.assertEqual(record.values['clean_stall_speed'], Decimal('48'))
+        self.assertEqual(record.values['certification_date'], date(1958, 9, 1))
+        self.assertEqual(record.engine_key, ('Continental', 'O-200-A'))
+        self.assertNotIn('aspiration', record.engine)
+
+    def test_records_are_streamed(self):
+        """Test records before a malformed document are yielded before the error"""
+        path = self.write('aircraft.yaml', AIRCRAFT + '---\nmodel: [unclosed\n')
+        records = iter_aircraft(path)
+        self.assertEqual([r.model for r in next(chunked(records, 2))], ['150', '152'])
+        with self.assertRaises(DatasetError):
+            next(records)
+
+    def test_invalid_records_name_their_source(self):
+        """Test missing, unknown and malformed fields are reported with the record number"""
+        first, second = AIRCRAFT.split('---')
+        cases = [
+            ('clean_stall_speed: 48', '', 'record 2: missing field(s): clean_stall_speed'),
+            ('top_speed: 110', 'top_speed: 110\nwingspan: 33', 'record 2: unknown field(s): wingspan'),
+            ('top_speed: 110', 'top_speed: fast', 'record 2: top_speed'),
+        ]
+        for old, new, message in cases:
+            with self.subTest(message=message):
+                path = self.write('aircraft.yaml', first + '---' + second.replace(old, new))
+                with self.assertRaisesMessage(DatasetError, f'aircraft.yaml {message}'):
+                    list(iter_aircraft(path))
+
+    def test_seed_custom_dataset(self):
+        """Test seed --dataset loads a manifest in chunks and rejects bad data"""
+        self.write('aircraft.yaml', AIRCRAFT)
+        manifest = self.write('seed.yaml', MANIFEST)
+        for args in ([], ['--bulk', '--chunk-size', '1']):
+            with self.subTest(args=args):
+                Aircraft.objects.all().delete()
+                call_command('seed', '--dataset', manifest, *args, stdout=StringIO())
+                self.assertEqual(
+                    list(Aircraft.objects.order_by('model').values_list('model', flat=True)), ['150', '152']
+                )
+                self.assertEqual(Engine.objects.get().aircraft.get().model, '150')
+
+        self.write('aircraft.yaml', AIRCRAFT.replace('manufacturer: Cessna', 'manufacturer: Piper', 1))
+        with self.assertRaisesMessage(CommandError, 'aircraft.yaml record 1'):
+            call_command('seed', '--dataset', manifest, '--bulk', stdout=StringIO())
+
+    def test_missing_dataset(self):
+        """Test an unreadable dataset is a CommandError, not a traceback"""
+        with self.assertRaisesMessage(CommandError, 'Cannot read dataset'):
+            call_command('update_cruise_speeds', '--dataset', self.dir / 'missing.yaml', stdout=StringIO())
+
+    def test_malformed_cruise_speed_entry(self):
+        """Test cruise speed entries must be [manufacturer, model, speed]"""
+        path = self.write('cruise.yaml', 'format: 1\ncruise_speeds:\n  - [Cessna, "150", 96]\n  - [Cessna, "152"]\n')
+        with self.assertRaisesMessage(CommandError, 'cruise.yaml entry 2'):
+            call_command('update_cruise_speeds', '--dataset', path, stdout=StringIO())
@@ -0,0 +1,141 @@
+from io import StringIO
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from decimal import Decimal
+from datetime import date
+from .fast_serializers import ValuesSerializer
+from .models import Manufacturer, Engine, Aircraft
+from .serializers import AircraftSerializer, AircraftDetailSerializer, AircraftListSerializer
+
+
+def create_catalogue():
+    """Aircraft covering nulls, images, several engines and several manufacturers"""
+    cessna = Manufacturer.objects.create(name='Cessna', logo='https://example.com/cessna.png')
+    piper = Manufacturer.objects.create(name='Piper', is_currently_manufacturing=False)
+    lycoming = Engine.objects.create(
+        manufacturer='Lycoming', model='O-320-E2A', horsepower=150, displacement_liters=Decimal('5.24')
+    )
+    rotax = Engine.objects.create(manufacturer='Rotax', model='912ULS', horsepower=100, fuel_type='MOGAS')
+    c172 = Aircraft.objects.create(
+        manufacturer=cessna,
+        model='172',
+        clean_stall_speed=Decimal('47.0'),
+        top_speed=Decimal('126.0'),
+        maneuvering_speed=Decimal('99.0'),
+        cruise_speed=Decimal('122.5'),
+        vne_speed=Decimal('163.0'),
+        max_takeoff_weight=2550,
+        certification_date=date(1956, 1, 1),
+        verification_source='POH',
+        image='aircraft_images/172.jpg'
+    )
+    c172.engines.add(rotax, lycoming)
+    c210 = Aircraft.objects.create(
+        manufacturer=cessna,
+        model='210',
+        clean_stall_speed=Decimal('62.0'),
+        top_speed=Decimal('175.0'),
+        maneuvering_speed=Decimal('120.0'),
+        seating_capacity=6,
+        retractable_gear=True,
+        variable_pitch_prop=True
+    )
+    c210.engines.add(lycoming)
+    Aircraft.objects.create(
+        manufacturer=piper,
+        model='Cub',
+        clean_stall_speed=Decimal('38.0'),
+        top_speed=Decimal('76.0'),
+        maneuvering_speed=Decimal('70.0')
+    )
+
+
+class ValuesSerializerTest(TestCase):
+    """ValuesSerializer output must match the DRF serializers byte for byte"""
+
+    def setUp(self):
+        create_catalogue()
+        self.request = Request(APIRequestFactory().get('/v1/aircraft/'))
+
+    def assertSameOutput(self, serializer_class, queryset, related_querysets=None, **kwargs):
+        expected = serializer_class(queryset, many=True, **kwargs).data
+        fast = ValuesSerializer(serializer_class(**kwargs), related_querysets).render(queryset)
+        self.assertEqual(JSONRenderer().render(fast), JSONRenderer().render(expected))
+        return fast
+
+    def test_list_parity(self):
+        """Test the list serializers, with and without a request for image URLs"""
+        data = self.assertSameOutput(AircraftSerializer, Aircraft.objects.for_api(), context={'request': self.request})
+        self.assertEqual(data[0]['image'], 'http://testserver/media/aircraft_images/172.jpg')
+        self.assertEqual([engine['model'] for engine in data[0]['engines']], ['O-320-E2A', '912ULS'])
+        self.assertSameOutput(AircraftSerializer, Aircraft.objects.for_api())
+        self.assertSameOutput(AircraftListSerializer, Aircraft.objects.for_api())
+
+    def test_sparse_parity(self):
+        """Test field selections carry over to the fast path"""
+        queryset = Aircraft.objects.for_api().order_by('-top_speed')
+        data = self.assertSameOutput(AircraftSerializer, queryset, fields=['model', 'engines', 'updated_at'])
+        self.assertEqual(list(data[0]), ['model', 'engines', 'updated_at'])
+        self.assertSameOutput(AircraftSerializer, queryset, omit=['engines'])
+
+    def test_detail_parity(self):
+        """Test nested manufacturers with annotated counts and method fields"""
+        self.assertSameOutput(
+            AircraftDetailSerializer,
+            Aircraft.objects.for_detail_api(),
+            {'manufacturer': Manufacturer.objects.with_aircraft_count()}
+        )
+
+    def test_unsupported_field(self):
+        """Test fields without a fast path are refused up front"""
+        class LinkedSerializer(serializers.ModelSerializer):
+            url = serializers.HyperlinkedIdentityField(view_name='aircraft-detail')
+
+            class Meta:
+                model = Aircraft
+                fields = ['id', 'url']
+
+        with self.assertRaises(ImproperlyConfigured):
+            ValuesSerializer(LinkedSerializer())
+
+
+class FastEndpointParityTest(APITestCase):
+    """Endpoints answer identically with API_FAST_SERIALIZERS on and off"""
+
+    def setUp(self):
+        create_catalogue()
+
+    def test_endpoints_match(self):
+        """Test list, compact, search, compare and manufacturer aircraft responses"""
+        ids = ','.join(str(pk) for pk in Aircraft.objects.values_list('pk', flat=True))
+        cessna = Manufacturer.objects.get(name='Cessna')
+        requests = [
+            (reverse('aircraft-list'), {}),
+            (reverse('aircraft-list'), {'compact': 'true'}),
+            (reverse('aircraft-list'), {'search': 'cessna', 'fields': 'id,model'}),
+            (reverse('aircraft-compare'), {'ids': ids}),
+            (reverse('manufacturer-aircraft', kwargs={'pk': cessna.pk}), {}),
+        ]
+        for url, params in requests:
+            with override_settings(API_FAST_SERIALIZERS=False):
+                expected = self.client.get(url, params)
+            # Different query string, so the response cache can't answer
+            params['_'] = 'fast'
+            with override_settings(API_FAST_SERIALIZERS=True):
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, expected.content, (url, params))
+
+    def test_benchmark_command(self):
+        """Test benchmark_serializers checks parity and reports timings"""
+        output = StringIO()
+        call_command('benchmark_serializers', '--repeat', '2', stdout=output)
+        self.assertIn('aircraft list', output.getvalue())
+        self.assertIn('x faster', output.getvalue())
@@ -0,0 +1,66 @@
+import runpy
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase
+from decimal import Decimal
+from feature_flags import snapshot
+from feature_flags.models import FeatureFlag
+from . import suggest
+from .models import Manufacturer, Aircraft
+
+GUNICORN_CONFIG = str(settings.BASE_DIR / 'gunicorn.conf.py')
+
+
+def load_config(**environ):
+    with mock.patch.dict('os.environ', environ):
+        return runpy.run_path(GUNICORN_CONFIG)
+
+
+class GunicornConfigTest(TestCase):
+    """gunicorn.conf.py picks the worker class and application from the environment"""
+
+    def test_worker_classes(self):
+        """Test each GUNICORN_WORKER_CLASS serves the matching application"""
+        config = load_config()
+        self.assertEqual(config['worker_class'], 'uvicorn_worker.UvicornWorker')
+        self.assertEqual(config['wsgi_app'], 'mosaicplane.asgi:application')
+        self.assertTrue(config['preload_app'])
+
+        config = load_config(GUNICORN_WORKER_CLASS='gthread', GUNICORN_THREADS='8', WEB_CONCURRENCY='3')
+        self.assertEqual((config['worker_class'], config['threads'], config['workers']), ('gthread', 8, 3))
+        self.assertEqual(config['wsgi_app'], 'mosaicplane.wsgi:application')
+
+        self.assertFalse(load_config(GUNICORN_PRELOAD='False')['preload_app'])
+        with self.assertRaises(RuntimeError):
+            load_config(GUNICORN_WORKER_CLASS='eventlet')
+
+    def test_post_worker_init_warms_caches(self):
+        """Test a new worker loads the flag snapshot and suggest index, and survives a failure"""
+        Aircraft.objects.create(
+            manufacturer=Manufacturer.objects.create(name='Cessna'),
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0')
+        )
+        FeatureFlag.objects.create(feature_key='ads_enabled', enabled=False)
+        snapshot.clear()
+        suggest.clear()
+        self.addCleanup(snapshot.clear)
+        self.addCleanup(suggest.clear)
+        post_worker_init = load_config()['post_worker_init']
+
+        worker = mock.Mock()
+        with mock.patch('django.db.connections.close_all'):
+            post_worker_init(worker)
+        with self.assertNumQueries(0):
+            self.assertEqual(snapshot.get_snapshot().enabled, {'ads_enabled': False})
+            self.assertEqual(len(suggest.get_index().suggest('cess')), 1)
+        worker.log.warning.assert_not_called()
+
+        snapshot.clear()
+        with mock.patch.object(snapshot, 'get_snapshot', side_effect=RuntimeError('down')), \
+                mock.patch('django.db.connections.close_all'):
+            post_worker_init(worker)
+        worker.log.warning.assert_called_once()
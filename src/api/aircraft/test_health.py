@@ -0,0 +1,88 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import Client, TestCase, override_settings
+from decimal import Decimal
+from mosaicplane import health
+from .models import Manufacturer, Aircraft
+
+
+class HealthCheckTest(TestCase):
+    """/healthz and /readyz answer ahead of the middleware stack"""
+
+    def setUp(self):
+        health.clear()
+        self.addCleanup(health.clear)
+
+    def seed(self):
+        Aircraft.objects.create(
+            manufacturer=Manufacturer.objects.create(name='Cessna'),
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0')
+        )
+
+    def test_liveness(self):
+        """Test /healthz answers without touching the database"""
+        with self.assertNumQueries(0):
+            response = self.client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
+        self.assertEqual(response['Cache-Control'], 'no-store')
+        self.assertEqual(self.client.head('/healthz/').status_code, 200)
+        self.assertEqual(self.client.post('/healthz').status_code, 405)
+
+    def test_readiness(self):
+        """Test /readyz reports each check and fails until aircraft are seeded"""
+        response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'unavailable')
+        self.assertEqual(response.json()['checks']['seed_data'], 'error: no aircraft loaded')
+
+        self.seed()
+        health.clear()
+        response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'status': 'ok',
+            'checks': {'database': 'ok', 'migrations': 'ok', 'seed_data': 'ok', 'cache': 'ok'},
+        })
+
+    def test_readiness_is_cached(self):
+        """Test repeated probes reuse the result until HEALTH_CHECK_CACHE_TTL expires"""
+        self.seed()
+        self.client.get('/readyz')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/readyz').status_code, 200)
+        with override_settings(HEALTH_CHECK_CACHE_TTL=0):
+            with mock.patch.object(health, 'check_seed_data', side_effect=RuntimeError('gone')):
+                with mock.patch.dict(health.READINESS_CHECKS, seed_data=health.check_seed_data):
+                    self.assertEqual(self.client.get('/readyz').status_code, 503)
+
+    def test_database_down(self):
+        """Test the remaining checks are skipped when the database is unreachable"""
+        with mock.patch.dict(health.READINESS_CHECKS, database=mock.Mock(side_effect=OSError('refused'))):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['checks'], {'database': 'error: refused'})
+
+    def test_bypasses_ssl_redirect_and_host_validation(self):
+        """Test in-container probes over plain HTTP with an unlisted Host header"""
+        self.seed()
+        with override_settings(SECURE_SSL_REDIRECT=True, ALLOWED_HOSTS=['mosaicplane.info']):
+            client = Client(HTTP_HOST='localhost:8000')
+            self.assertEqual(client.get('/healthz').status_code, 200)
+            self.assertEqual(client.get('/readyz').status_code, 200)
+            self.assertEqual(client.get('/v1/aircraft/').status_code, 400)
+
+    async def test_async_middleware(self):
+        """Test the probes under ASGI, where the readiness checks run in a thread"""
+        response = await self.async_client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
+        self.assertEqual((await self.async_client.post('/readyz')).status_code, 405)
+        self.assertEqual((await self.async_client.get('/readyz')).status_code, 503)
+        await sync_to_async(self.seed)()
+        health.clear()
+        self.assertEqual((await self.async_client.get('/readyz')).status_code, 200)
@@ -0,0 +1,115 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from decimal import Decimal
+from unittest import mock
+from .models import Manufacturer, Aircraft
+from .pagination import AircraftPagination
+
+
+class AircraftKeysetPaginationTest(APITestCase):
+    """Test cases for opt-in keyset pagination on /api/aircraft/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        manufacturers = [
+            Manufacturer.objects.create(name=name) for name in ['Cessna', 'Piper', 'Aeronca']
+        ]
+        cls.cessna = manufacturers[0]
+        for i in range(23):
+            Aircraft.objects.create(
+                manufacturer=manufacturers[i % 3],
+                model=f"Model-{i:02d}",
+                # Few distinct values so ties must be broken by the primary key
+                clean_stall_speed=Decimal('40.0') + (i % 4),
+                top_speed=Decimal('100.0') + (i % 5),
+                maneuvering_speed=Decimal('90.0'),
+                # Every third aircraft has no published MTOW
+                max_takeoff_weight=None if i % 3 == 0 else 1200 + (i % 6) * 100,
+            )
+
+    def walk(self, params):
+        """Follow `next` links until exhausted, returning every page"""
+        url = reverse('aircraft-list')
+        response = self.client.get(url, params)
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            page = response.json()
+            pages.append(page['results'])
+            if not page['next']:
+                return pages
+            response = self.client.get(page['next'])
+
+    def test_unpaginated_by_default(self):
+        """Test the list stays a plain array when no pagination params are sent"""
+        response = self.client.get(reverse('aircraft-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 23)
+
+    def test_page_size_limits_results(self):
+        """Test page_size returns a page and a next cursor"""
+        response = self.client.get(reverse('aircraft-list'), {'page_size': 5})
+        data = response.json()
+        self.assertEqual(len(data['results']), 5)
+        self.assertIn('cursor=', data['next'])
+
+    def test_walking_pages_visits_every_row_once(self):
+        """Test following cursors returns each aircraft exactly once for each ordering"""
+        orderings = [
+            None,
+            'clean_stall_speed',
+            '-top_speed',
+            'max_takeoff_weight',
+            '-max_takeoff_weight',
+            'manufacturer__name',
+            '-manufacturer__name,clean_stall_speed',
+        ]
+        expected_ids = set(Aircraft.objects.values_list('id', flat=True))
+        for ordering in orderings:
+            with self.subTest(ordering=ordering):
+                params = {'page_size': 4}
+                if ordering:
+                    params['ordering'] = ordering
+                pages = self.walk(params)
+                ids = [a['id'] for page in pages for a in page]
+                self.assertEqual(len(ids), len(expected_ids))
+                self.assertEqual(set(ids), expected_ids)
+                self.assertEqual(len(pages), 6)
+
+    def test_pages_follow_requested_ordering(self):
+        """Test rows come back in the requested order with NULLs last"""
+        pages = self.walk({'page_size': 4, 'ordering': '-max_takeoff_weight'})
+        weights = [a['max_takeoff_weight'] for page in pages for a in page]
+        present = [w for w in weights if w is not None]
+        self.assertEqual(present, sorted(present, reverse=True))
+        self.assertEqual(weights[len(present):], [None] * (len(weights) - len(present)))
+
+    def test_pagination_composes_with_filters(self):
+        """Test filters apply to every page"""
+        pages = self.walk({'page_size': 2, 'manufacturer': self.cessna.id, 'ordering': '-clean_stall_speed'})
+        names = {a['manufacturer_name'] for page in pages for a in page}
+        self.assertEqual(names, {'Cessna'})
+        self.assertEqual(sum(len(page) for page in pages), 8)
+
+    def test_pages_do_not_use_offset(self):
+        """Test deep pages are fetched by key, not with OFFSET"""
+        first = self.client.get(reverse('aircraft-list'), {'page_size': 10}).json()
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(first['next'])
+        for query in context.captured_queries:
+            self.assertNotIn('OFFSET', query['sql'].upper())
+
+    def test_page_size_is_capped(self):
+        """Test page_size cannot exceed the configured maximum"""
+        with mock.patch.object(AircraftPagination, 'max_page_size', 5):
+            response = self.client.get(reverse('aircraft-list'), {'page_size': 100})
+        self.assertEqual(len(response.json()['results']), 5)
+
+    def test_invalid_cursor(self):
+        """Test a tampered cursor is rejected"""
+        response = self.client.get(reverse('aircraft-list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,149 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from decimal import Decimal
+from .models import Manufacturer, Engine, Aircraft, AircraftQuerySet
+
+
+class QueryCountHarness:
+    """
+    Helpers for pinning an endpoint's query count to a constant.
+
+    The endpoint is requested once against a small fleet to record its query
+    count, the fleet is then grown, and the same request must issue exactly
+    as many queries again.
+    """
+
+    def create_fleet(self, size, manufacturers=None):
+        """Create `size` aircraft spread over manufacturers, each with two engines"""
+        manufacturers = manufacturers or [self.manufacturer]
+        fleet = []
+        start = Aircraft.objects.count()
+        for i in range(start, start + size):
+            aircraft = Aircraft.objects.create(
+                manufacturer=manufacturers[i % len(manufacturers)],
+                model=f"Model-{i}",
+                clean_stall_speed=Decimal('45.0') + (i % 15),
+                top_speed=Decimal('110.0') + i,
+                maneuvering_speed=Decimal('90.0'),
+            )
+            engine_a, _ = Engine.objects.get_or_create(
+                manufacturer='Lycoming', model=f"O-{i}-A", defaults={'horsepower': 100 + i % 100}
+            )
+            engine_b, _ = Engine.objects.get_or_create(
+                manufacturer='Rotax', model=f"9{i}", defaults={'horsepower': 100}
+            )
+            aircraft.engines.add(engine_a, engine_b)
+            fleet.append(aircraft)
+        return fleet
+
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, url, grow, params=None):
+        """Assert `url` costs the same number of queries before and after calling `grow()`"""
+        baseline = self.count_queries(url, params)
+        grow()
+        with self.assertNumQueries(baseline):
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+
+class AircraftQueryCountTest(QueryCountHarness, APITestCase):
+    """Aircraft endpoints must not issue per-row queries for nested engines"""
+
+    def setUp(self):
+        self.manufacturer = Manufacturer.objects.create(name="Cessna")
+        self.other_manufacturer = Manufacturer.objects.create(name="Piper")
+        self.create_fleet(2)
+
+    def test_list_query_count_is_constant(self):
+        """Test GET /api/aircraft/ query count does not grow with the fleet"""
+        url = reverse('aircraft-list')
+        response = self.assertConstantQueries(
+            url, lambda: self.create_fleet(20, [self.manufacturer, self.other_manufacturer])
+        )
+        data = response.json()
+        self.assertEqual(len(data), 22)
+        self.assertTrue(all(len(a['engines']) == 2 for a in data))
+
+    def test_filtered_list_query_count_is_constant(self):
+        """Test filtered and ordered listings keep the prefetch"""
+        url = reverse('aircraft-list')
+        params = {'sport_pilot_eligible': True, 'ordering': '-top_speed'}
+        self.assertConstantQueries(url, lambda: self.create_fleet(15), params)
+
+    def test_manufacturer_aircraft_query_count_is_constant(self):
+        """Test GET /api/manufacturers/{id}/aircraft/ query count does not grow"""
+        url = reverse('manufacturer-aircraft', kwargs={'pk': self.manufacturer.id})
+        response = self.assertConstantQueries(url, lambda: self.create_fleet(10))
+        self.assertEqual(len(response.json()), 12)
+
+    def test_sparse_list_query_count_is_constant(self):
+        """Test ?compact= and ?fields= lists load only what they render"""
+        url = reverse('aircraft-list')
+        for params in [
+            {'compact': 'true'},
+            {'fields': 'id,model', 'ordering': '-top_speed', 'page_size': 5},
+            {'fields': 'model,engines', 'ordering': 'manufacturer__name', 'page_size': 5},
+        ]:
+            self.assertConstantQueries(url, lambda: self.create_fleet(5), params)
+        # Without engines in the payload the engine prefetch is skipped
+        self.assertEqual(self.count_queries(url, {'compact': 'true'}) + 1, self.count_queries(url))
+
+    def test_deferred_fields_are_not_serialized(self):
+        """Test columns deferred by for_api() are not needed by the serializer"""
+        url = reverse('aircraft-list')
+        data = self.client.get(url).json()
+        for field in AircraftQuerySet.API_DEFERRED_FIELDS:
+            self.assertNotIn(field, data[0])
+
+    def test_compare_query_count_is_constant(self):
+        """Test GET /api/aircraft/compare/ query count does not grow with the ids compared"""
+        url = reverse('aircraft-compare')
+        ids = lambda: ','.join(str(pk) for pk in Aircraft.objects.values_list('id', flat=True))
+        baseline = self.count_queries(url, {'ids': ids()})
+        self.create_fleet(12, [self.manufacturer, self.other_manufacturer])
+        params = {'ids': ids()}
+        with self.assertNumQueries(baseline):
+            response = self.client.get(url, params)
+        data = response.json()
+        self.assertEqual(len(data), 14)
+        counts = {a['manufacturer']['name']: a['manufacturer']['aircraft_count'] for a in data}
+        self.assertEqual(counts, {'Cessna': 8, 'Piper': 6})
+
+
+class ManufacturerQueryCountTest(QueryCountHarness, APITestCase):
+    """Manufacturer listings must compute aircraft_count in SQL"""
+
+    def setUp(self):
+        self.manufacturer = Manufacturer.objects.create(name="Cessna")
+        self.create_fleet(3)
+
+    def add_manufacturers(self, count):
+        for i in range(count):
+            manufacturer = Manufacturer.objects.create(name=f"Manufacturer-{i}")
+            self.create_fleet(i + 1, [manufacturer])
+
+    def test_list_query_count_is_constant(self):
+        """Test GET /api/manufacturers/ query count does not grow with manufacturers"""
+        url = reverse('manufacturer-list')
+        response = self.assertConstantQueries(url, lambda: self.add_manufacturers(6))
+        counts = {m['name']: m['aircraft_count'] for m in response.json()}
+        self.assertEqual(counts['Cessna'], 3)
+        self.assertEqual(counts['Manufacturer-5'], 6)
+
+    def test_admin_changelist_query_count_is_constant(self):
+        """Test the manufacturer admin changelist annotates aircraft_count"""
+        from django.contrib.auth.models import User
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+        url = reverse('admin:aircraft_manufacturer_changelist')
+        response = self.assertConstantQueries(url, lambda: self.add_manufacturers(6))
+        self.assertContains(response, 'Manufacturer-5')
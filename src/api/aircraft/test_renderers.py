@@ -0,0 +1,83 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from decimal import Decimal
+from mosaicplane.renderers import ORJSONRenderer
+from .models import Manufacturer, Aircraft
+
+
+class ORJSONRendererTest(TestCase):
+    """ORJSONRenderer must produce the same bytes as DRF's JSONRenderer"""
+
+    def assertSameBytes(self, data, accepted_media_type=None):
+        expected = JSONRenderer().render(data, accepted_media_type)
+        self.assertEqual(ORJSONRenderer().render(data, accepted_media_type), expected)
+
+    def test_primitives_and_unicode(self):
+        """Test scalars, nesting, non-ASCII text and the U+2028/U+2029 escapes"""
+        self.assertSameBytes({
+            'int': 1, 'negative': -40, 'float': 47.5, 'true': True, 'null': None,
+            'text': 'Ünïcödé ✈ "quoted" \\ \n tab\t', 'separators': 'a\u2028b\u2029c',
+            'list': [1, [2, {'three': 3}]], 'empty': {}, 1: 'int key',
+        })
+        self.assertSameBytes([])
+        self.assertSameBytes('plain string')
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_python_types(self):
+        """Test datetimes, dates, Decimals, UUIDs, lazy strings and error details"""
+        self.assertSameBytes({
+            'utc': datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc),
+            'micro': datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+            'offset': datetime(2025, 7, 1, 12, 0, tzinfo=ZoneInfo('America/Denver')),
+            'naive': datetime(2025, 1, 2, 3, 4, 5),
+            'date': date(1956, 1, 1),
+            'time': time(9, 30),
+            'duration': timedelta(minutes=90),
+            'decimal': Decimal('126.5'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Not found.'),
+            'errors': {'model': [ErrorDetail('This field is required.', code='required')]},
+            'tuple': (1, 2),
+        })
+
+    def test_indent_falls_back(self):
+        """Test pretty-printed responses keep the stdlib renderer's layout"""
+        self.assertSameBytes({'a': [1, 2]}, 'application/json; indent=4')
+
+    def test_api_payloads(self):
+        """Test real aircraft list payloads render identically"""
+        manufacturer = Manufacturer.objects.create(name='Cessna')
+        Aircraft.objects.create(
+            manufacturer=manufacturer,
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0'),
+            certification_date=date(1956, 1, 1)
+        )
+        for url in [reverse('aircraft-list'), reverse('manufacturer-list')]:
+            data = self.client.get(url).data
+            self.assertSameBytes(data)
+
+
+class RendererSettingTest(APITestCase):
+    """API_JSON_RENDERER picks the default renderer"""
+
+    def test_default_renderer(self):
+        """Test responses go through the orjson renderer by default"""
+        self.assertEqual(settings.API_JSON_RENDERER, 'orjson')
+        self.assertEqual(
+            settings.REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'], ['mosaicplane.renderers.ORJSONRenderer']
+        )
+        response = self.client.get(reverse('aircraft-list'))
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response['Content-Type'], 'application/json')
@@ -0,0 +1,159 @@
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, TransactionTestCase, override_settings
+from decimal import Decimal
+from feature_flags.models import FeatureFlag
+from mosaicplane.database import replica_settings
+from . import replica
+from .models import Manufacturer, Aircraft, AircraftCorrection
+
+
+class ReadReplicaTest(TransactionTestCase):
+    """SQLITE_READ_REPLICA serves GET catalogue reads from an immutable snapshot"""
+
+    # Snapshots are taken after commit, so the data must really be committed
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'db.readonly.sqlite3'
+        settings_override = override_settings(SQLITE_REPLICA_PATH=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        Aircraft.objects.create(
+            manufacturer=Manufacturer.objects.create(name='Cessna'),
+            model='172',
+            clean_stall_speed=Decimal('47.0'),
+            top_speed=Decimal('126.0'),
+            maneuvering_speed=Decimal('99.0')
+        )
+
+    def test_refresh_writes_immutable_snapshot(self):
+        """Test the snapshot holds the catalogue and opens with ?immutable=1"""
+        replica.refresh()
+        first = replica.snapshot_id()
+        uri = replica_settings(self.path)['NAME']
+        self.assertTrue(uri.endswith('?mode=ro&immutable=1'))
+        with sqlite3.connect(uri, uri=True) as snapshot:
+            self.assertEqual(snapshot.execute('SELECT model FROM aircraft').fetchall(), [('172',)])
+            self.assertEqual(snapshot.execute('PRAGMA journal_mode').fetchone(), ('delete',))
+            tables = {name for name, in snapshot.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            self.assertNotIn('django_cache', tables)
+            with self.assertRaises(sqlite3.OperationalError):
+                snapshot.execute("UPDATE aircraft SET model = '182'")
+
+        replica.refresh()
+        self.assertNotEqual(replica.snapshot_id(), first)
+        self.assertEqual(sorted(path.name for path in self.path.parent.iterdir()), [self.path.name, f'{self.path.name}.lock'])
+
+    def test_refresh_once_per_transaction(self):
+        """Test catalogue writes refresh the snapshot once after commit, then bump the version again"""
+        calls = []
+        with mock.patch.object(replica, 'is_enabled', return_value=True), \
+                mock.patch.object(replica, 'refresh', side_effect=lambda: calls.append('refresh')), \
+                mock.patch('aircraft.cache._replace_data_version', side_effect=lambda: calls.append('bump')):
+            with transaction.atomic():
+                aircraft = Aircraft.objects.get()
+                aircraft.top_speed = Decimal('130.0')
+                aircraft.save()
+                Manufacturer.objects.create(name='Piper')
+                pre_commit = len(calls)
+            replica.wait_for_refresh()
+        self.assertEqual(calls[:pre_commit], ['bump'] * pre_commit)
+        self.assertEqual(calls.count('refresh'), 1)
+        self.assertEqual(calls.count('bump'), 2 * pre_commit + 1)
+        self.assertEqual(calls[calls.index('refresh') + 1], 'bump')
+
+    def test_refreshes_are_coalesced(self):
+        """Test writes committed while a refresh runs share a single follow-up refresh"""
+        running = threading.Event()
+        release = threading.Event()
+        refreshes = []
+
+        def refresh():
+            refreshes.append(len(refreshes))
+            running.set()
+            release.wait(5)
+
+        callback = mock.Mock()
+        with mock.patch.object(replica, 'refresh', side_effect=refresh):
+            replica.schedule_refresh(callback)
+            running.wait(5)
+            for _ in range(5):
+                replica.schedule_refresh(callback)
+            release.set()
+            replica.wait_for_refresh()
+        self.assertEqual(len(refreshes), 2)
+        self.assertEqual(callback.call_count, 2)
+
+    def test_refresh_after_commit(self):
+        """Test a committed write is in the snapshot"""
+        with mock.patch.object(replica, 'is_enabled', return_value=True):
+            Manufacturer.objects.create(name='Piper')
+            replica.wait_for_refresh()
+        with sqlite3.connect(replica_settings(self.path)['NAME'], uri=True) as snapshot:
+            self.assertEqual(snapshot.execute('SELECT COUNT(*) FROM manufacturers').fetchone(), (2,))
+
+    def test_router(self):
+        """Test only catalogue reads during GET requests go to the snapshot, and writes never do"""
+        router = replica.ReplicaRouter()
+        through = Aircraft.engines.through
+        for model in [Aircraft, Manufacturer, through, AircraftCorrection, FeatureFlag]:
+            self.assertIsNone(router.db_for_read(model))
+        token = replica._reading.set(True)
+        try:
+            for model in [Aircraft, Manufacturer, through]:
+                self.assertEqual(router.db_for_read(model), 'replica')
+                self.assertEqual(router.db_for_write(model), DEFAULT_DB_ALIAS)
+            self.assertIsNone(router.db_for_read(AircraftCorrection))
+            self.assertIsNone(router.db_for_read(FeatureFlag))
+            self.assertIsNone(router.db_for_read(cache.cache_model_class))
+        finally:
+            replica._reading.reset(token)
+        self.assertFalse(router.allow_migrate('replica', 'aircraft'))
+        self.assertIsNone(router.allow_migrate(DEFAULT_DB_ALIAS, 'aircraft'))
+
+    def test_middleware(self):
+        """Test GETs read from the snapshot, creating it on first use and reopening it once replaced"""
+        seen = []
+
+        def view(request):
+            seen.append(replica._reading.get())
+            return HttpResponse()
+
+        snapshot_connection = mock.Mock(spec=['close'])
+        handler = {DEFAULT_DB_ALIAS: connections[DEFAULT_DB_ALIAS], 'replica': snapshot_connection}
+        middleware = replica.ReplicaMiddleware(view)
+        with mock.patch.object(replica, 'connections', handler):
+            middleware(RequestFactory().get('/v1/aircraft/'))
+            self.assertTrue(self.path.exists())
+            middleware(RequestFactory().head('/v1/aircraft/'))
+            self.assertEqual(snapshot_connection.close.call_count, 1)
+            replica.refresh()
+            middleware(RequestFactory().get('/v1/aircraft/'))
+            self.assertEqual(snapshot_connection.close.call_count, 2)
+            middleware(RequestFactory().post('/v1/corrections/'))
+        self.assertEqual(seen, [True, True, True, False])
+        self.assertFalse(replica._reading.get())
+
+    async def test_async_middleware(self):
+        """Test the ASGI path creates the snapshot and marks only GET and HEAD as snapshot reads"""
+        seen = []
+
+        async def view(request):
+            seen.append(replica._reading.get())
+            return HttpResponse()
+
+        middleware = replica.ReplicaMiddleware(view)
+        await middleware(AsyncRequestFactory().get('/v1/aircraft/'))
+        self.assertTrue(self.path.exists())
+        await middleware(AsyncRequestFactory().head('/v1/aircraft/'))
+        await middleware(AsyncRequestFactory().post('/v1/corrections/'))
+        self.assertEqual(seen, [True, True, False])
@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from decimal import Decimal
+from . import search
+from .models import Manufacturer, Engine, Aircraft
+
+
+class AircraftSearchTest(APITestCase):
+    """Test cases for the full-text aircraft search"""
+
+    def setUp(self):
+        self.cessna = Manufacturer.objects.create(name='Cessna')
+        self.piper = Manufacturer.objects.create(name='Piper')
+        self.lycoming = Engine.objects.create(manufacturer='Lycoming', model='O-320-E2A', horsepower=150)
+        self.c172 = self.create_aircraft(self.cessna, '172')
+        self.c172.engines.add(self.lycoming)
+        self.c182 = self.create_aircraft(self.cessna, '182')
+        self.cherokee = self.create_aircraft(self.piper, 'Cherokee 140', verification_source='Compared with the Cessna 150')
+
+    def create_aircraft(self, manufacturer, model, **fields):
+        return Aircraft.objects.create(
+            manufacturer=manufacturer,
+            model=model,
+            clean_stall_speed=Decimal('48.0'),
+            top_speed=Decimal('120.0'),
+            maneuvering_speed=Decimal('97.0'),
+            **fields
+        )
+
+    def search(self, query, **params):
+        response = self.client.get(reverse('aircraft-list'), {'search': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [aircraft['model'] for aircraft in response.json()]
+
+    def test_index_is_available(self):
+        """Test SQLite builds used for development and tests have FTS5"""
+        self.assertIsInstance(search.get_backend(), search.SQLiteBackend)
+        self.assertEqual(sorted(search.search('cessna')), [self.c172.pk, self.c182.pk, self.cherokee.pk])
+
+    def test_search_starts_no_transaction(self):
+        """Test search() outside a transaction doesn't open one (a write lock on SQLite)"""
+        with mock.patch.object(connection, 'in_atomic_block', False), \
+                mock.patch.object(search.transaction, 'atomic') as atomic:
+            self.assertEqual(len(search.search('cessna')), 3)
+        atomic.assert_not_called()
+
+    def test_results_are_ranked(self):
+        """Test manufacturer matches rank above verification source mentions"""
+        results = self.search('cessna')
+        self.assertEqual(sorted(results[:2]), ['172', '182'])
+        self.assertEqual(results[2], 'Cherokee 140')
+        self.assertEqual(self.search('172 cessna'), ['172'])
+        self.assertEqual(self.search('cessna', ordering='-model'), ['Cherokee 140', '182', '172'])
+
+    def test_prefixes_and_engines(self):
+        """Test every term matches as a word prefix, including engine designations"""
+        self.assertEqual(self.search('cess 17'), ['172'])
+        self.assertEqual(self.search('O-320'), ['172'])
+        self.assertEqual(self.search('lycoming cessna'), ['172'])
+        self.assertEqual(self.search('cherokee'), ['Cherokee 140'])
+
+    def test_substring_fallback(self):
+        """Test fragments from inside a word still match through LIKE"""
+        self.assertEqual(self.search('essna'), ['172', '182'])
+        self.assertEqual(self.search('Mooney'), [])
+
+    def test_index_follows_writes(self):
+        """Test saves, renames, engine changes and deletes update the index"""
+        self.c182.model = '182T'
+        self.c182.save()
+        self.assertEqual(self.search('182t'), ['182T'])
+
+        self.piper.name = 'Piper Aircraft'
+        self.piper.save()
+        self.assertEqual(self.search('piper aircraft'), ['Cherokee 140'])
+
+        self.c182.engines.add(self.lycoming)
+        self.assertEqual(self.search('lycoming'), ['172', '182T'])
+        self.lycoming.aircraft.clear()
+        self.assertEqual(self.search('lycoming'), [])
+
+        self.c172.engines.add(self.lycoming)
+        self.lycoming.delete()
+        self.assertEqual(search.search('lycoming'), [])
+
+        self.c172.delete()
+        self.assertEqual(sorted(search.search('cessna')), [self.c182.pk, self.cherokee.pk])
+
+    def test_ranked_results_paginate(self):
+        """Test keyset pagination walks search results in rank order"""
+        response = self.client.get(reverse('aircraft-list'), {'search': 'cessna', 'page_size': 2})
+        data = response.json()
+        self.assertEqual([aircraft['model'] for aircraft in data['results']], self.search('cessna')[:2])
+        response = self.client.get(data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([aircraft['model'] for aircraft in response.json()['results']], ['Cherokee 140'])
+
+    def test_rebuild_command(self):
+        """Test rebuild_search_index repopulates an emptied index"""
+        with search.connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {search.TABLE}')
+        self.assertEqual(search.search('cessna'), [])
+        output = StringIO()
+        call_command('rebuild_search_index', stdout=output)
+        self.assertIn('3 aircraft', output.getvalue())
+        self.assertEqual(len(search.search('cessna')), 3)
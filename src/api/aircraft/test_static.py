@@ -0,0 +1,58 @@
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.test import Client, SimpleTestCase, override_settings
+from django.urls import Resolver404, resolve
+from django.views.static import serve
+
+
+class StaticServingTest(SimpleTestCase):
+    """WhiteNoise serves the SPA build with cache headers and precompressed files"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        (root / 'assets' / 'images').mkdir(parents=True)
+        (root / 'index.html').write_text('<div id="app"></div>')
+        script = b'console.log("mosaic");' * 100
+        (root / 'assets' / 'index-Bx7_q2Lc.js').write_bytes(script)
+        (root / 'assets' / 'index-Bx7_q2Lc.js.gz').write_bytes(gzip.compress(script))
+        (root / 'assets' / 'images' / 'logo-a1B2c3D4.svg').write_text('<svg></svg>')
+        (root / 'robots.txt').write_text('User-agent: *')
+
+        settings_override = override_settings(WHITENOISE_ROOT=root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # Middleware reads its settings when the client's handler is built
+        self.client = Client()
+
+    def test_hashed_assets_are_immutable(self):
+        """Test Vite's hashed assets are cached for a year and unhashed files briefly"""
+        for url in ['/assets/index-Bx7_q2Lc.js', '/assets/images/logo-a1B2c3D4.svg']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertIn('immutable', response['Cache-Control'])
+        for url in ['/robots.txt', '/index.html']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertNotIn('immutable', response['Cache-Control'])
+
+    def test_precompressed_sibling(self):
+        """Test the .gz sibling is sent to clients that accept gzip"""
+        response = self.client.get('/assets/index-Bx7_q2Lc.js', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b'console.log("mosaic");' * 100)
+
+        plain = self.client.get('/assets/index-Bx7_q2Lc.js')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+
+    def test_missing_assets_are_not_found(self):
+        """Test the SPA fallback answers client routes but not missing asset or static files"""
+        self.assertEqual(resolve('/aircraft/42').func, serve)
+        for url in ['/assets/index-missing.js', '/static/admin/css/missing.css']:
+            with self.assertRaises(Resolver404):
+                resolve(url)
+            self.assertEqual(self.client.get(url).status_code, 404, url)
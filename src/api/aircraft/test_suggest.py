@@ -0,0 +1,92 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from decimal import Decimal
+from . import suggest
+from .cache import _replace_data_version
+from .models import Manufacturer, Aircraft
+
+
+class AircraftSuggestTest(APITestCase):
+    """Test cases for the type-ahead suggest endpoint"""
+
+    def setUp(self):
+        suggest.clear()
+        self.cessna = Manufacturer.objects.create(name='Cessna')
+        self.piper = Manufacturer.objects.create(name='Piper')
+        self.c172 = self.create_aircraft(self.cessna, '172 Skyhawk')
+        self.c150 = self.create_aircraft(self.cessna, '150')
+        self.cub = self.create_aircraft(self.piper, 'PA-18 Super Cub')
+        self.url = reverse('aircraft-suggest')
+
+    def tearDown(self):
+        suggest.clear()
+
+    def create_aircraft(self, manufacturer, model):
+        return Aircraft.objects.create(
+            manufacturer=manufacturer,
+            model=model,
+            clean_stall_speed=Decimal('48.0'),
+            top_speed=Decimal('120.0'),
+            maneuvering_speed=Decimal('97.0')
+        )
+
+    def labels(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [entry['label'] for entry in response.json()]
+
+    def test_label_prefixes(self):
+        """Test suggestions match the start of the label, case-insensitively"""
+        response = self.client.get(self.url, {'q': 'CESS'})
+        self.assertEqual(response.json(), [
+            {'id': self.c150.pk, 'label': 'Cessna 150'},
+            {'id': self.c172.pk, 'label': 'Cessna 172 Skyhawk'},
+        ])
+        self.assertEqual(self.labels(q='cessna  17'), ['Cessna 172 Skyhawk'])
+        self.assertEqual(self.labels(q='mooney'), [])
+        self.assertEqual(self.labels(q=''), [])
+
+    def test_later_words(self):
+        """Test model words match after label prefixes, without duplicates"""
+        self.assertEqual(self.labels(q='skyhawk'), ['Cessna 172 Skyhawk'])
+        self.assertEqual(self.labels(q='super c'), ['Piper PA-18 Super Cub'])
+        piper_cessna = self.create_aircraft(self.piper, 'Cessna Lookalike')
+        self.assertEqual(self.labels(q='cessna'), ['Cessna 150', 'Cessna 172 Skyhawk', 'Piper Cessna Lookalike'])
+        self.assertEqual(self.labels(q='cessna', limit=1), ['Cessna 150'])
+        self.assertIn(piper_cessna.pk, [entry['id'] for entry in self.client.get(self.url, {'q': 'piper'}).json()])
+
+    def test_limit_validation(self):
+        """Test limit is clamped and rejected when not a number"""
+        self.assertEqual(len(self.labels(q='c', limit=1000)), 3)
+        self.assertEqual(self.labels(q='c', limit=-1), [])
+        response = self.client.get(self.url, {'q': 'c', 'limit': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(SUGGEST_INDEX_TTL=60)
+    def test_served_from_memory(self):
+        """Test a warm index answers without any database query"""
+        self.labels(q='cess')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.labels(q='pip'), ['Piper PA-18 Super Cub'])
+
+    def test_rebuilt_after_writes(self):
+        """Test saves and deletes in this process refresh the index at once"""
+        self.labels(q='cess')
+        self.c150.model = '152'
+        self.c150.save()
+        self.assertEqual(self.labels(q='cessna 15'), ['Cessna 152'])
+        self.c150.delete()
+        self.assertEqual(self.labels(q='cessna 15'), [])
+
+    @override_settings(SUGGEST_INDEX_TTL=0)
+    def test_rebuilt_on_data_version_change(self):
+        """Test a data version bumped by another process triggers a rebuild"""
+        index = suggest.get_index()
+        self.assertIs(suggest.get_index(), index)
+        Aircraft.objects.filter(pk=self.cub.pk).update(model='J-3 Cub')
+        self.assertEqual(self.labels(q='piper'), ['Piper PA-18 Super Cub'])
+        _replace_data_version()
+        self.assertEqual(self.labels(q='piper'), ['Piper J-3 Cub'])
+        self.assertIsNot(suggest.get_index(), index)
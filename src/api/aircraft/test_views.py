@@ -318,6 +318,94 @@ class AircraftViewSetTest(APITestCase):
         data = response.json()
         self.assertEqual(len(data), 2)  # 182 and 210
     
+    def test_filter_aircraft_by_derived_fields(self):
+        """Test filtering aircraft by speed range, performance category and badge"""
+        url = reverse('aircraft-list')
+        cases = [
+            ({'speed_range': 'Touring'}, ['182', '210']),
+            ({'speed_range': 'Trainer'}, []),
+            ({'performance_category': 'Standard Performance'}, ['172']),
+            ({'badge': 'Private Pilot'}, ['182']),
+            ({'badge': 'Not MOSAIC Eligible'}, ['210']),
+            ({'badge': ['VP', 'MOSAIC Eligible']}, ['182']),
+        ]
+        for params, expected in cases:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([a['model'] for a in response.json()], expected, params)
+
+        response = self.client.get(url, {'speed_range': 'Supersonic'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_aircraft_by_ranges(self):
+        """Test min_/max_ range filters on speeds and weights are inclusive"""
+        url = reverse('aircraft-list')
+        cases = [
+            ({'max_clean_stall_speed': '59'}, ['172']),
+            ({'min_clean_stall_speed': '60', 'max_clean_stall_speed': '61'}, ['182']),
+            ({'min_top_speed': '145'}, ['182', '210']),
+            ({'min_max_takeoff_weight': 2550, 'max_max_takeoff_weight': 3100}, ['172', '182']),
+            ({'min_maneuvering_speed': '120'}, ['210']),
+        ]
+        for params, expected in cases:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([a['model'] for a in response.json()], expected, params)
+
+        response = self.client.get(url, {'min_top_speed': 'fast'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sparse_fieldsets(self):
+        """Test ?fields=, ?omit= and ?compact= shape list and detail responses"""
+        url = reverse('aircraft-list')
+        response = self.client.get(url, {'fields': 'id,model, top_speed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0], {'id': self.aircraft1.id, 'model': '172', 'top_speed': '126.0'})
+
+        data = self.client.get(url, {'omit': 'engines,verification_source'}).json()
+        self.assertNotIn('engines', data[0])
+        self.assertNotIn('verification_source', data[0])
+        self.assertIn('vne_speed', data[0])
+
+        data = self.client.get(url, {'compact': 'true'}).json()
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data[0]['manufacturer_name'], 'Cessna')
+        self.assertEqual(data[0]['eligibility_badges'], self.aircraft1.eligibility_badges)
+        for field in ['engines', 'verification_source', 'created_at', 'vne_speed']:
+            self.assertNotIn(field, data[0])
+        data = self.client.get(url, {'compact': 'true', 'omit': 'image,manufacturer'}).json()
+        self.assertNotIn('image', data[0])
+        self.assertIn('manufacturer_name', data[0])
+
+        detail_url = reverse('aircraft-detail', kwargs={'pk': self.aircraft1.id})
+        data = self.client.get(detail_url, {'fields': 'model,mosaic_analysis'}).json()
+        self.assertEqual(sorted(data), ['model', 'mosaic_analysis'])
+
+        for params in [{'fields': 'model,wingspan'}, {'compact': 'true', 'fields': 'engines'}]:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('fields', response.json())
+
+    def test_filter_aircraft_by_engine(self):
+        """Test horsepower and fuel type filters match a single engine option"""
+        url = reverse('aircraft-list')
+        rotax = Engine.objects.create(manufacturer='Rotax', model='912ULS', horsepower=100, fuel_type='MOGAS')
+        self.aircraft1.engines.add(rotax)
+        self.aircraft2.engines.add(rotax)
+
+        cases = [
+            ({'fuel_type': 'MOGAS'}, ['172', '182']),
+            ({'min_horsepower': 100}, ['172', '182']),
+            ({'min_horsepower': 150}, ['172']),
+            # 172 has a 150hp engine and a MOGAS engine, but not one that is both
+            ({'min_horsepower': 150, 'fuel_type': 'MOGAS'}, []),
+            ({'max_horsepower': 120, 'fuel_type': 'MOGAS'}, ['172', '182']),
+        ]
+        for params, expected in cases:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([a['model'] for a in response.json()], expected, params)
+
     def test_search_aircraft(self):
         """Test searching aircraft by model and manufacturer"""
         url = reverse('aircraft-list')
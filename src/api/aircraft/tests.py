@@ -237,6 +237,21 @@ class AircraftModelTest(TestCase):
         new_aircraft.save()
         self.assertTrue(new_aircraft.is_mosaic_compliant)  # Meets stall speed requirement
     
+    def test_derived_listing_fields(self):
+        """Test badges, performance category and speed range are stored on save"""
+        self.assertEqual(self.aircraft.eligibility_badges, ['Sport Pilot', 'MOSAIC Eligible'])
+        self.assertEqual(self.aircraft.performance_category, 'Standard Performance')
+        self.assertEqual(self.aircraft.speed_range, 'Sport')
+
+        self.aircraft.clean_stall_speed = Decimal('60.0')
+        self.aircraft.top_speed = Decimal('145.0')
+        self.aircraft.retractable_gear = True
+        self.aircraft.save()
+        self.aircraft.refresh_from_db()
+        self.assertEqual(self.aircraft.eligibility_badges, ['Private Pilot', 'MOSAIC Eligible', 'RG'])
+        self.assertEqual(self.aircraft.performance_category, 'Cross Country')
+        self.assertEqual(self.aircraft.speed_range, 'Touring')
+
     def test_stall_speed_validation(self):
         """Test that stall speed is validated within MOSAIC limits"""
         with self.assertRaises(ValidationError):
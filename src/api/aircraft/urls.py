@@ -1,4 +1,5 @@
-from django.urls import path, include
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, path, include
 from rest_framework.routers import DefaultRouter
 from .views import ManufacturerViewSet, AircraftViewSet
 
@@ -6,6 +7,15 @@ router = DefaultRouter()
 router.register(r'manufacturers', ManufacturerViewSet)
 router.register(r'aircraft', AircraftViewSet)
 
-urlpatterns = [
+urlpatterns: list[URLPattern | URLResolver] = [
     path('', include(router.urls)),
-]
\ No newline at end of file
+]
+
+if settings.API_ASYNC_VIEWS:
+    # Same URLs as the router's; names stay with the router's patterns
+    from . import async_views
+    urlpatterns[:0] = [
+        path('aircraft/', async_views.aircraft_list),
+        path('aircraft/compare/', async_views.aircraft_compare),
+        path('aircraft/<int:pk>/', async_views.aircraft_detail),
+    ]
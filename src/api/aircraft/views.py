@@ -1,4 +1,5 @@
 from typing import Any
+from django.conf import settings
 from rest_framework import viewsets, filters, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -6,8 +7,13 @@ from rest_framework.request import Request
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
+from . import suggest as suggestions
+from .cache import cached_response, queryset_validators
+from .fast_serializers import ValuesSerializer
+from .filters import AircraftFilter, RankedSearchFilter
 from .models import Manufacturer, Aircraft
-from .serializers import ManufacturerSerializer, AircraftSerializer, AircraftDetailSerializer
+from .pagination import AircraftPagination
+from .serializers import ManufacturerSerializer, AircraftSerializer, AircraftDetailSerializer, AircraftListSerializer
 
 
 class ReadOnlyOrAuthenticatedPermission(permissions.BasePermission):
@@ -66,7 +72,7 @@ class ManufacturerViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for manufacturers with filtering by manufacturing status
     and search by name. Write operations require authentication.
     """
-    queryset = Manufacturer.objects.all()
+    queryset = Manufacturer.objects.with_aircraft_count()
     serializer_class = ManufacturerSerializer
     permission_classes = [ReadOnlyOrAuthenticatedPermission]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -75,15 +81,42 @@ class ManufacturerViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
 
+    def get_validators(self, request):
+        """ETag / Last-Modified inputs for conditional GETs (see aircraft.cache)"""
+        try:
+            if self.action == 'aircraft':
+                queryset = Aircraft.objects.filter(manufacturer=self.kwargs['pk'])
+                fields = AircraftViewSet.timestamp_fields
+            elif self.action == 'retrieve':
+                queryset = Manufacturer.objects.filter(pk=self.kwargs['pk'])
+                fields = ['updated_at', 'aircraft__updated_at']
+            else:
+                queryset = self.filter_queryset(Manufacturer.objects.all())
+                fields = ['updated_at', 'aircraft__updated_at']
+            return queryset_validators(request, queryset, fields)
+        except (TypeError, ValueError):
+            return None
+
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @extend_schema(
         summary="Get aircraft by manufacturer",
         description="Get all aircraft manufactured by this manufacturer.",
         responses=AircraftSerializer(many=True)
     )
     @action(detail=True, methods=['get'])
+    @cached_response
     def aircraft(self, request, pk=None):
         manufacturer = self.get_object()
-        aircraft = manufacturer.aircraft.all()
+        aircraft = Aircraft.objects.for_api().filter(manufacturer=manufacturer)
+        if settings.API_FAST_SERIALIZERS:
+            return Response(ValuesSerializer(AircraftSerializer()).render(aircraft))
         serializer = AircraftSerializer(aircraft, many=True)
         return Response(serializer.data)
 
@@ -91,7 +124,33 @@ class ManufacturerViewSet(viewsets.ModelViewSet):
 @extend_schema_view(
     list=extend_schema(
         summary="List all aircraft",
-        description="Get a paginated list of all MOSAIC-compliant aircraft with comprehensive filtering and search capabilities."
+        description=(
+            "Get a list of all MOSAIC-compliant aircraft with comprehensive filtering and search capabilities. "
+            "Pass page_size (and then the returned cursor) to page through results in keyset order. "
+            "Use fields / omit to select columns, or compact=true for the slim grid representation."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='fields',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated fields to return (default: all)',
+                examples=[OpenApiExample('Grid columns', value='id,manufacturer_name,model,clean_stall_speed')]
+            ),
+            OpenApiParameter(
+                name='omit',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated fields to leave out',
+                examples=[OpenApiExample('No engines', value='engines,verification_source')]
+            ),
+            OpenApiParameter(
+                name='compact',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='Return the compact list representation (no engines, verification source or timestamps)'
+            ),
+        ]
     ),
     create=extend_schema(
         summary="Create an aircraft",
@@ -99,7 +158,13 @@ class ManufacturerViewSet(viewsets.ModelViewSet):
     ),
     retrieve=extend_schema(
         summary="Get aircraft details",
-        description="Get detailed information about a specific aircraft including manufacturer details."
+        description="Get detailed information about a specific aircraft including manufacturer details.",
+        parameters=[
+            OpenApiParameter(name='fields', type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+                             description='Comma-separated fields to return (default: all)'),
+            OpenApiParameter(name='omit', type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+                             description='Comma-separated fields to leave out'),
+        ]
     ),
     update=extend_schema(
         summary="Update aircraft",
@@ -119,24 +184,19 @@ class AircraftViewSet(viewsets.ModelViewSet):
     ViewSet for managing aircraft specifications.
 
     Provides CRUD operations for aircraft with filtering by manufacturer, MOSAIC compliance,
-    and manufacturing status. Supports search by aircraft model and manufacturer name.
+    manufacturing status, eligibility badge, performance category and speed range.
+    Search is full-text over model, manufacturer, engines and verification source,
+    ranked by relevance.
     Also includes speed-based ordering for performance comparisons.
     Write operations require authentication.
     """
-    queryset = Aircraft.objects.select_related('manufacturer').all()
+    queryset = Aircraft.objects.for_api()
     serializer_class = AircraftSerializer
     permission_classes = [ReadOnlyOrAuthenticatedPermission]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = [
-        'manufacturer', 
-        'is_mosaic_compliant',
-        'sport_pilot_eligible',
-        'seating_capacity',
-        'retractable_gear',
-        'variable_pitch_prop',
-        'certification_date',
-        'manufacturer__is_currently_manufacturing'
-    ]
+    pagination_class = AircraftPagination
+    # Search runs last so its relevance order survives OrderingFilter's default
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, RankedSearchFilter]
+    filterset_class = AircraftFilter
     search_fields = ['model', 'manufacturer__name']
     ordering_fields = [
         'model', 
@@ -146,15 +206,108 @@ class AircraftViewSet(viewsets.ModelViewSet):
         'max_takeoff_weight',
         'seating_capacity',
         'certification_date',
-        'manufacturer__name'
+        'manufacturer__name',
+        'performance_category',
+        'speed_range'
     ]
     ordering = ['manufacturer__name', 'model']
+    # Timestamps that feed Last-Modified for AircraftSerializer payloads
+    timestamp_fields = ['updated_at', 'manufacturer__updated_at', 'engines__updated_at']
+    # AircraftDetailSerializer also nests the manufacturer's aircraft_count
+    detail_timestamp_fields = timestamp_fields + ['manufacturer__aircraft__updated_at']
+
+    def get_validators(self, request):
+        """ETag / Last-Modified inputs for conditional GETs (see aircraft.cache)"""
+        try:
+            return queryset_validators(request, *self.get_validator_queryset(request))
+        except (TypeError, ValueError):
+            return None
+
+    def get_validator_queryset(self, request):
+        """(queryset, timestamp fields) the validators are computed over; may raise TypeError/ValueError"""
+        if self.action == 'compare':
+            ids = [int(id.strip()) for id in request.query_params.get('ids', '').split(',')]
+            return Aircraft.objects.filter(id__in=ids), self.detail_timestamp_fields
+        if self.action == 'retrieve':
+            return Aircraft.objects.filter(pk=self.kwargs['pk']), self.detail_timestamp_fields
+        return self.filter_queryset(Aircraft.objects.all()), self.timestamp_fields
+
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.is_compact() or self.get_field_selection():
+            queryset = self.load_rendered_columns(queryset, self.get_serializer())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        if settings.API_FAST_SERIALIZERS:
+            # Pages are bounded by page_size; full lists are what's worth the fast path
+            return Response(ValuesSerializer(self.get_serializer()).render(queryset))
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def get_queryset(self):
+        if self.action == 'retrieve':
+            return Aircraft.objects.for_detail_api()
+        return super().get_queryset()
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return AircraftDetailSerializer
+        if self.action == 'list' and self.is_compact():
+            return AircraftListSerializer
         return AircraftSerializer
 
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(self.get_field_selection())
+        return super().get_serializer(*args, **kwargs)
+
+    def is_compact(self):
+        return self.request.query_params.get('compact', '').lower() in ('true', '1')
+
+    def get_field_selection(self):
+        """?fields= / ?omit= as SparseFieldsMixin keyword arguments (read endpoints only)"""
+        if self.action not in ('list', 'retrieve') or self.request.method != 'GET':
+            return {}
+        selection = {}
+        for param in ('fields', 'omit'):
+            names = [name.strip() for name in self.request.query_params.get(param, '').split(',') if name.strip()]
+            if names:
+                selection[param] = names
+        return selection
+
+    def load_rendered_columns(self, queryset, serializer):
+        """
+        Narrow the list queryset to the columns `serializer` renders.
+
+        Ordering columns stay loaded for keyset pagination, and the engines
+        prefetch is dropped unless engines are rendered.
+        """
+        columns = set()
+        engines = False
+        for field in serializer.fields.values():
+            if field.source_attrs[0] == 'engines':
+                engines = True
+            elif field.source != '*':
+                columns.add('__'.join(field.source_attrs))
+        for name in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(name, str) and name.lstrip('-') not in queryset.query.annotations:
+                columns.add(name.lstrip('-'))
+        columns.discard('pk')
+        if not engines:
+            queryset = queryset.prefetch_related(None)
+        if any(column.startswith('manufacturer__') for column in columns):
+            columns.add('manufacturer')
+        else:
+            queryset = queryset.select_related(None)
+        return queryset.only(*columns)
+
     @extend_schema(
         summary="Compare multiple aircraft",
         description="Compare specifications of multiple aircraft side by side.",
@@ -181,6 +334,7 @@ class AircraftViewSet(viewsets.ModelViewSet):
         responses=AircraftDetailSerializer(many=True)
     )
     @action(detail=False, methods=['get'])
+    @cached_response
     def compare(self, request):
         aircraft_ids = request.query_params.get('ids', '').split(',')
         if not aircraft_ids or aircraft_ids == ['']:
@@ -188,8 +342,56 @@ class AircraftViewSet(viewsets.ModelViewSet):
         
         try:
             aircraft_ids = [int(id.strip()) for id in aircraft_ids]
-            aircraft = Aircraft.objects.select_related('manufacturer').filter(id__in=aircraft_ids)
+            aircraft = Aircraft.objects.for_detail_api().filter(id__in=aircraft_ids)
+            if settings.API_FAST_SERIALIZERS:
+                # The nested manufacturer's aircraft_count comes from the annotation
+                fast = ValuesSerializer(
+                    AircraftDetailSerializer(),
+                    {'manufacturer': Manufacturer.objects.with_aircraft_count()}
+                )
+                return Response(fast.render(aircraft))
             serializer = AircraftDetailSerializer(aircraft, many=True)
             return Response(serializer.data)
         except ValueError:
             return Response({'error': 'Invalid aircraft ID format'}, status=400)
+
+    @extend_schema(
+        summary="Suggest aircraft",
+        description=(
+            "Type-ahead suggestions: aircraft whose \"manufacturer model\" label, or a later word of it, "
+            "starts with q. Answered from an in-memory index without querying the database."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='q',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Prefix typed so far (case-insensitive)',
+                examples=[
+                    OpenApiExample('Manufacturer prefix', value='cess'),
+                    OpenApiExample('Model prefix', value='172'),
+                ]
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=f'Maximum number of suggestions (default {suggestions.DEFAULT_LIMIT}, max {suggestions.MAX_LIMIT})'
+            ),
+        ],
+        responses={200: {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {'id': {'type': 'integer'}, 'label': {'type': 'string'}},
+            },
+        }}
+    )
+    @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        try:
+            limit = int(request.query_params.get('limit', suggestions.DEFAULT_LIMIT))
+        except ValueError:
+            return Response({'error': 'Invalid limit'}, status=400)
+        limit = max(0, min(limit, suggestions.MAX_LIMIT))
+        return Response(suggestions.get_index().suggest(request.query_params.get('q', ''), limit))
@@ -0,0 +1,51 @@
+"""
+Async versions of the feature flag endpoints (API_ASYNC_VIEWS).
+
+Flags are read on every page load, so under ASGI they are answered on the
+event loop from the worker's flag snapshot (reloaded through the async ORM
+when it is stale). Validators and rendering match the sync views in
+views.py, which still handle anything unusual: unknown flags, other
+methods and non-JSON content negotiation.
+"""
+from calendar import timegm
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from mosaicplane.async_views import bind, fallback, json_media_type, render
+from . import views
+from .snapshot import aget_snapshot
+
+
+async def serve(view_func, request, snapshot, data, **kwargs):
+    view = bind(view_func, request, **kwargs)
+    if data is None or request.method not in ('GET', 'HEAD') or json_media_type(view) is None:
+        return await fallback(view_func)(request, **kwargs)
+
+    # As the sync views' @condition computes them
+    etag = quote_etag(snapshot.etag(request))
+    last_modified = timegm(snapshot.last_modified.utctimetuple()) if snapshot.last_modified else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    headers = {'ETag': etag}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified)
+    return render(view, data, headers)
+
+
+async def feature_flags_list(request):
+    snapshot = await aget_snapshot()
+    return await serve(views.feature_flags_list, request, snapshot, snapshot.enabled)
+
+
+async def feature_flags_detailed(request):
+    snapshot = await aget_snapshot()
+    return await serve(views.feature_flags_detailed, request, snapshot, snapshot.detailed)
+
+
+async def feature_flag_detail(request, feature_key):
+    snapshot = await aget_snapshot()
+    flag = snapshot.by_key.get(feature_key)
+    return await serve(views.feature_flag_detail, request, snapshot, flag, feature_key=feature_key)
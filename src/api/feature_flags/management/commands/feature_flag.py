@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from feature_flags.models import FeatureFlag, FeatureFlagHistory
 from django.db import transaction
@@ -33,7 +34,7 @@ class Command(BaseCommand):
         )
 
         # Enable command
-        enable_parser = subparsers.add_parser('enable', help='Enable feature flag(s) - changes are immediate')
+        enable_parser = subparsers.add_parser('enable', help='Enable feature flag(s) - live within seconds')
         enable_parser.add_argument('flag_keys', nargs='+', help='Feature flag key(s) to enable')
         enable_parser.add_argument(
             '--reason',
@@ -42,7 +43,7 @@ class Command(BaseCommand):
         )
 
         # Disable command
-        disable_parser = subparsers.add_parser('disable', help='Disable feature flag(s) - changes are immediate')
+        disable_parser = subparsers.add_parser('disable', help='Disable feature flag(s) - live within seconds')
         disable_parser.add_argument('flag_keys', nargs='+', help='Feature flag key(s) to disable')
         disable_parser.add_argument(
             '--reason',
@@ -51,7 +52,7 @@ class Command(BaseCommand):
         )
 
         # Toggle command
-        toggle_parser = subparsers.add_parser('toggle', help='Toggle feature flag(s) - changes are immediate')
+        toggle_parser = subparsers.add_parser('toggle', help='Toggle feature flag(s) - live within seconds')
         toggle_parser.add_argument('flag_keys', nargs='+', help='Feature flag key(s) to toggle')
         toggle_parser.add_argument(
             '--reason',
@@ -74,7 +75,7 @@ class Command(BaseCommand):
         )
 
         # Delete command
-        delete_parser = subparsers.add_parser('delete', help='Delete feature flag(s) - changes are immediate')
+        delete_parser = subparsers.add_parser('delete', help='Delete feature flag(s) - live within seconds')
         delete_parser.add_argument('flag_keys', nargs='+', help='Feature flag key(s) to delete')
         delete_parser.add_argument(
             '--confirm',
@@ -212,6 +213,14 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(f'\nToggled {changed_count} feature flag(s)')
         )
+        self._report_propagation(changed_count)
+
+    def _report_propagation(self, changed_count):
+        """Saving a flag invalidates the API workers' flag snapshots; tell the user how long that takes"""
+        if changed_count:
+            self.stdout.write(
+                f'Running API workers will serve the change within {settings.FEATURE_FLAG_SNAPSHOT_TTL:g}s'
+            )
 
     def _modify_flags(self, flag_keys, enabled, reason):
         """Helper method to enable/disable flags"""
@@ -255,6 +264,7 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(f'\n{action.capitalize()} {changed_count} feature flag(s)')
         )
+        self._report_propagation(changed_count)
 
     def create_flag(self, options):
         """Create a new feature flag"""
@@ -323,4 +333,5 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(f'\nDeleted {deleted_count} feature flag(s)')
         )
+        self._report_propagation(deleted_count)
 
@@ -1,5 +1,6 @@
 from django.db import models
 from django.core.exceptions import ValidationError
+from . import snapshot
 
 
 class FeatureFlag(models.Model):
@@ -65,6 +66,9 @@ class FeatureFlag(models.Model):
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
+        # Admin edits, admin bulk actions and the feature_flag CLI all save
+        # through here, so they all reach the API workers' flag snapshots
+        snapshot.invalidate()
 
 
 class FeatureFlagHistory(models.Model):
@@ -1 +1,11 @@
-# No cache clearing needed since API serves fresh data directly from database
\ No newline at end of file
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from . import snapshot
+from .models import FeatureFlag
+
+
+@receiver(post_delete, sender=FeatureFlag)
+def invalidate_on_delete(sender, **kwargs):
+    """Deleted flags must disappear from every worker's snapshot"""
+    snapshot.invalidate()
@@ -0,0 +1,125 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Shared counter bumped whenever a flag changes. Each worker keeps its own
+# snapshot of the flag table and only compares this version (one cache read)
+# once its snapshot is older than FEATURE_FLAG_SNAPSHOT_TTL.
+FLAGS_VERSION_KEY = 'feature_flags:version'
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+class FlagSnapshot:
+    """Immutable, pre-serialized view of every feature flag"""
+
+    def __init__(self, version, flags):
+        from .serializers import FeatureFlagListSerializer, FeatureFlagSerializer
+
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.enabled = dict(FeatureFlagListSerializer(flags).data)
+        self.detailed = [dict(flag) for flag in FeatureFlagSerializer(flags, many=True).data]
+        self.by_key = {flag['feature_key']: flag for flag in self.detailed}
+        self.last_modified = max((flag.updated_at for flag in flags), default=None)
+
+    def is_fresh(self):
+        return time.monotonic() - self.loaded_at < settings.FEATURE_FLAG_SNAPSHOT_TTL
+
+    def etag(self, request):
+        raw = f'{request.path}:{self.version}'
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def get_flags_version():
+    version = cache.get(FLAGS_VERSION_KEY)
+    if version is None:
+        cache.add(FLAGS_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(FLAGS_VERSION_KEY)
+    return version
+
+
+async def aget_flags_version():
+    version = await cache.aget(FLAGS_VERSION_KEY)
+    if version is None:
+        await cache.aadd(FLAGS_VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(FLAGS_VERSION_KEY)
+    return version
+
+
+def _increment_flags_version():
+    try:
+        cache.incr(FLAGS_VERSION_KEY)
+    except ValueError:
+        cache.set(FLAGS_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_snapshot():
+    """Return this process's flag snapshot, reloading it if another process changed a flag"""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.is_fresh():
+        return snapshot
+
+    with _lock:
+        snapshot = _snapshot
+        if snapshot is not None and snapshot.is_fresh():
+            return snapshot
+        version = get_flags_version()
+        if snapshot is not None and snapshot.version == version:
+            snapshot.loaded_at = time.monotonic()
+            return snapshot
+
+        from .models import FeatureFlag
+        _snapshot = FlagSnapshot(version, list(FeatureFlag.objects.all()))
+        return _snapshot
+
+
+async def aget_snapshot():
+    """
+    get_snapshot() for async views, reloading through the async ORM.
+
+    There's no lock to wait on: concurrent reloads in one process are
+    harmless, and the last one to finish wins.
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.is_fresh():
+        return snapshot
+
+    version = await aget_flags_version()
+    if snapshot is not None and snapshot.version == version:
+        snapshot.loaded_at = time.monotonic()
+        return snapshot
+
+    from .models import FeatureFlag
+    _snapshot = FlagSnapshot(version, [flag async for flag in FeatureFlag.objects.all()])
+    return _snapshot
+
+
+def clear():
+    """Drop this process's snapshot so the next read goes to the database"""
+    global _snapshot
+    _snapshot = None
+
+
+def invalidate():
+    """
+    Make every worker reload its flags.
+
+    The local snapshot is dropped at once; other processes see the bumped
+    version within FEATURE_FLAG_SNAPSHOT_TTL. The version is bumped again on
+    commit so snapshots loaded from pre-commit data are not kept.
+    """
+    clear()
+    _increment_flags_version()
+
+    def on_commit():
+        clear()
+        _increment_flags_version()
+    transaction.on_commit(on_commit)
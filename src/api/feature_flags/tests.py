@@ -1,3 +1,157 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from . import async_views, snapshot
+from .models import FeatureFlag
+
+# The flag URLs served by the async views, as under ASGI (API_ASYNC_VIEWS)
+urlpatterns = [
+    path('v1/feature-flags/', async_views.feature_flags_list),
+    path('v1/feature-flags/detailed/', async_views.feature_flags_detailed),
+    path('v1/feature-flags/<str:feature_key>/', async_views.feature_flag_detail),
+    path('', include('mosaicplane.urls')),
+]
+
+
+class FeatureFlagConditionalGetTest(APITestCase):
+    """Test cases for ETag / Last-Modified support on feature flag endpoints"""
+
+    def setUp(self):
+        snapshot.clear()
+        self.flag = FeatureFlag.objects.create(feature_key='ads_enabled', enabled=False)
+
+    def test_flag_endpoints_answer_if_none_match(self):
+        """Test each flag endpoint returns 304 for its current ETag"""
+        urls = [
+            reverse('feature_flags:feature_flags_list'),
+            reverse('feature_flags:feature_flags_detailed'),
+            reverse('feature_flags:feature_flag_detail', kwargs={'feature_key': 'ads_enabled'}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn('Last-Modified', response)
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_flag_change_invalidates_etag(self):
+        """Test toggling a flag produces a fresh 200"""
+        url = reverse('feature_flags:feature_flags_list')
+        etag = self.client.get(url)['ETag']
+        self.flag.enabled = True
+        self.flag.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'ads_enabled': True})
+
+
+class FeatureFlagSnapshotTest(APITestCase):
+    """Test cases for the in-process feature flag snapshot"""
+
+    def setUp(self):
+        snapshot.clear()
+        self.flag = FeatureFlag.objects.create(feature_key='ads_enabled', enabled=False)
+        FeatureFlag.objects.create(feature_key='beta_features', enabled=True, description='Beta')
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_reads_are_served_without_queries(self):
+        """Test a warm snapshot answers every flag endpoint without touching the database"""
+        url = reverse('feature_flags:feature_flags_list')
+        self.get(url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(url), {'ads_enabled': False, 'beta_features': True})
+            self.assertEqual(len(self.get(reverse('feature_flags:feature_flags_detailed'))), 2)
+            detail = self.get(reverse('feature_flags:feature_flag_detail', kwargs={'feature_key': 'beta_features'}))
+            self.assertEqual(detail['description'], 'Beta')
+
+    def test_unknown_flag(self):
+        """Test a missing key is still a 404"""
+        response = self.client.get(reverse('feature_flags:feature_flag_detail', kwargs={'feature_key': 'nope'}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_writes_outside_this_process_wait_for_ttl(self):
+        """Test a change made elsewhere is picked up once the snapshot expires"""
+        url = reverse('feature_flags:feature_flags_list')
+        self.get(url)
+
+        # QuerySet.update() sends no signals, like a write from another
+        # process; only the shared version bump announces it
+        FeatureFlag.objects.filter(pk=self.flag.pk).update(enabled=True)
+        snapshot._increment_flags_version()
+        self.assertFalse(self.get(url)['ads_enabled'])
+
+        with override_settings(FEATURE_FLAG_SNAPSHOT_TTL=0):
+            self.assertTrue(self.get(url)['ads_enabled'])
+
+    def test_expired_snapshot_is_reused_when_version_unchanged(self):
+        """Test an expired snapshot only costs a version check when nothing changed"""
+        url = reverse('feature_flags:feature_flags_list')
+        self.get(url)
+        with override_settings(FEATURE_FLAG_SNAPSHOT_TTL=0), CaptureQueriesContext(connection) as context:
+            self.get(url)
+        self.assertTrue(context.captured_queries)
+        for query in context.captured_queries:
+            self.assertNotIn('"feature_flags"', query['sql'])
+
+    def test_cli_and_delete_invalidate(self):
+        """Test the feature_flag command and deletions reach the snapshot"""
+        url = reverse('feature_flags:feature_flags_list')
+        self.get(url)
+
+        call_command('feature_flag', 'enable', 'ads_enabled', stdout=StringIO())
+        self.assertTrue(self.get(url)['ads_enabled'])
+
+        call_command('feature_flag', 'delete', 'beta_features', '--confirm', stdout=StringIO())
+        self.assertNotIn('beta_features', self.get(url))
+
+
+class AsyncFeatureFlagViewsTest(TestCase):
+    """The async flag views must answer exactly like the sync ones"""
+
+    def setUp(self):
+        snapshot.clear()
+        FeatureFlag.objects.create(feature_key='ads_enabled', enabled=False)
+        FeatureFlag.objects.create(feature_key='beta_features', enabled=True, description='Beta')
+
+    async def test_same_responses(self):
+        """Test bodies, validators and 304s for each endpoint, loaded cold and warm"""
+        urls = [
+            reverse('feature_flags:feature_flags_list'),
+            reverse('feature_flags:feature_flags_detailed'),
+            reverse('feature_flags:feature_flag_detail', kwargs={'feature_key': 'beta_features'}),
+            reverse('feature_flags:feature_flag_detail', kwargs={'feature_key': 'nope'}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                expected = await self.async_client.get(url)
+                snapshot.clear()
+                with override_settings(ROOT_URLCONF=__name__):
+                    for _ in range(2):
+                        response = await self.async_client.get(url)
+                        self.assertEqual(response.status_code, expected.status_code)
+                        self.assertEqual(response.content, expected.content)
+                        for header in ('Content-Type', 'ETag', 'Last-Modified', 'Allow'):
+                            self.assertEqual(response.get(header), expected.get(header), header)
+                    response = await self.async_client.get(url, headers={'if-none-match': expected['ETag']})
+                    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_reload_after_change(self):
+        """Test a flag change reaches the async views' snapshot"""
+        with override_settings(ROOT_URLCONF=__name__):
+            url = reverse('feature_flags:feature_flags_list')
+            self.assertEqual((await self.async_client.get(url)).json()['ads_enabled'], False)
+            flag = await FeatureFlag.objects.aget(feature_key='ads_enabled')
+            flag.enabled = True
+            await flag.asave()
+            self.assertEqual((await self.async_client.get(url)).json()['ads_enabled'], True)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
@@ -12,4 +13,12 @@ urlpatterns = [
 
     # Individual feature flag
     path('<str:feature_key>/', views.feature_flag_detail, name='feature_flag_detail'),
-]
\ No newline at end of file
+]
+
+if settings.API_ASYNC_VIEWS:
+    from . import async_views
+    urlpatterns = [
+        path('', async_views.feature_flags_list, name='feature_flags_list'),
+        path('detailed/', async_views.feature_flags_detailed, name='feature_flags_detailed'),
+        path('<str:feature_key>/', async_views.feature_flag_detail, name='feature_flag_detail'),
+    ]
@@ -1,20 +1,27 @@
+from django.views.decorators.http import condition
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from .models import FeatureFlag
-from .serializers import FeatureFlagSerializer, FeatureFlagListSerializer
+from .snapshot import get_snapshot
 
 
+def flags_etag(request, feature_key=None):
+    return get_snapshot().etag(request)
+
+
+def flags_last_modified(request, feature_key=None):
+    return get_snapshot().last_modified
+
+
+@condition(etag_func=flags_etag, last_modified_func=flags_last_modified)
 @api_view(['GET'])
 def feature_flags_list(request):
     """
     Get all feature flags in a simple key-value format
-    Always returns fresh data from database
+    Served from the worker's flag snapshot, refreshed within seconds of a change
     """
     try:
-        flags = FeatureFlag.objects.all()
-        serializer = FeatureFlagListSerializer(flags)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_snapshot().enabled, status=status.HTTP_200_OK)
 
     except Exception as e:
         return Response(
@@ -23,16 +30,15 @@ def feature_flags_list(request):
         )
 
 
+@condition(etag_func=flags_etag, last_modified_func=flags_last_modified)
 @api_view(['GET'])
 def feature_flags_detailed(request):
     """
     Get detailed feature flags information (includes descriptions)
-    Always returns fresh data from database
+    Served from the worker's flag snapshot, refreshed within seconds of a change
     """
     try:
-        flags = FeatureFlag.objects.all()
-        serializer = FeatureFlagSerializer(flags, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_snapshot().detailed, status=status.HTTP_200_OK)
 
     except Exception as e:
         return Response(
@@ -41,22 +47,22 @@ def feature_flags_detailed(request):
         )
 
 
+@condition(etag_func=flags_etag, last_modified_func=flags_last_modified)
 @api_view(['GET'])
 def feature_flag_detail(request, feature_key):
     """
     Get a specific feature flag by key
-    Always returns fresh data from database
+    Served from the worker's flag snapshot, refreshed within seconds of a change
     """
     try:
-        flag = FeatureFlag.objects.get(feature_key=feature_key)
-        serializer = FeatureFlagSerializer(flag)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        flag = get_snapshot().by_key.get(feature_key)
+        if flag is None:
+            return Response(
+                {'error': f'Feature flag "{feature_key}" not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(flag, status=status.HTTP_200_OK)
 
-    except FeatureFlag.DoesNotExist:
-        return Response(
-            {'error': f'Feature flag "{feature_key}" not found'},
-            status=status.HTTP_404_NOT_FOUND
-        )
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch feature flag: {str(e)}'},
@@ -0,0 +1,88 @@
+"""
+gunicorn configuration for the API (used by the Procfile and startup.sh).
+
+Tunable from the environment:
+
+- GUNICORN_WORKER_CLASS: `uvicorn` (default; mosaicplane.asgi with the async
+  read views), `gthread` or `sync` (mosaicplane.wsgi)
+- WEB_CONCURRENCY: worker processes (default: cores + 1, at most 8; sync
+  workers 2 x cores + 1, since each one only ever serves one request)
+- GUNICORN_THREADS: threads per gthread worker (default 4)
+- GUNICORN_PRELOAD: load Django, the URLconf, views and serializers once in
+  the master before forking, so workers share those pages copy-on-write and
+  start warm (default True)
+- GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER: recycle each worker
+  after about this many requests (default 2000 +/- 200), bounding the
+  growth of long-lived processes
+- GUNICORN_KEEPALIVE: seconds an idle keep-alive connection stays open (default 5)
+- GUNICORN_TIMEOUT: seconds before a silent worker is restarted (default 30)
+
+`python manage.py benchmark_servers` compares the worker classes and preloading.
+"""
+import gc
+import multiprocessing
+import os
+
+# Worker class and the application it serves, per GUNICORN_WORKER_CLASS
+WORKER_CLASSES = {
+    'uvicorn': ('uvicorn_worker.UvicornWorker', 'mosaicplane.asgi:application'),
+    'gthread': ('gthread', 'mosaicplane.wsgi:application'),
+    'sync': ('sync', 'mosaicplane.wsgi:application'),
+}
+
+worker_type = os.environ.get('GUNICORN_WORKER_CLASS', 'uvicorn').lower()
+if worker_type not in WORKER_CLASSES:
+    raise RuntimeError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}, not {worker_type!r}')
+worker_class, wsgi_app = WORKER_CLASSES[worker_type]
+
+bind = f'0.0.0.0:{os.environ.get("PORT", "8000")}'
+
+cores = multiprocessing.cpu_count()
+# An event loop or a thread pool lets one worker overlap requests; a sync worker can't
+default_workers = 2 * cores + 1 if worker_type == 'sync' else min(cores + 1, 8)
+workers = int(os.environ.get('WEB_CONCURRENCY', default_workers))
+threads = int(os.environ.get('GUNICORN_THREADS', '4')) if worker_type == 'gthread' else 1
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '2000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '200'))
+
+# Longer than the 1-2s gunicorn default, so the router or proxy in front can
+# reuse connections between requests; idle ones are still dropped quickly
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = timeout
+
+
+def when_ready(server):
+    """With preload_app, import the rest of the application in the master before workers fork"""
+    if not preload_app:
+        return
+    from django.db import connections
+    from django.urls import get_resolver
+    from rest_framework.settings import api_settings
+
+    # Every urls.py, and through them the views, serializers and filters
+    get_resolver().url_patterns
+    api_settings.DEFAULT_RENDERER_CLASSES
+    # Forked workers must open their own connections
+    connections.close_all()
+    # Keep the collector from touching (and so copying) the inherited objects
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    """Build this worker's in-process caches before it accepts its first request"""
+    from django.db import connections
+    from aircraft import suggest
+    from feature_flags import snapshot
+
+    for name, load in (('feature flag snapshot', snapshot.get_snapshot), ('suggest index', suggest.get_index)):
+        try:
+            load()
+        except Exception as exc:
+            # A worker that can't warm up still serves; it loads on first use instead
+            worker.log.warning('Could not preload the %s: %s', name, exc)
+    # Requests may be served from other threads; don't hold this one's connection open
+    connections.close_all()
@@ -8,9 +8,25 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
 
 import os
+import warnings
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mosaicplane.settings')
+# Serve the hot read endpoints from async views (see settings.API_ASYNC_VIEWS)
+os.environ.setdefault('API_ASYNC_VIEWS', 'True')
+# Sync ORM calls made while serving a request run in a thread that ends with
+# the request, so a persistent connection would be left open, never reused.
+# PostgreSQL shares psycopg's connection pool between those threads instead;
+# SQLite (which has no pool) opens a connection per request.
+os.environ.setdefault('DATABASE_POOL', 'True')
+if int(os.environ.get('DATABASE_CONN_MAX_AGE', '0')) > 0:
+    warnings.warn(
+        'DATABASE_CONN_MAX_AGE is ignored under ASGI: each request would leave its '
+        'connection open in a finished thread. Connections are closed after every '
+        'request; set DATABASE_POOL=True (the default) to pool them on PostgreSQL.',
+        RuntimeWarning,
+    )
+os.environ['DATABASE_CONN_MAX_AGE'] = '0'
 
 application = get_asgi_application()
@@ -0,0 +1,62 @@
+"""
+Helpers shared by the async read views (aircraft/async_views.py,
+feature_flags/async_views.py).
+
+Those views answer the common cases themselves and hand anything else to
+the sync DRF view they stand in for. To keep their responses identical to
+the sync ones they still go through that DRF view's own content
+negotiation, serializer context and response headers, by binding an
+instance of it to the request the way APIView.dispatch() would (without
+authentication, permission or throttle checks: GET needs none of them here).
+"""
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions
+from rest_framework.response import Response
+
+
+def bind(view_func, request, **kwargs):
+    """
+    An instance of the DRF view behind `view_func` (as returned by
+    as_view() or @api_view), ready to serialize and render for `request`.
+    """
+    view = view_func.cls(**view_func.initkwargs)
+    actions = getattr(view_func, 'actions', None)
+    if actions is not None:
+        # As ViewSetMixin.as_view() binds them, which also determines the Allow header
+        if 'get' in actions and 'head' not in actions:
+            actions = {**actions, 'head': actions['get']}
+        view.action_map = actions
+        for method, action in actions.items():
+            setattr(view, method, getattr(view, action))
+    view.args = ()
+    view.kwargs = kwargs
+    view.format_kwarg = None
+    view.request = view.initialize_request(request, **kwargs)
+    view.headers = view.default_response_headers
+    return view
+
+
+def json_media_type(view):
+    """The media type DRF would render this view's response as, or None unless that's JSON"""
+    try:
+        renderer, media_type = view.perform_content_negotiation(view.request)
+    except exceptions.NotAcceptable:
+        return None
+    return media_type if renderer.format == 'json' else None
+
+
+def render(view, data, headers=None):
+    """The rendered response the sync view would have returned for `data`"""
+    response = view.finalize_response(view.request, Response(data, headers=headers))
+    return response.render()
+
+
+def render_exception(view, exc):
+    """The rendered error response the sync view would have returned for an APIException"""
+    response = view.finalize_response(view.request, view.handle_exception(exc))
+    return response.render()
+
+
+def fallback(view_func):
+    """`view_func`, callable from an async view (it runs in the request's worker thread)"""
+    return sync_to_async(view_func)
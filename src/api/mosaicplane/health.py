@@ -0,0 +1,169 @@
+"""
+Liveness and readiness probes.
+
+HealthCheckMiddleware sits first in MIDDLEWARE and answers /healthz and
+/readyz before anything else runs, so probes skip the SSL redirect, host
+validation, sessions and URL routing.
+
+- /healthz: the process is up and serving requests. Never touches the
+  database, so a database outage doesn't get healthy workers restarted.
+- /readyz: the database answers, no migrations are pending, the aircraft
+  catalogue has been seeded and the cache backend round-trips. The result
+  is kept per process for HEALTH_CHECK_CACHE_TTL seconds, so frequent
+  probes cost at most one set of checks per worker per TTL.
+"""
+import json
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.http import HttpResponse, HttpResponseNotAllowed
+
+CACHE_PROBE_KEY = 'health:probe'
+
+_lock = threading.Lock()
+_readiness = None
+
+
+def check_database():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+
+
+def check_migrations():
+    executor = MigrationExecutor(connection)
+    pending = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if pending:
+        raise RuntimeError(f'{len(pending)} unapplied migration(s)')
+
+
+def check_seed_data():
+    if not apps.get_model('aircraft', 'Aircraft').objects.exists():
+        raise RuntimeError('no aircraft loaded')
+
+
+def check_cache():
+    token = str(time.time_ns())
+    cache.set(CACHE_PROBE_KEY, token, 60)
+    if cache.get(CACHE_PROBE_KEY) != token:
+        raise RuntimeError('cache read did not return the value written')
+
+
+READINESS_CHECKS = {
+    'database': check_database,
+    'migrations': check_migrations,
+    'seed_data': check_seed_data,
+    'cache': check_cache,
+}
+
+
+class Readiness:
+    """Outcome of one run of the readiness checks, rendered once"""
+
+    def __init__(self):
+        self.checked_at = time.monotonic()
+        checks = {}
+        for name, check in READINESS_CHECKS.items():
+            try:
+                check()
+            except Exception as exc:
+                checks[name] = f'error: {exc}'
+            else:
+                checks[name] = 'ok'
+            # Nothing else can pass without the database
+            if name == 'database' and checks[name] != 'ok':
+                break
+        self.ready = len(checks) == len(READINESS_CHECKS) and all(
+            result == 'ok' for result in checks.values()
+        )
+        self.content = json.dumps({'status': 'ok' if self.ready else 'unavailable', 'checks': checks}).encode()
+
+    def is_fresh(self):
+        return time.monotonic() - self.checked_at < settings.HEALTH_CHECK_CACHE_TTL
+
+
+def get_readiness():
+    """Return this process's latest readiness result, rerunning the checks once it expires"""
+    global _readiness
+    readiness = _readiness
+    if readiness is not None and readiness.is_fresh():
+        return readiness
+
+    with _lock:
+        readiness = _readiness
+        if readiness is None or not readiness.is_fresh():
+            readiness = _readiness = Readiness()
+    return readiness
+
+
+async def aget_readiness():
+    """get_readiness() for the async middleware; the checks themselves run in a thread"""
+    readiness = _readiness
+    if readiness is not None and readiness.is_fresh():
+        return readiness
+    return await sync_to_async(get_readiness)()
+
+
+def clear():
+    """Forget the cached readiness result"""
+    global _readiness
+    _readiness = None
+
+
+LIVENESS_CONTENT = json.dumps({'status': 'ok'}).encode()
+
+
+def probe_response(content, status=200):
+    response = HttpResponse(content, content_type='application/json', status=status)
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+class HealthCheckMiddleware:
+    """Answer /healthz and /readyz without running the rest of the stack"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        path = probe_path(request)
+        if path is None:
+            return self.get_response(request)
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        if path == '/healthz':
+            return probe_response(LIVENESS_CONTENT)
+        return readiness_response(get_readiness())
+
+    async def __acall__(self, request):
+        path = probe_path(request)
+        if path is None:
+            return await self.get_response(request)
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        if path == '/healthz':
+            return probe_response(LIVENESS_CONTENT)
+        return readiness_response(await aget_readiness())
+
+
+def probe_path(request):
+    path = request.path_info.rstrip('/')
+    return path if path in ('/healthz', '/readyz') else None
+
+
+def readiness_response(readiness):
+    return probe_response(readiness.content, status=200 if readiness.ready else 503)
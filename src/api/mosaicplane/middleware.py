@@ -0,0 +1,121 @@
+"""
+Negotiated compression for API responses.
+
+gunicorn serves the API directly, so nothing in front of Django compresses
+JSON when the edge cache misses. CompressionMiddleware picks brotli (when
+the package is installed) or gzip from Accept-Encoding and compresses JSON
+bodies of at least API_COMPRESSION_MIN_SIZE bytes.
+
+Responses served through aircraft.cache.cached_response are marked with
+`precompress`; their compressed variants are stored in the cache under a
+digest of the uncompressed body. Those bodies only change with the data
+version, so each variant is compressed once per data version (at a higher
+level, since the cost is paid once) and served from the cache afterwards.
+
+Unlike Django's GZipMiddleware no random padding is added against BREACH:
+the API's JSON carries no secrets, and identical bodies must compress to
+identical bytes to be worth caching.
+"""
+import gzip
+import hashlib
+import importlib
+from types import ModuleType
+from typing import Optional
+
+# Imported by name: brotli ships no type information for mypy to find
+brotli: Optional[ModuleType]
+try:
+    brotli = importlib.import_module('brotli')
+except ImportError:  # pragma: no cover - optional, see requirements.txt
+    brotli = None
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+# (on-the-fly level, precompressed level) per encoding
+GZIP_LEVELS = (6, 9)
+BROTLI_QUALITIES = (5, 11)
+
+
+def available_encodings():
+    """Supported content codings, most preferred first"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Return the best coding the client accepts, or None.
+
+    Honours q-values (including q=0 and `*`); on equal weights brotli is
+    preferred over gzip.
+    """
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    default = weights.get('*', 0.0)
+    candidates = [coding for coding in available_encodings() if weights.get(coding, default) > 0]
+    return max(candidates, key=lambda coding: weights.get(coding, default), default=None)
+
+
+def compress(content, encoding, precompress=False):
+    if encoding == 'br':
+        return brotli.compress(content, quality=BROTLI_QUALITIES[precompress])
+    return gzip.compress(content, compresslevel=GZIP_LEVELS[precompress], mtime=0)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Compress JSON responses with the best encoding the client accepts"""
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip()
+        if not content_type.endswith('json'):
+            return response
+
+        # Compressible whether or not this client accepts it
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < settings.API_COMPRESSION_MIN_SIZE:
+            return response
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if getattr(response, 'precompress', False):
+            compressed = self.cached_variant(response.content, encoding)
+        else:
+            compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The bytes differ per encoding, so a strong validator would be wrong
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        return response
+
+    def cached_variant(self, content, encoding):
+        key = f'api-compressed:{encoding}:{hashlib.sha256(content).hexdigest()}'
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(content, encoding, precompress=True)
+            cache.set(key, compressed, settings.API_RESPONSE_CACHE_TIMEOUT)
+        return compressed
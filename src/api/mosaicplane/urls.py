@@ -21,7 +21,6 @@ from django.conf.urls.static import static
 from django.views.generic import TemplateView
 from django.views.static import serve
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
-import os
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -39,15 +38,11 @@ urlpatterns = [
     path('', TemplateView.as_view(template_name='api_landing.html'), name='api-landing'),
 ]
 
-# Serve static files and Vue.js SPA
-static_dir = os.path.join(settings.BASE_DIR.parent, 'static')
-
+# Static files and the SPA's assets/ are served by WhiteNoiseMiddleware (see settings.py)
 urlpatterns += [
-    # Serve static files (CSS, JS, images)
-    re_path(r'^assets/(?P<path>.*)$', serve, {'document_root': os.path.join(static_dir, 'assets')}),
-    re_path(r'^static/(?P<path>.*)$', serve, {'document_root': settings.STATIC_ROOT}),
-    # Serve Vue.js SPA for all other routes (client-side routing)
-    re_path(r'^.*$', serve, {'document_root': static_dir, 'path': 'index.html'}),
+    # Serve Vue.js SPA for all other routes (client-side routing). Missing
+    # files under assets/ and static/ are 404s, not the app shell.
+    re_path(r'^(?!assets/|static/).*$', serve, {'document_root': settings.SPA_ROOT, 'path': 'index.html'}),
 ]
 
 # Serve media files during development
@@ -4,8 +4,19 @@ set -e
 echo "Running database migrations..."
 python manage.py migrate
 
+echo "Creating cache table..."
+python manage.py createcachetable
+
+echo "Refreshing derived aircraft fields..."
+python manage.py refresh_derived_fields
+
 echo "Initializing feature flags with default values..."
 python manage.py initialize_feature_flags --reset
 
+if [ -d ../static ]; then
+    echo "Precompressing SPA assets..."
+    python -m whitenoise.compress -q ../static
+fi
+
 echo "Starting application..."
-exec gunicorn mosaicplane.wsgi:application --bind 0.0.0.0:${PORT:-8000}
\ No newline at end of file
+exec gunicorn --config gunicorn.conf.py
\ No newline at end of file